@@ -1,7 +1,9 @@
-from flask import Flask, request, jsonify, session
+from flask import Flask, Response, request, jsonify, session, stream_with_context
 from flask_cors import CORS
 import os
+import io
 import json
+import base64
 import uuid
 import hashlib
 import subprocess
@@ -11,7 +13,24 @@ import sys
 from datetime import datetime
 from pathlib import Path
 import shutil
-from database import db
+import sqlite3
+from database import FILE_COMPUTED_FIELDS, FILE_META_FIELDS, db
+from interpreter_pool import create_pool
+from output_capture import HeadTailBuffer, feed_stdin, iter_process_output, truncation_notice
+from artifacts import ArtifactDecoder
+from vendor_assets import CACHE_CONTROL, get_asset
+from job_queue import ExecutionJobQueue
+from batch import BatchError, parse_batch, run_batch
+from scheduler import FairShareScheduler, SchedulerBusy
+from result_cache import ResultCache
+from process_group import ProcessReaper
+from preview_cache import (
+    PREVIEW_CACHE_CONTROL, PREVIEW_CONTENT_SECURITY_POLICY, PreviewCache
+)
+from launcher import BOOTSTRAP, encode_code
+from resource_usage import (
+    AccountedPopen, ResourceAccounting, close_report, collect_resources, create_report_pipe
+)
 
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-change-this'  # Production'da değiştirin
@@ -30,6 +49,12 @@ TEMP_DIR.mkdir(parents=True, exist_ok=True)
 
 USERS_FILE = USERS_DIR / 'users.json'
 
+# GET /api/files sayfalama (limit veya cursor verilince)
+FILES_PAGE_DEFAULT_LIMIT = int(os.environ.get('FILES_PAGE_DEFAULT_LIMIT', '100'))
+FILES_PAGE_MAX_LIMIT = int(os.environ.get('FILES_PAGE_MAX_LIMIT', '500'))
+SEARCH_DEFAULT_LIMIT = int(os.environ.get('SEARCH_DEFAULT_LIMIT', '20'))
+SEARCH_MAX_RESULTS = int(os.environ.get('SEARCH_MAX_RESULTS', '100'))
+
 # SQLite kullanıldığı için bu fonksiyonlar artık gerekli değil
 # load_users ve save_users DatabaseManager'da
 
@@ -43,6 +68,76 @@ def get_user_files_dir(user_id):
     user_dir.mkdir(exist_ok=True)
     return user_dir
 
+def remove_disk_path(path):
+    """Diskteki dosyayı veya klasör ağacını sil (yoksa sessizce geç)"""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+def is_valid_name(name):
+    """Dosya adı yol ayırıcı içeremez (path, ad/ad/... biçiminde ağaç indeksidir)"""
+    return (isinstance(name, str) and '/' not in name and '\\' not in name
+            and name.strip() not in ('', '.', '..'))
+
+def encode_cursor(key):
+    """Sayfa anahtarını ([created_at, id]) opak bir cursor metnine çevir"""
+    return base64.urlsafe_b64encode(json.dumps(key).encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor):
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except ValueError:
+        key = None
+    if not (isinstance(key, list) and len(key) == 2 and all(isinstance(v, str) for v in key)):
+        raise ValueError('Geçersiz cursor')
+    return key
+
+def parse_file_list_args(args):
+    """GET /api/files sorgu parametreleri; geçersizse kullanıcıya gösterilecek mesajla ValueError"""
+    fields = None
+    if args.get('fields'):
+        fields = list(dict.fromkeys(name.strip() for name in args['fields'].split(',') if name.strip()))
+        unknown = [name for name in fields if name not in FILE_META_FIELDS and name not in FILE_COMPUTED_FIELDS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen alan: {', '.join(unknown)}")
+
+    limit = after = None
+    if 'limit' in args or 'cursor' in args:
+        try:
+            limit = int(args.get('limit', FILES_PAGE_DEFAULT_LIMIT))
+        except ValueError:
+            raise ValueError('limit bir sayı olmalı')
+        if limit < 1:
+            raise ValueError('limit pozitif olmalı')
+        limit = min(limit, FILES_PAGE_MAX_LIMIT)
+        if args.get('cursor'):
+            after = decode_cursor(args['cursor'])
+
+    return {'limit': limit, 'after': after, 'fields': fields, 'file_type': args.get('type') or None}
+
+def child_path(parent, name):
+    """Üst klasörün altındaki adın tam yolu (üst yoksa kök)"""
+    return f"{parent['path']}/{name}" if parent else name
+
+def relocate_file(user_id, file_info, parent, new_name):
+    """Dosyayı veritabanında taşı/yeniden adlandır, diskte kalmış eski kopyasını da taşı; yeni path'i döndür
+
+    Yol çakışmasında veritabanı (tekil indeks) IntegrityError verir ve disk değişmez.
+    """
+    new_db_path = db.move_file(file_info['id'], parent['id'] if parent else None, new_name)
+
+    user_files_dir = get_user_files_dir(user_id)
+    old_path = user_files_dir / file_info['path']
+    new_path = user_files_dir / new_db_path
+    if old_path.exists() and not new_path.exists():
+        try:
+            new_path.parent.mkdir(parents=True, exist_ok=True)
+            old_path.rename(new_path)
+        except OSError as e:
+            print(f"⚠️ Disk kopyası taşınamadı: {e}")
+    return new_db_path
+
 # SQLite kullanıldığı için dosya index'i artık gerekli değil
 # Tüm dosya işlemleri DatabaseManager'da
 
@@ -231,409 +326,248 @@ ALLOWED_IMPORTS = {
     'scipy', 'scikit-learn', 'sklearn'
 }
 
-def execute_python_code(code, timeout=30):
-    """Python kodunu güvenli şekilde çalıştır"""
-    try:
-        # Geçici dosya oluştur
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as temp_file:
-            # Matplotlib ve OpenCV display ayarları
-            setup_code = '''
+# Her çalıştırmadan önce kullanıcı kodunun önüne eklenen kurulum kodu.
+# Kütüphane yamaları runtime_hooks modülünde; kütüphane import edilince uygulanır.
+BACKEND_DIR = Path(__file__).resolve().parent
+PYTHON_SETUP_CODE = f'''
 import os
 import sys
-import warnings
-warnings.filterwarnings('ignore')
-
-# Matplotlib interactive backend
-try:
-    import matplotlib
-    matplotlib.use('TkAgg')  # GUI backend for multiple windows
-    import matplotlib.pyplot as plt
-    plt.ion()  # Interactive mode on
-    
-    # Her plt.show() çağrısını override et
-    _original_show = plt.show
-    def custom_show(*args, **kwargs):
-        try:
-            # Non-blocking gösterim
-            _original_show(block=False)
-            import time
-            import threading
-            
-            # Aktif figürleri topla
-            figs = [plt.figure(i) for i in plt.get_fignums()]
-            
-            for fig in figs:
-                if hasattr(fig, 'canvas') and hasattr(fig.canvas, 'manager'):
-                    try:
-                        window = fig.canvas.manager.window
-                        if window:
-                            # Pencereyi sabitle ve focus yap
-                            window.wm_attributes('-topmost', 1)
-                            time.sleep(0.1)
-                            window.wm_attributes('-topmost', 0)
-                            window.focus_force()
-                            window.lift()
-                            
-                            print(f"[📊 Grafik penceresi açıldı ve sabitlendi - Figure {fig.number}]")
-                            print("[📊 Grafik penceresini kapatmak için X butonuna tıklayın]")
-                            
-                            # Event loop'u başlat (non-blocking)
-                            def run_event_loop():
-                                try:
-                                    while window.winfo_exists():
-                                        window.update()
-                                        time.sleep(0.01)
-                                except:
-                                    pass
-                            
-                            thread = threading.Thread(target=run_event_loop, daemon=True)
-                            thread.start()
-                            
-                    except Exception as e:
-                        print(f"[⚠️ Pencere ayarları hatası: {e}]")
-                        
-        except Exception as e:
-            print(f"[⚠️ Show override error: {e}]")
-            _original_show(*args, **kwargs)
-    plt.show = custom_show
-except Exception as e:
-    print(f"Matplotlib setup error: {e}")
-    pass
-
-# OpenCV display ayarları
-try:
-    import cv2
-    
-    # Her cv2.imshow çağrısı için ayrı pencere
-    _original_imshow = cv2.imshow
-    _window_count = 0
-    def custom_imshow(winname, mat):
-        global _window_count
-        _window_count += 1
-        unique_name = f"{winname}_{_window_count}"
-        cv2.namedWindow(unique_name, cv2.WINDOW_NORMAL)
-        result = _original_imshow(unique_name, mat)
-        print(f"[OpenCV penceresi açıldı: {unique_name}]")
-        return result
-    cv2.imshow = custom_imshow
-    
-    # waitKey override - pencereyi kalıcı aç
-    _original_waitKey = cv2.waitKey
-    def custom_waitKey(delay=0):
-        # Pencereyi sürekli açık tut
-        print("[📷 OpenCV penceresi açıldı - Kapatmak için pencerenin X butonuna tıklayın]")
-        print("[📷 Veya herhangi bir tuşa basarak devam edin]")
-        
-        # Gerçek waitKey davranışı - kullanıcı müdahalesini bekle
-        if delay == 0:
-            # Süresiz bekle - kullanıcı tuşa basana kadar
-            return _original_waitKey(0)
-        else:
-            # Belirtilen süre kadar bekle
-            return _original_waitKey(max(delay, 1000))  # Minimum 1 saniye
-    cv2.waitKey = custom_waitKey
-except:
-    pass
-
-# Turtle ekranını açık tutma
-try:
-    import turtle
-    
-    # Turtle ekranını override et
-    _original_done = turtle.done
-    def custom_done():
-        try:
-            screen = turtle.Screen()
-            window = screen.getcanvas().winfo_toplevel()
-            
-            # Pencereyi sabitle
-            window.wm_attributes('-topmost', 1)
-            window.wm_attributes('-topmost', 0)
-            window.focus_force()
-            window.lift()
-            
-            print("[🐢 Turtle ekranı açıldı ve sabitlendi]")
-            print("[🐢 Kapatmak için ekrana tıklayın veya X butonunu kullanın]")
-            
-            # Kapatma butonunu aktif et
-            def on_close():
-                try:
-                    screen.bye()
-                except:
-                    pass
-            
-            window.protocol("WM_DELETE_WINDOW", on_close)
-            
-            # Tıklama ile kapatma
-            screen.exitonclick()
-            
-        except Exception as e:
-            print(f"[🐢 Turtle setup error: {e}]")
-            _original_done()
-            
-    turtle.done = custom_done
-    
-    # Otomatik turtle.done() ekleme
-    import sys
-    original_exit = sys.exit
-    def custom_exit(*args, **kwargs):
-        try:
-            # Eğer turtle screen açıksa, bekle
-            screen = turtle.Screen()
-            print("[🐢 Program bitince Turtle ekranı açık kalacak]")
-            screen.exitonclick()
-        except:
-            pass
-        original_exit(*args, **kwargs)
-    sys.exit = custom_exit
-    
-    # Turtle'ın otomatik kapatılmasını engelle
-    def keep_turtle_open():
-        screen = turtle.Screen()
-        screen.mainloop()  # Sürekli açık tut
-    
-    # Turtle kodunun sonuna otomatik ekleme
-    original_tracer = turtle.tracer
-    def custom_tracer(*args, **kwargs):
-        result = original_tracer(*args, **kwargs)
-        # Çizim bittiğinde ekranı açık tut
-        return result
-    turtle.tracer = custom_tracer
-except:
-    pass
-
-# Pygame Zero ekran açma
-try:
-    import pgzrun
-    
-    # pgzrun.go() override'ı
-    _original_go = pgzrun.go
-    def custom_go(*args, **kwargs):
-        print("[🎮 Pygame Zero oyunu başlatılıyor...]")
-        print("[🎮 Oyun penceresini kapatmak için X butonuna tıklayın]")
-        
-        # Pencere ayarları
-        try:
-            import pygame
-            pygame.display.set_caption("Pygame Zero Oyun")
-            
-            # Normal go() fonksiyonunu çalıştır
-            result = _original_go(*args, **kwargs)
-            
-            print("[🎮 Pygame Zero oyunu başarıyla açıldı]")
-            return result
-        except Exception as e:
-            print(f"[🎮 Pygame Zero setup error: {e}]")
-            return _original_go(*args, **kwargs)
-    
-    pgzrun.go = custom_go
-except:
-    pass
-
-# Plotly tarayıcı açma
-try:
-    import plotly.graph_objects as go
-    import plotly.offline as pyo
-    
-    # plotly.show() override'ı
-    _original_show_plotly = go.Figure.show
-    def custom_show_plotly(self, *args, **kwargs):
-        print("[📊 Plotly grafiği tarayıcıda açılıyor...]")
-        print("[📊 İnteraktif grafiği tarayıcıda görüntüleyebilirsiniz]")
-        
-        try:
-            # Tarayıcıda aç
-            import webbrowser
-            import tempfile
-            import os
-            
-            # HTML dosyası oluştur
-            html_content = pyo.plot(self, output_type='div', include_plotlyjs=True)
-            
-            # Temp dizininde statik dosya oluştur
-            temp_dir = tempfile.gettempdir()
-            temp_filename = f"plotly_graph_{int(time.time())}.html"
-            temp_path = os.path.join(temp_dir, temp_filename)
-            
-            html_template = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Plotly Grafik</title>
-</head>
-<body>
-    <h1>Python Editör - Plotly Grafik</h1>
-    {html_content}
-</body>
-</html>"""
-            
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                f.write(html_template)
-            
-            # Tarayıcıda aç
-            webbrowser.open('file://' + os.path.abspath(temp_path))
-            print(f"[📊 Plotly grafiği açıldı: {temp_path}]")
-            
-        except Exception as e:
-            print(f"[❌ Plotly hatası: {e}]")
-            import traceback
-            traceback.print_exc()
-            # Fallback - normal show
-            return _original_show_plotly(self, *args, **kwargs)
-    
-    go.Figure.show = custom_show_plotly
-except:
-    pass
-
-# Bokeh tarayıcı açma
-try:
-    from bokeh.plotting import show as bokeh_show
-    from bokeh.io import output_file
-    
-    # bokeh.show() override'ı
-    _original_show_bokeh = bokeh_show
-    def custom_show_bokeh(obj, *args, **kwargs):
-        print("[📊 Bokeh dashboard tarayıcıda açılıyor...]")
-        print("[📊 İnteraktif dashboard'u tarayıcıda görüntüleyebilirsiniz]")
-        
-        try:
-            import tempfile
-            import webbrowser
-            import os
-            
-            # Geçici HTML dosyası
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-                temp_path = f.name
-            
-            # HTML çıktısı ayarla
-            output_file(temp_path, title="Python Editör - Bokeh Dashboard")
-            
-            # Normal show fonksiyonunu çalıştır
-            result = _original_show_bokeh(obj, *args, **kwargs)
-            
-            # Tarayıcıda aç
-            webbrowser.open('file://' + os.path.abspath(temp_path))
-            print(f"[📊 Bokeh dashboard açıldı: {temp_path}]")
-            
-            return result
-            
-        except Exception as e:
-            print(f"[📊 Bokeh browser error: {e}]")
-            # Fallback - normal show
-            return _original_show_bokeh(obj, *args, **kwargs)
-    
-    # Global import'u değiştir
-    import sys
-    if 'bokeh.plotting' in sys.modules:
-        sys.modules['bokeh.plotting'].show = custom_show_bokeh
-except:
-    pass
-
+sys.path.insert(0, {str(BACKEND_DIR)!r})
+import runtime_hooks
+sys.path.remove({str(BACKEND_DIR)!r})
+runtime_hooks.install()
 '''
-            temp_file.write(setup_code + code)
-            temp_file_path = temp_file.name
 
-        # Kodu çalıştır - Windows'ta encoding sorunlarını çöz
-        start_time = time.time()
-        
-        # Windows için özel encoding ayarı ve TensorFlow ayarları
-        env = os.environ.copy()
-        env['PYTHONIOENCODING'] = 'utf-8'
-        env['TF_CPP_MIN_LOG_LEVEL'] = '2'  # TensorFlow log seviyesini azalt (0=tümü, 1=info, 2=warning, 3=error)
-        env['TF_ENABLE_ONEDNN_OPTS'] = '0'  # oneDNN optimizasyonlarını kapat
-        env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'  # Pygame mesajını gizle
-        env['SDL_VIDEODRIVER'] = 'dummy'  # SDL video driver'ını dummy yap
-        
-        result = subprocess.run(
-            [sys.executable, temp_file_path],
-            capture_output=True,
+# Sıcak havuzdaki zygote'ların önceden yüklediği kütüphaneler; pgzrun import
+# edilirken __main__ modülünü hazırladığı için onun yerine pgzero.game yüklenir
+PRELOAD_MODULES = [
+    'numpy', 'pandas', 'matplotlib.pyplot', 'cv2', 'turtle',
+    'pgzero.game', 'plotly.graph_objects', 'bokeh.plotting'
+]
+
+def build_execution_env():
+    """Çalıştırılan Python süreçleri için ortam değişkenleri"""
+    # Windows için özel encoding ayarı ve TensorFlow ayarları
+    env = os.environ.copy()
+    env['PYTHONIOENCODING'] = 'utf-8'
+    env['PYTHONUNBUFFERED'] = '1'  # Çıktı akış modunda hemen görünsün
+    env['TF_CPP_MIN_LOG_LEVEL'] = '2'  # TensorFlow log seviyesini azalt (0=tümü, 1=info, 2=warning, 3=error)
+    env['TF_ENABLE_ONEDNN_OPTS'] = '0'  # oneDNN optimizasyonlarını kapat
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'  # Pygame mesajını gizle
+    env['SDL_VIDEODRIVER'] = 'dummy'  # SDL video driver'ını dummy yap
+    env['SDL_AUDIODRIVER'] = 'dummy'  # Sunucuda ses cihazı yok, mixer hata vermesin
+    return env
+
+# Önceden ısıtılmış yorumlayıcı havuzu (POSIX'te fork, diğerlerinde soğuk başlatma)
+interpreter_pool = create_pool(PYTHON_SETUP_CODE, preload=PRELOAD_MODULES, env=build_execution_env())
+
+# Kullanıcılar arası adil paylaşım: eşzamanlı çalıştırma sınırları ve sıra
+execution_scheduler = FairShareScheduler()
+
+# Asenkron çalıştırma işleri (/api/execute "async": true)
+job_queue = ExecutionJobQueue(scheduler=execution_scheduler)
+
+# Kullanıcı ve iş yükü bazında CPU/bellek/I/O toplamları
+resource_accounting = ResourceAccounting()
+
+# Aynı kodun tekrar çalıştırılmasında sonucu önbellekten ver (EXECUTION_RESULT_CACHE=1)
+result_cache = ResultCache()
+
+# HTML/CSS/JavaScript önizleme sayfaları (içerik özetiyle, süreli)
+preview_cache = PreviewCache()
+
+# Zaman aşımında süreç grubunu durdurur, çalıştırma sonrası artık süreçleri öldürür
+process_reaper = ProcessReaper()
+
+def start_cold_process(code, stdin=None):
+    """Yeni bir yorumlayıcı başlat; kod diske yazılmadan stdin pipe'ından verilir
+
+    stdin verilirse koddan sonra aynı pipe'a yazılır ve programın girdisi olur.
+    """
+    stdin_read, stdin_write = os.pipe()
+    report_read, report_write = create_report_pipe()
+    args = [sys.executable, '-c', BOOTSTRAP, str(BACKEND_DIR)]
+    child_fds = ()
+    artifact_read = None
+    if report_write is not None:
+        # Rapor ve artifact pipe'ları fd aktarımı gerektirir (POSIX)
+        artifact_read, artifact_write = os.pipe()
+        child_fds = (report_write, artifact_write)
+        args += [str(fd) for fd in child_fds]
+    try:
+        process = AccountedPopen(
+            args,
+            stdin=stdin_read,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            pass_fds=child_fds,
+            start_new_session=os.name == 'posix',  # Alt süreçleriyle birlikte durdurulabilsin
             text=True,
-            timeout=timeout,
             encoding='utf-8',
             errors='replace',  # Encoding hatalarını atla
-            env=env
+            env=build_execution_env()
         )
-        execution_time = time.time() - start_time
-
-        # Geçici dosyayı sil
-        os.unlink(temp_file_path)
+    except Exception:
+        os.close(stdin_write)
+        for fd in (report_read, artifact_read):
+            if fd is not None:
+                os.close(fd)
+        raise
+    finally:
+        os.close(stdin_read)
+        for fd in child_fds:
+            os.close(fd)
+    process.report_fd = report_read
+    process.artifacts = os.fdopen(artifact_read, 'rb') if artifact_read is not None else None
+
+    # Yorumlayıcı kodu okumadan çıkarsa hata stderr'de görünür
+    feed_stdin(stdin_write, encode_code(code) + (stdin or b''))
+    return process
+
+def start_python_process(code, stdin=None):
+    """Kodu çalıştıran süreci başlat: önce sıcak havuz, yoksa yeni yorumlayıcı
+
+    Dönen süreç Popen arayüzüne sahiptir. stdin (metin) programın girdisidir;
+    verilmezse input() EOFError alır.
+    """
+    stdin_data = stdin.encode('utf-8') if stdin is not None else None
+    process = interpreter_pool.spawn(code, stdin=stdin_data)
+    if process is not None:
+        return process
+    return start_cold_process(code, stdin_data)
+
+def stream_python_code(code, timeout=30, on_process=None, stdin=None):
+    """Python kodunu çalıştır, çıktıyı üretildikçe olay olarak ver
+
+    {'type': 'stdout' | 'stderr', 'text': ...} olayları üretir. Çıktı sınırı
+    aşılırsa akış sonunda {'type': 'truncated', 'stream', 'omitted_bytes'} ve
+    ardından akışın son kısmı gelir. Son olay {'type': 'done', 'success',
+    'exit_code', 'error', 'execution_time', 'truncated', 'output_bytes',
+    'error_bytes', 'resources', 'artifacts_dropped'} olur. Grafikler ve
+    görüntüler {'type': 'artifact', 'kind', ...} olayları olarak gelir.
+    on_process verilirse başlatılan süreçle çağrılır (iptal için); stdin
+    programın girdisi olarak verilir.
+    """
+    start_time = time.time()
+    process = None
+    buffers = {'stdout': HeadTailBuffer(), 'stderr': HeadTailBuffer()}
+    artifacts = ArtifactDecoder()
+
+    def stop():
+        # Zaman aşımı veya istemci bağlantıyı kopardıysa süreç grubunu durdur
+        if process is not None:
+            process_reaper.stop(process)
+
+    def finish(done):
+        # Kaynak kullanımı süreç bittikten sonra (öldürülse de) bilinir
+        stop()
+        done['resources'] = collect_resources(process) if process is not None else None
+        # Sınırı aşan akışların son kısmını gönder
+        for stream_name, buffer in buffers.items():
+            if buffer.truncated:
+                yield {'type': 'truncated', 'stream': stream_name, 'omitted_bytes': buffer.omitted_bytes}
+                yield {'type': stream_name, 'text': buffer.tail()}
+        done.update({
+            'type': 'done',
+            'truncated': any(buffer.truncated for buffer in buffers.values()),
+            'output_bytes': buffers['stdout'].total_bytes,
+            'error_bytes': buffers['stderr'].total_bytes,
+            'artifacts_dropped': artifacts.dropped
+        })
+        yield done
 
-        # Çıktıyı temizle
-        output = result.stdout.strip() if result.stdout else ''
-        error = result.stderr.strip() if result.stderr else ''
-        
-        # Uyarıları, TensorFlow ve Pygame bilgi mesajlarını filtrele
-        if error:
-            error_lines = error.split('\n')
-            filtered_errors = []
-            for line in error_lines:
-                # TensorFlow bilgi mesajlarını filtrele
-                if any(skip in line for skip in [
-                    'oneDNN custom operations are on',
-                    'This TensorFlow binary is optimized',
-                    'To enable the following instructions',
-                    'tensorflow/core/platform/cpu_feature_guard',
-                    'tensorflow/core/util/port.cc',
-                    'I tensorflow/',
-                    'W tensorflow/'
-                ]):
-                    continue
-                # Diğer uyarıları filtrele
-                if not any(skip in line.lower() for skip in ['warning', 'deprecated', 'futurewarning']):
-                    filtered_errors.append(line)
-            error = '\n'.join(filtered_errors).strip()
-        
-        # Output'tan Pygame mesajlarını filtrele
-        if output:
-            output_lines = output.split('\n')
-            filtered_output = []
-            for line in output_lines:
-                # Pygame mesajlarını filtrele
-                if any(skip in line for skip in [
-                    'pygame',
-                    'SDL',
-                    'Hello from the pygame community',
-                    'https://www.pygame.org'
-                ]):
-                    continue
-                filtered_output.append(line)
-            output = '\n'.join(filtered_output).strip()
-
-        success = result.returncode == 0
-        response_data = {
-            'success': success,
-            'output': output,
-            'error': error if error else None,
-            'execution_time': execution_time
-        }
-        
-        return response_data
+    try:
+        process = start_python_process(code, stdin)
+        if on_process:
+            on_process(process)
+
+        for stream_name, text in iter_process_output(
+            process, timeout, artifacts=artifacts, on_exit=process_reaper.reap
+        ):
+            if stream_name == 'artifact':
+                yield {**text, 'type': 'artifact'}
+                continue
+            head = buffers[stream_name].feed(text)
+            if head:
+                yield {'type': stream_name, 'text': head}
+
+        yield from finish({
+            'success': process.returncode == 0,
+            'exit_code': process.returncode,
+            'error': None,
+            'execution_time': time.time() - start_time
+        })
 
     except subprocess.TimeoutExpired:
-        if 'temp_file_path' in locals():
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-        return {
+        yield from finish({
             'success': False,
-            'output': '',
+            'exit_code': None,
             'error': f'Kod çalıştırma süresi {timeout} saniyeyi aştı',
             'execution_time': timeout
-        }
+        })
     except Exception as e:
-        if 'temp_file_path' in locals():
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass
-        return {
+        yield from finish({
             'success': False,
-            'output': '',
+            'exit_code': None,
             'error': str(e),
             'execution_time': 0
+        })
+    finally:
+        stop()
+        if process is not None:
+            process_reaper.reap(process)
+            close_report(process)
+
+def execute_python_code(code, timeout=30, on_process=None, stdin=None):
+    """Python kodunu güvenli şekilde çalıştır"""
+    parts = {'stdout': [], 'stderr': []}
+    artifacts = []
+    for event in stream_python_code(code, timeout, on_process=on_process, stdin=stdin):
+        if event['type'] in parts:
+            parts[event['type']].append(event['text'])
+        elif event['type'] == 'artifact':
+            artifact = {key: value for key, value in event.items() if key != 'type'}
+            if artifact.get('kind') == 'frame':
+                # Akış dışında her pencerenin sadece son karesi döner
+                window = artifact.get('window')
+                artifacts = [
+                    item for item in artifacts
+                    if item.get('kind') != 'frame' or item.get('window') != window
+                ]
+            artifacts.append(artifact)
+        elif event['type'] == 'truncated':
+            parts[event['stream']].append(truncation_notice(event['omitted_bytes']))
+        else:
+            done = event
+
+    output_info = {
+        'truncated': done['truncated'],
+        'output_bytes': done['output_bytes'],
+        'error_bytes': done['error_bytes'],
+        'resources': done['resources'],
+        'artifacts': artifacts,
+        'artifacts_dropped': done['artifacts_dropped']
+    }
+
+    # Zaman aşımı ve başlatma hatalarında önceki gibi sadece hata mesajı dön
+    if done['error']:
+        return {
+            'success': False,
+            'output': '',
+            'error': done['error'],
+            'execution_time': done['execution_time'],
+            **output_info
         }
 
+    error = ''.join(parts['stderr']).strip()
+    return {
+        'success': done['success'],
+        'output': ''.join(parts['stdout']).strip(),
+        'error': error if error else None,
+        'execution_time': done['execution_time'],
+        **output_info
+    }
+
 # API Routes
 
 @app.route('/api/auth/register', methods=['POST'])
@@ -745,14 +679,12 @@ def delete_account():
         return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
     
     try:
-        # Kullanıcının tüm dosyalarını sil
-        user_files = db.get_user_files(user_id)
-        for file_data in user_files:
-            db.delete_file(file_data['id'])
-        
-        # Kullanıcıyı sil
+        # Kullanıcıyı, projelerini ve tüm dosya satırlarını tek işlemde sil
         db.delete_user(user_id)
         
+        # Disk'teki kullanıcı dizinini tek seferde sil
+        remove_disk_path(FILES_DIR / user_id)
+        
         # Oturumu temizle
         session.clear()
         
@@ -836,12 +768,19 @@ def get_files():
                 'data': {'files': all_files}
             })
         else:
-            # Tüm dosyalar (projelerim sayfası için)
-            # Debug: Getting all user files
-            files = db.get_user_files(user_id)
+            # Tüm dosyalar (projelerim sayfası için); limit/cursor verilirse sayfalı
+            try:
+                options = parse_file_list_args(request.args)
+            except ValueError as e:
+                return jsonify({'success': False, 'message': str(e)}), 400
+
+            files, next_key = db.list_user_files(user_id, **options)
+            data = {'files': files}
+            if options['limit']:
+                data['next_cursor'] = encode_cursor(next_key) if next_key else None
             return jsonify({
                 'success': True,
-                'data': {'files': files}
+                'data': data
             })
     except Exception as e:
         print(f"❌ Backend error: {e}")
@@ -859,46 +798,31 @@ def create_file():
     data = request.get_json()
     name = data.get('name')
     file_type = data.get('type', 'file')
-    content = data.get('content', '')
+    content = data.get('content') or ''
     parent_id = data.get('parent_id')
     language = data.get('language', 'python')
 
     if not name:
         return jsonify({'success': False, 'message': 'Dosya adı gerekli'}), 400
+    if not is_valid_name(name):
+        return jsonify({'success': False, 'message': 'Geçersiz dosya adı'}), 400
 
     # Yeni dosya bilgisi
     file_id = str(uuid.uuid4())
     
-    # Path oluştur (recursive parent path building)
-    def build_full_path(parent_id: str, filename: str) -> str:
-        if not parent_id:
-            return filename
-        
+    # Üst klasörün path'i zaten tam yol; tek sorgu yeterli
+    parent = None
+    if parent_id:
         parent = db.get_file_by_id(parent_id)
-        if not parent:
-            return filename
-            
-        if parent['parent_id']:
-            # Recursive path building
-            return f"{parent['path']}/{filename}"
-        else:
-            # Direct child of root or project
-            return f"{parent['name']}/{filename}"
+        if not parent or parent['user_id'] != user_id:
+            return jsonify({'success': False, 'message': 'Üst klasör bulunamadı'}), 404
     
-    if parent_id:
-        file_path = build_full_path(parent_id, name)
-    else:
-        file_path = name
+    file_path = child_path(parent, name)
     
     # project_id'yi düzgün hesapla
     project_id = None
-    if parent_id:
-        parent = db.get_file_by_id(parent_id)
-        if parent:
-            if parent['type'] == 'project':
-                project_id = parent['id']
-            elif parent['project_id']:
-                project_id = parent['project_id']
+    if parent:
+        project_id = parent['id'] if parent['type'] == 'project' else parent['project_id']
     
     file_data = {
         'id': file_id,
@@ -915,24 +839,16 @@ def create_file():
     }
 
     try:
-        # SQLite'a kaydet
+        # SQLite'a kaydet (içerik blob deposunda; diske ayrıca yazılmaz)
         db.create_file(file_data)
-        
-        # Dosyayı diskde oluştur
-        user_files_dir = get_user_files_dir(user_id)
-        disk_file_path = user_files_dir / file_path
-        
-        if file_type == 'file':
-            disk_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(disk_file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        else:  # folder or project
-            disk_file_path.mkdir(parents=True, exist_ok=True)
 
         return jsonify({
             'success': True,
             'data': {'file': file_data}
         })
+    except sqlite3.IntegrityError:
+        # (user_id, path) tekil indeksi: aynı konumda aynı ad
+        return jsonify({'success': False, 'message': 'Bu konumda aynı adda bir dosya var'}), 409
     except Exception as e:
         return jsonify({
             'success': False,
@@ -951,6 +867,8 @@ def create_project():
 
     if not project_name:
         return jsonify({'success': False, 'message': 'Proje adı gerekli'}), 400
+    if not is_valid_name(project_name):
+        return jsonify({'success': False, 'message': 'Geçersiz proje adı'}), 400
 
     try:
         # Proje ID'si
@@ -980,9 +898,9 @@ def create_project():
             'updated_at': now
         }
         
-        # SQLite'a kaydet
-        db.create_project(project_data)
+        # SQLite'a kaydet; önce yolu tekil olması gereken proje klasörü
         db.create_file(project_file_data)
+        db.create_project(project_data)
         
         # SADECE main.py oluştur - başka hiçbir dosya oluşturma
         main_file_id = str(uuid.uuid4())
@@ -1004,15 +922,6 @@ def create_project():
         print(f"✅ Creating ONLY main.py for project {project_name}")
         db.create_file(main_file_data)
         
-        # Disk'te oluştur
-        user_files_dir = get_user_files_dir(user_id)
-        project_dir = user_files_dir / project_name
-        project_dir.mkdir(exist_ok=True)
-        
-        main_file_path = project_dir / 'main.py'
-        with open(main_file_path, 'w', encoding='utf-8') as f:
-            f.write(main_content)
-        
         return jsonify({
             'success': True,
             'data': {
@@ -1021,6 +930,8 @@ def create_project():
             },
             'message': f'Proje "{project_name}" oluşturuldu'
         })
+    except sqlite3.IntegrityError:
+        return jsonify({'success': False, 'message': 'Bu adda bir proje veya dosya zaten var'}), 409
     except Exception as e:
         return jsonify({
             'success': False,
@@ -1042,16 +953,15 @@ def download_file(file_id):
         return jsonify({'success': False, 'message': 'Klasörler indirilemez'}), 400
 
     # Dosya içeriği
-    user_files_dir = get_user_files_dir(user_id)
-    file_path = user_files_dir / file_info['path']
+    content = db.get_file_content(file_info['id'])
     
-    if not file_path.exists():
+    if content is None:
         return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
 
     try:
         from flask import send_file
         return send_file(
-            file_path,
+            io.BytesIO(content.encode('utf-8')),
             as_attachment=True,
             download_name=file_info['name']
         )
@@ -1072,19 +982,7 @@ def get_file_content(file_id):
     if file_info['type'] == 'folder' or file_info['type'] == 'project':
         return jsonify({'success': False, 'message': 'Klasörün içeriği okunamaz'}), 400
 
-    # Önce SQLite'dan kontrol et
-    if file_info['content']:
-        content = file_info['content']
-    else:
-        # Disk'ten oku
-        user_files_dir = get_user_files_dir(user_id)
-        file_path = user_files_dir / file_info['path']
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except FileNotFoundError:
-            content = ''
+    content = db.get_file_content(file_info['id']) or ''
 
     return jsonify({
         'success': True,
@@ -1098,7 +996,7 @@ def update_file_content(file_id):
         return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
 
     data = request.get_json()
-    content = data.get('content', '')
+    content = data.get('content') or ''
 
     file_info = db.get_file_by_id(file_id)
 
@@ -1106,16 +1004,8 @@ def update_file_content(file_id):
         return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
 
     try:
-        # SQLite'da güncelle
+        # Tek kaynak blob deposu; diske ayrıca yazılmaz
         db.update_file_content(file_id, content)
-        
-        # Disk'te güncelle
-        user_files_dir = get_user_files_dir(user_id)
-        file_path = user_files_dir / file_info['path']
-        
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
 
         return jsonify({'success': True})
     except Exception as e:
@@ -1133,24 +1023,16 @@ def delete_file(file_id):
         return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
 
     try:
-        # Disk'ten sil
-        user_files_dir = get_user_files_dir(user_id)
-        file_path = user_files_dir / file_info['path']
-        
-        if file_path.exists():
-            if file_info['type'] == 'folder' or file_info['type'] == 'project':
-                shutil.rmtree(file_path)
-            else:
-                file_path.unlink()
-
-        # Proje siliniyorsa projects tablosundan da sil
+        # Proje siliniyorsa projects tablosundan da sil; alt ağaç tek işlemde silinir
         if file_info['type'] == 'project':
-            db.delete_project(file_id)
+            deleted = db.delete_project(file_id)
         else:
-            # Normal dosya/klasör silme (recursive)
-            db.delete_file(file_id)
+            deleted = db.delete_file(file_id)
 
-        return jsonify({'success': True})
+        # Disk'ten sil (klasörse tüm ağaç tek rmtree ile)
+        remove_disk_path(get_user_files_dir(user_id) / file_info['path'])
+
+        return jsonify({'success': True, 'data': {'deleted': deleted}})
     except Exception as e:
         return jsonify({'success': False, 'message': 'Dosya silinemedi'}), 500
 
@@ -1165,60 +1047,144 @@ def rename_file(file_id):
 
     if not new_name:
         return jsonify({'success': False, 'message': 'Yeni dosya adı gerekli'}), 400
+    if not is_valid_name(new_name):
+        return jsonify({'success': False, 'message': 'Geçersiz dosya adı'}), 400
 
     file_info = db.get_file_by_id(file_id)
 
     if not file_info or file_info['user_id'] != user_id:
         return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
 
-    try:
-        # Disk'te yeniden adlandır
-        user_files_dir = get_user_files_dir(user_id)
-        old_path = user_files_dir / file_info['path']
-        
-        # Yeni path oluştur
-        if file_info['parent_id']:
-            parent = db.get_file_by_id(file_info['parent_id'])
-            if parent:
-                new_path_str = f"{parent['path']}/{new_name}"
-            else:
-                new_path_str = new_name
-        else:
-            new_path_str = new_name
-            
-        new_path = user_files_dir / new_path_str
-        
-        if old_path.exists():
-            old_path.rename(new_path)
+    parent = db.get_file_by_id(file_info['parent_id']) if file_info['parent_id'] else None
 
-        # SQLite'da güncelle
-        db.rename_file(file_id, new_name)
-
-        return jsonify({'success': True})
+    try:
+        new_path = relocate_file(user_id, file_info, parent, new_name)
+        return jsonify({'success': True, 'data': {'path': new_path}})
+    except sqlite3.IntegrityError:
+        return jsonify({'success': False, 'message': 'Bu konumda aynı adda bir dosya var'}), 409
     except Exception as e:
         return jsonify({'success': False, 'message': 'Dosya yeniden adlandırılamadı'}), 500
 
-def execute_html_code(html_code):
-    """HTML kodunu tarayıcıda çalıştır"""
+@app.route('/api/files/<file_id>/move', methods=['PUT'])
+def move_file(file_id):
+    """Dosyayı veya klasörü başka bir klasöre taşı (isteğe bağlı yeni adla)"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    data = request.get_json() or {}
+    file_info = db.get_file_by_id(file_id)
+
+    if not file_info or file_info['user_id'] != user_id:
+        return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
+    if file_info['type'] == 'project':
+        return jsonify({'success': False, 'message': 'Projeler taşınamaz'}), 400
+
+    new_name = data.get('name') or file_info['name']
+    if not is_valid_name(new_name):
+        return jsonify({'success': False, 'message': 'Geçersiz dosya adı'}), 400
+
+    parent = None
+    if data.get('parent_id'):
+        parent = db.get_file_by_id(data['parent_id'])
+        if not parent or parent['user_id'] != user_id:
+            return jsonify({'success': False, 'message': 'Hedef klasör bulunamadı'}), 404
+        if parent['type'] not in ('folder', 'project'):
+            return jsonify({'success': False, 'message': 'Hedef bir klasör olmalı'}), 400
+        if parent['path'] == file_info['path'] or parent['path'].startswith(file_info['path'] + '/'):
+            return jsonify({'success': False, 'message': 'Klasör kendi içine taşınamaz'}), 400
+
     try:
-        import webbrowser
-        import tempfile
-        import os
-        
-        # HTML dosyası oluştur
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(html_code)
-            temp_file_path = temp_file.name
+        new_path = relocate_file(user_id, file_info, parent, new_name)
+        return jsonify({'success': True, 'data': {'path': new_path}})
+    except sqlite3.IntegrityError:
+        return jsonify({'success': False, 'message': 'Bu konumda aynı adda bir dosya var'}), 409
+    except Exception as e:
+        return jsonify({'success': False, 'message': 'Dosya taşınamadı'}), 500
 
-        # Tarayıcıda aç
-        webbrowser.open('file://' + os.path.abspath(temp_file_path))
-        
+@app.route('/api/files/<file_id>/tree', methods=['GET'])
+def get_file_subtree(file_id):
+    """Klasörün kendisi ve tüm alt dosyaları, yola göre sıralı"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    file_info = db.get_file_by_id(file_id)
+
+    if not file_info or file_info['user_id'] != user_id:
+        return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
+
+    return jsonify({'success': True, 'data': {'files': db.get_subtree(file_id)}})
+
+@app.route('/api/files/resolve', methods=['GET'])
+def resolve_file_path():
+    """Tam yoldan (örn. Proje/src/main.py) dosyayı bul"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    path = (request.args.get('path') or '').strip('/')
+    file_info = db.get_file_by_path(user_id, path) if path else None
+
+    if not file_info:
+        return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
+
+    return jsonify({'success': True, 'data': {'file': file_info}})
+
+@app.route('/api/files/search', methods=['GET'])
+def search_files():
+    """Kullanıcının dosyalarında ad, yol ve içerikte ara (isteğe bağlı proje içinde)"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    if not db.search_enabled:
+        return jsonify({'success': False, 'message': 'Arama bu sunucuda kullanılamıyor'}), 503
+
+    query = (request.args.get('q') or '').strip()
+    if not query:
+        return jsonify({'success': False, 'message': 'Arama metni gerekli'}), 400
+
+    try:
+        limit = int(request.args.get('limit', SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit bir sayı olmalı'}), 400
+    if limit < 1:
+        return jsonify({'success': False, 'message': 'limit pozitif olmalı'}), 400
+    limit = min(limit, SEARCH_MAX_RESULTS)
+
+    project_id = request.args.get('project_id') or None
+    if project_id:
+        project_info = db.get_file_by_id(project_id)
+        if not project_info or project_info['user_id'] != user_id or project_info['type'] != 'project':
+            return jsonify({'success': False, 'message': 'Proje bulunamadı'}), 404
+
+    results = db.search_files(user_id, query, project_id=project_id, limit=limit)
+    return jsonify({'success': True, 'data': {'results': results}})
+
+def preview_result(html_content, message):
+    """Önizleme sayfasını önbelleğe al, adresini çalıştırma sonucunda döndür"""
+    start_time = time.time()
+    key = preview_cache.store(html_content)
+    if key is None:
         return {
-            'success': True,
-            'output': f'HTML sayfası tarayıcıda açıldı: {os.path.basename(temp_file_path)}',
-            'error': None,
-            'execution_time': 0.1
+            'success': False,
+            'output': '',
+            'error': 'Önizleme sayfası çok büyük',
+            'execution_time': 0
         }
+    return {
+        'success': True,
+        'output': message,
+        'error': None,
+        'execution_time': time.time() - start_time,
+        'preview_url': f'/api/preview/{key}'
+    }
+
+def execute_html_code(html_code):
+    """HTML kodunu önizleme sayfası olarak sun"""
+    try:
+        return preview_result(html_code, 'HTML önizlemesi hazır')
     except Exception as e:
         return {
             'success': False,
@@ -1230,10 +1196,6 @@ def execute_html_code(html_code):
 def execute_css_code(css_code):
     """CSS kodunu örnek HTML ile birlikte göster"""
     try:
-        import webbrowser
-        import tempfile
-        import os
-        
         # CSS'i HTML'e entegre et
         html_content = f"""<!DOCTYPE html>
 <html lang="tr">
@@ -1260,20 +1222,7 @@ def execute_css_code(css_code):
 </body>
 </html>"""
         
-        # HTML dosyası oluştur
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(html_content)
-            temp_file_path = temp_file.name
-
-        # Tarayıcıda aç
-        webbrowser.open('file://' + os.path.abspath(temp_file_path))
-        
-        return {
-            'success': True,
-            'output': f'CSS önizlemesi tarayıcıda açıldı: {os.path.basename(temp_file_path)}',
-            'error': None,
-            'execution_time': 0.1
-        }
+        return preview_result(html_content, 'CSS önizlemesi hazır')
     except Exception as e:
         return {
             'success': False,
@@ -1285,10 +1234,6 @@ def execute_css_code(css_code):
 def execute_javascript_code(js_code):
     """JavaScript kodunu HTML'e entegre ederek çalıştır"""
     try:
-        import webbrowser
-        import tempfile
-        import os
-        
         # JavaScript'i HTML'e entegre et
         html_content = f"""<!DOCTYPE html>
 <html lang="tr">
@@ -1338,20 +1283,7 @@ def execute_javascript_code(js_code):
 </body>
 </html>"""
         
-        # HTML dosyası oluştur
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as temp_file:
-            temp_file.write(html_content)
-            temp_file_path = temp_file.name
-
-        # Tarayıcıda aç
-        webbrowser.open('file://' + os.path.abspath(temp_file_path))
-        
-        return {
-            'success': True,
-            'output': f'JavaScript kodu tarayıcıda çalıştırılıyor: {os.path.basename(temp_file_path)}',
-            'error': None,
-            'execution_time': 0.1
-        }
+        return preview_result(html_content, 'JavaScript önizlemesi hazır')
     except Exception as e:
         return {
             'success': False,
@@ -1360,6 +1292,23 @@ def execute_javascript_code(js_code):
             'execution_time': 0
         }
 
+def execute_by_language(code, language, on_process=None):
+    """Dile göre kodu çalıştır"""
+    if language == 'python':
+        return execute_python_code(code, on_process=on_process)
+    elif language == 'html':
+        return execute_html_code(code)
+    elif language == 'css':
+        return execute_css_code(code)
+    elif language == 'javascript':
+        return execute_javascript_code(code)
+    return {
+        'success': False,
+        'output': '',
+        'error': f'Desteklenmeyen dil: {language}',
+        'execution_time': 0
+    }
+
 @app.route('/api/execute', methods=['POST'])
 def execute_code():
     user_id = session.get('user_id')
@@ -1375,34 +1324,276 @@ def execute_code():
     if not code.strip():
         return jsonify({'success': False, 'message': 'Kod boş olamaz'}), 400
 
-    # Dile göre kodu çalıştır
-    if language == 'python':
-        result = execute_python_code(code)
-    elif language == 'html':
-        result = execute_html_code(code)
-    elif language == 'css':
-        result = execute_css_code(code)
-    elif language == 'javascript':
-        result = execute_javascript_code(code)
-    else:
-        result = {
-            'success': False,
-            'output': '',
-            'error': f'Desteklenmeyen dil: {language}',
-            'execution_time': 0
-        }
+    # Değişmemiş deterministik kod için yorumlayıcı başlatmadan önceki sonucu dön
+    use_cache = data.get('cache', True)
+    cached = result_cache.lookup(code, language) if use_cache else None
+
+    def run_and_cache(on_process=None):
+        result = execute_by_language(code, language, on_process=on_process)
+        resource_accounting.record(user_id, code, result)
+        if use_cache:
+            result_cache.store(code, language, result)
+        return result
+
+    # İstenirse işi kuyruğa al ve hemen iş kimliği dön
+    if data.get('async'):
+        job = job_queue.submit(
+            user_id,
+            language,
+            (lambda job: cached) if cached else (lambda job: run_and_cache(on_process=job.attach_process))
+        )
+        return jsonify({
+            'success': True,
+            'data': {'job': job_queue.describe(job)}
+        }), 202
+
+    if cached:
+        return jsonify({
+            'success': True,
+            'data': cached
+        })
+
+    try:
+        with execution_scheduler.slot(user_id):
+            result = run_and_cache()
+    except SchedulerBusy as e:
+        return jsonify({'success': False, 'message': str(e)}), 503
 
     return jsonify({
         'success': True,
         'data': result
     })
 
+@app.route('/api/execute/batch', methods=['POST'])
+def execute_code_batch():
+    """Birden çok Python kodu/girdi çiftini paralel çalıştır (otomatik değerlendirme)"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    try:
+        items = parse_batch(request.get_json(silent=True))
+    except BatchError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+    def run_item(item):
+        try:
+            with execution_scheduler.slot(user_id):
+                result = execute_python_code(item['code'], timeout=item['timeout'], stdin=item['stdin'])
+        except SchedulerBusy as e:
+            return {'success': False, 'output': '', 'error': str(e), 'execution_time': 0}
+        resource_accounting.record(user_id, item['code'], result)
+        return result
+
+    return jsonify({
+        'success': True,
+        'data': run_batch(items, run_item)
+    })
+
+@app.route('/api/execute/stats', methods=['GET'])
+def get_execution_stats():
+    """Havuz, zamanlayıcı, iş kuyruğu, önbellek ve süreç grubu istatistikleri"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    return jsonify({
+        'success': True,
+        'data': {
+            'pool': interpreter_pool.get_stats(),
+            'scheduler': execution_scheduler.get_stats(),
+            'jobs': job_queue.stats(),
+            'result_cache': result_cache.get_stats(),
+            'resources': resource_accounting.get_stats(),
+            'process_groups': process_reaper.get_stats(),
+            'previews': preview_cache.get_stats()
+        }
+    })
+
+@app.route('/api/database/stats', methods=['GET'])
+def get_database_stats():
+    """Bağlantı havuzu, kullanıcı/dosya önbelleği ve blob deposu istatistikleri"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    return jsonify({'success': True, 'data': db.get_stats()})
+
+@app.route('/api/execute/usage', methods=['GET'])
+def get_execution_usage():
+    """Oturumdaki kullanıcının toplam CPU/bellek/I/O kullanımı"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    return jsonify({
+        'success': True,
+        'data': {'usage': resource_accounting.get_user_stats(user_id)}
+    })
+
+def get_user_job(job_id, user_id):
+    """İşi getir (sadece sahibi görebilir)"""
+    job = job_queue.get(job_id)
+    if not job or job.user_id != user_id:
+        return None
+    return job
+
+@app.route('/api/execute/jobs/<job_id>', methods=['GET'])
+def get_execution_job(job_id):
+    """İş durumunu, kuyruk/çalışma sürelerini ve bittiyse sonucu döndür"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    job = get_user_job(job_id, user_id)
+    if not job:
+        return jsonify({'success': False, 'message': 'İş bulunamadı'}), 404
+
+    return jsonify({
+        'success': True,
+        'data': {'job': job_queue.describe(job)}
+    })
+
+@app.route('/api/execute/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_execution_job(job_id):
+    """Kuyruktaki işi çıkar veya çalışan süreci öldür"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    job = get_user_job(job_id, user_id)
+    if not job:
+        return jsonify({'success': False, 'message': 'İş bulunamadı'}), 404
+
+    if not job_queue.cancel(job):
+        return jsonify({'success': False, 'message': 'İş zaten tamamlanmış'}), 409
+
+    return jsonify({
+        'success': True,
+        'data': {'job': job_queue.describe(job)}
+    })
+
+def format_sse(event):
+    """Olayı Server-Sent Events formatına çevir"""
+    return f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+def scheduled_events(user_id, make_events):
+    """Olay üretecini kullanıcının zamanlayıcı yeri içinde çalıştır"""
+    try:
+        with execution_scheduler.slot(user_id):
+            yield from make_events()
+    except SchedulerBusy as e:
+        yield {
+            'type': 'done',
+            'success': False,
+            'exit_code': None,
+            'error': str(e),
+            'execution_time': 0
+        }
+
+@app.route('/api/execute/stream', methods=['POST'])
+def execute_code_stream():
+    """Kodu çalıştır, stdout/stderr parçalarını Server-Sent Events olarak akıt"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    data = request.get_json()
+    code = data.get('code', '')
+    language = data.get('language', 'python')
+
+    if not code.strip():
+        return jsonify({'success': False, 'message': 'Kod boş olamaz'}), 400
+
+    if language == 'python':
+        events = scheduled_events(user_id, lambda: stream_python_code(code))
+    else:
+        # Diğer diller anında biter: sonucu tek seferde gönder
+        result = execute_by_language(code, language)
+        events = []
+        if result['output']:
+            events.append({'type': 'stdout', 'text': result['output']})
+        if result.get('preview_url'):
+            events.append({'type': 'artifact', 'kind': 'preview', 'url': result['preview_url']})
+        events.append({
+            'type': 'done',
+            'success': result['success'],
+            'exit_code': None,
+            'error': result['error'],
+            'execution_time': result['execution_time']
+        })
+
+    def generate():
+        for event in events:
+            if event['type'] == 'done':
+                resource_accounting.record(user_id, code, event)
+            yield format_sse(event)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # nginx arkasında tamponlamayı kapat
+        }
+    )
+
+@app.route('/api/preview/<key>', methods=['GET'])
+def get_preview(key):
+    """HTML/CSS/JavaScript önizleme sayfasını sun (ETag ile)"""
+    user_id = session.get('user_id')
+    if not user_id:
+        return jsonify({'success': False, 'message': 'Oturum açılmamış'}), 401
+
+    page = preview_cache.get(key)
+    if page is None:
+        return jsonify({'success': False, 'message': 'Önizleme bulunamadı veya süresi doldu'}), 404
+
+    headers = {
+        'Cache-Control': PREVIEW_CACHE_CONTROL,
+        'Content-Security-Policy': PREVIEW_CONTENT_SECURITY_POLICY,
+        'X-Content-Type-Options': 'nosniff'
+    }
+    if request.if_none_match.contains(key):
+        response = Response(status=304, headers=headers)
+    else:
+        response = Response(page, mimetype='text/html', headers=headers)
+    response.set_etag(key)
+    return response
+
+@app.route('/api/vendor/<library>/<version>/<filename>', methods=['GET'])
+def get_vendor_asset(library, version, filename):
+    """Plotly/Bokeh JS kütüphanesi: sürümlü URL, gzip ve uzun süreli önbellek"""
+    asset = get_asset(library, version, filename)
+    if asset is None:
+        return jsonify({'success': False, 'message': 'Dosya bulunamadı'}), 404
+
+    headers = {'Cache-Control': CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+    if request.if_none_match.contains(asset.etag):
+        response = Response(status=304, headers=headers)
+        response.set_etag(asset.etag)
+        return response
+
+    use_gzip = 'gzip' in request.accept_encodings
+    response = Response(
+        asset.gzipped if use_gzip else asset.data,
+        mimetype='application/javascript',
+        headers=headers
+    )
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(asset.etag)
+    return response
+
 if __name__ == '__main__':
     print("🐍 Python Web Editor Backend başlatılıyor...")
     print("📁 Proje dizini:", BASE_DIR)
     print("👥 Kullanıcı verileri:", USERS_DIR)
     print("📂 Dosya verileri:", FILES_DIR)
     print("🌐 Server: http://localhost:8000")
+
+    # Zygote'ları arka planda ısıt (ilk çalıştırmalar soğuk import beklemesin)
+    interpreter_pool.start()
     
     # Debug mode'u kapatarak gereksiz reload'ları önle
     app.run(debug=False, host='0.0.0.0', port=8000, use_reloader=False)
@@ -0,0 +1,92 @@
+"""Kullanıcı sürecinden sunucuya görsel çıktı (artifact) kanalı
+
+Grafikler ve görüntüler stdout'a karışmadan ayrı bir pipe üzerinden, satır
+başına bir JSON mesaj olarak gönderilir. Kullanıcı sürecinde emit(), sunucu
+tarafında ArtifactDecoder kullanılır. Kanal fd aktarımı gerektirdiği için
+sadece POSIX sistemlerde açılır; diğerlerinde emit() False döner.
+"""
+import base64
+import json
+import os
+import threading
+
+# Sunucu tarafı: çalıştırma başına kabul edilen toplam artifact byte'ı
+MAX_ARTIFACT_BYTES = int(os.environ.get('EXECUTION_MAX_ARTIFACT_BYTES', str(16 * 1024 * 1024)))
+
+_channel = None
+_lock = threading.Lock()
+
+
+def open_channel(fd):
+    """Kullanıcı sürecinde artifact pipe'ının yazma ucunu aç"""
+    global _channel
+    _channel = os.fdopen(fd, 'wb')
+
+
+def is_available():
+    return _channel is not None
+
+
+def encode_bytes(data):
+    """İkili veriyi JSON'a koymak için base64'e çevir"""
+    return base64.b64encode(data).decode('ascii')
+
+
+def emit(kind, **fields):
+    """Sunucuya bir artifact gönder; kanal yoksa veya kapandıysa False"""
+    if _channel is None:
+        return False
+    line = json.dumps({'kind': kind, **fields}).encode('utf-8') + b'\n'
+    with _lock:
+        try:
+            _channel.write(line)
+            _channel.flush()
+        except (OSError, ValueError):
+            return False
+    return True
+
+
+class ArtifactDecoder:
+    """Pipe'tan parça parça gelen JSON satırlarını artifact sözlüklerine çevirir
+
+    Toplamda max_bytes'ı aşan artifact'ler atılır ve dropped sayacı artar.
+    """
+
+    def __init__(self, max_bytes=MAX_ARTIFACT_BYTES):
+        self.max_bytes = max_bytes
+        self.accepted_bytes = 0
+        self.dropped = 0
+        self._partial = b''
+        self._skipping = False
+
+    def feed(self, chunk):
+        if self._skipping:
+            # Sınırı aşan satırın geri kalanını atla
+            end = chunk.find(b'\n')
+            if end < 0:
+                return []
+            chunk = chunk[end + 1:]
+            self._skipping = False
+
+        lines = (self._partial + chunk).split(b'\n')
+        self._partial = lines.pop()
+        if len(self._partial) > self.max_bytes - self.accepted_bytes:
+            self._partial = b''
+            self._skipping = True
+            self.dropped += 1
+
+        artifacts = []
+        for line in lines:
+            if not line:
+                continue
+            if self.accepted_bytes + len(line) > self.max_bytes:
+                self.dropped += 1
+                continue
+            try:
+                artifact = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(artifact, dict):
+                self.accepted_bytes += len(line)
+                artifacts.append(artifact)
+        return artifacts
@@ -0,0 +1,109 @@
+"""Toplu çalıştırma: çok sayıda kod/girdi çiftini sınırlı paralellikle çalıştırır
+
+Otomatik değerlendirmede onlarca kod (veya tek kodun farklı girdileri) tek
+istekle gönderilir. Her öğe kendi zaman aşımıyla ayrı bir süreçte (sıcak
+havuzdan) çalışır; iş parçacıkları sadece süreçleri bekler. Öğeler yine de
+kullanıcının zamanlayıcı yerleri içinde çalıştığı için asıl paralellik
+EXECUTION_MAX_RUNS_PER_USER ile sınırlıdır ve toplu iş diğer kullanıcıları
+bekletemez.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BATCH_MAX_ITEMS = int(os.environ.get('EXECUTION_BATCH_MAX_ITEMS', '100'))
+BATCH_MAX_WORKERS = int(os.environ.get('EXECUTION_BATCH_MAX_WORKERS', '4'))
+BATCH_DEFAULT_TIMEOUT = float(os.environ.get('EXECUTION_BATCH_DEFAULT_TIMEOUT', '10'))
+BATCH_MAX_TIMEOUT = float(os.environ.get('EXECUTION_BATCH_MAX_TIMEOUT', '30'))
+MAX_STDIN_BYTES = int(os.environ.get('EXECUTION_MAX_STDIN_BYTES', str(1024 * 1024)))
+
+
+class BatchError(ValueError):
+    """Toplu istek geçersiz (kullanıcıya gösterilecek mesaj)"""
+
+
+def _timeout(value, default):
+    if value is None:
+        return default
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        raise BatchError('Geçersiz zaman aşımı')
+    if timeout <= 0:
+        raise BatchError('Zaman aşımı pozitif olmalı')
+    return min(timeout, BATCH_MAX_TIMEOUT)
+
+
+def parse_batch(data):
+    """İstek gövdesini öğe listesine çevir: [{'code', 'stdin', 'timeout'}, ...]
+
+    İki biçim kabul edilir: {"items": [{"code", "stdin"?, "timeout"?}, ...]}
+    veya tek kod ve girdileri {"code", "inputs": ["...", ...]}.
+    """
+    if not isinstance(data, dict):
+        raise BatchError('Geçersiz istek')
+    default_timeout = _timeout(data.get('timeout'), BATCH_DEFAULT_TIMEOUT)
+
+    if 'items' in data:
+        raw_items = data['items']
+        if not isinstance(raw_items, list):
+            raise BatchError('items bir liste olmalı')
+    else:
+        inputs = data.get('inputs')
+        if not isinstance(inputs, list):
+            raise BatchError('items veya code ile inputs gerekli')
+        raw_items = [{'code': data.get('code'), 'stdin': stdin} for stdin in inputs]
+
+    if not raw_items:
+        raise BatchError('Toplu istek boş olamaz')
+    if len(raw_items) > BATCH_MAX_ITEMS:
+        raise BatchError(f'Tek istekte en fazla {BATCH_MAX_ITEMS} öğe çalıştırılabilir')
+
+    items = []
+    for index, raw in enumerate(raw_items):
+        if not isinstance(raw, dict):
+            raise BatchError(f'{index}. öğe geçersiz')
+        code = raw.get('code')
+        if not isinstance(code, str) or not code.strip():
+            raise BatchError(f'{index}. öğenin kodu boş olamaz')
+        stdin = raw.get('stdin')
+        if stdin is not None and not isinstance(stdin, str):
+            raise BatchError(f'{index}. öğenin girdisi metin olmalı')
+        if stdin is not None and len(stdin.encode('utf-8')) > MAX_STDIN_BYTES:
+            raise BatchError(f'{index}. öğenin girdisi {MAX_STDIN_BYTES} byte sınırını aşıyor')
+        items.append({
+            'code': code,
+            'stdin': stdin,
+            'timeout': _timeout(raw.get('timeout'), default_timeout)
+        })
+    return items
+
+
+def run_batch(items, run_item, max_workers=BATCH_MAX_WORKERS):
+    """Öğeleri paralel çalıştır; sonuçlar istek sırasıyla ve toplam sürelerle döner
+
+    run_item(item) execute_python_code biçiminde bir sonuç sözlüğü döndürür.
+    """
+    start_time = time.time()
+
+    def run(indexed):
+        index, item = indexed
+        item_start = time.time()
+        result = run_item(item)
+        return {'index': index, **result, 'wall_time': time.time() - item_start}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+        results = list(executor.map(run, enumerate(items)))
+
+    execution_times = [result.get('execution_time') or 0 for result in results]
+    return {
+        'results': results,
+        'summary': {
+            'total': len(results),
+            'succeeded': sum(1 for result in results if result.get('success')),
+            'failed': sum(1 for result in results if not result.get('success')),
+            'wall_time': time.time() - start_time,
+            'total_execution_time': sum(execution_times),
+            'max_execution_time': max(execution_times)
+        }
+    }
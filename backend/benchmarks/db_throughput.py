@@ -0,0 +1,136 @@
+"""Dosya API'sinin istek verimi: çağrı başına bağlantı ile bağlantı havuzu
+
+Kullanım (backend dizininden):
+    python benchmarks/db_throughput.py [--threads 8] [--duration 5] [--write-ratio 0.3]
+
+Karşılaştırılan modlar:
+    connect - eski davranış: her çağrıda yeni sqlite3.connect, varsayılan günlük modu
+    pool    - ConnectionPool: kalıcı bağlantılar, WAL, synchronous=NORMAL, busy_timeout
+
+Her iş parçacığı kendi test istemcisiyle rastgele bir dosyayı okur (GET /api/files/<id>)
+veya kaydeder (PUT /api/files/<id>); "database is locked" gibi hatalar 500 sayılır.
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from database import DatabaseManager  # noqa: E402
+
+
+class ConnectPerCallDatabase(DatabaseManager):
+    """Havuz öncesi davranış: her çağrıda yeni bağlantı açılıp kapatılır"""
+
+    def get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return _CommitAndClose(conn)
+
+
+class _CommitAndClose:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, *exc_info):
+        with closing(self.conn):
+            return self.conn.__exit__(*exc_info)
+
+
+def prepare(database, user_id, file_count):
+    now = datetime.now().isoformat()
+    database.create_user({
+        'id': user_id, 'username': user_id, 'email': f'{user_id}@example.com',
+        'password': app.hash_password('benchmark'), 'created_at': now
+    })
+    file_ids = []
+    for index in range(file_count):
+        file_id = str(uuid.uuid4())
+        database.create_file({
+            'id': file_id, 'user_id': user_id, 'name': f'dosya{index}.py', 'type': 'file',
+            'path': f'dosya{index}.py', 'content': 'print("merhaba")\n',
+            'created_at': now, 'updated_at': now
+        })
+        file_ids.append(file_id)
+    return file_ids
+
+
+def run_mode(name, database, args):
+    user_id = f'bench-{uuid.uuid4().hex[:8]}'
+    file_ids = prepare(database, user_id, args.files)
+    app.db = database
+
+    counts = {'requests': 0, 'errors': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = app.app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user_id
+        requests = errors = 0
+        while time.perf_counter() < deadline:
+            file_id = rng.choice(file_ids)
+            if rng.random() < args.write_ratio:
+                response = client.put(f'/api/files/{file_id}', json={'content': f'print({requests})\n'})
+            else:
+                response = client.get(f'/api/files/{file_id}')
+            requests += 1
+            if response.status_code != 200:
+                errors += 1
+        with lock:
+            counts['requests'] += requests
+            counts['errors'] += errors
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    shutil.rmtree(app.FILES_DIR / user_id, ignore_errors=True)
+    throughput = counts['requests'] / elapsed
+    print(f"{name:<8} {throughput:8.0f} istek/s  istek={counts['requests']:6d}  hata={counts['errors']}")
+    return throughput
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--files', type=int, default=20)
+    parser.add_argument('--write-ratio', type=float, default=0.3)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='db-bench-')
+    original_db = app.db
+    try:
+        results = {
+            'connect': run_mode('connect', ConnectPerCallDatabase(os.path.join(work_dir, 'connect.db')), args),
+            'pool': run_mode('pool', DatabaseManager(os.path.join(work_dir, 'pool.db')), args),
+        }
+    finally:
+        app.db = original_db
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"\nbağlantı havuzu verimi {results['pool'] / results['connect']:.2f}x artırıyor")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Basit betikler için çalıştırma başlangıç gecikmesi karşılaştırması
+
+Kullanım (backend dizininden):
+    python benchmarks/startup_latency.py [--runs 10] [--code 'print("merhaba")']
+
+Karşılaştırılan modlar:
+    eager - eski monolitik preamble gibi tüm yamalı kütüphaneleri peşin import eder
+    lazy  - runtime_hooks kurulur, kütüphaneler sadece import edilirse yüklenir
+    pool  - sıcak zygote havuzundan fork (sadece POSIX)
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from runtime_hooks import PATCHES  # noqa: E402
+
+EAGER_IMPORTS = ''.join(
+    f'try:\n    import {name}\nexcept Exception:\n    pass\n' for name in PATCHES
+)
+
+
+def run_cold(code):
+    """Yeni bir yorumlayıcıda kodu çalıştır, süreyi ölç"""
+    start = time.perf_counter()
+    process = app.start_cold_process(code)
+    process.communicate()
+    return time.perf_counter() - start
+
+
+def run_pool(code):
+    start = time.perf_counter()
+    process = app.interpreter_pool.spawn(code)
+    process.communicate()
+    return time.perf_counter() - start
+
+
+def summarize(name, samples):
+    samples = sorted(samples)
+    p90 = samples[min(len(samples) - 1, int(len(samples) * 0.9))]
+    median = statistics.median(samples)
+    print(f"{name:<6} median={median * 1000:8.1f} ms  mean={statistics.mean(samples) * 1000:8.1f} ms  p90={p90 * 1000:8.1f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--code', default='print("merhaba")\n')
+    args = parser.parse_args()
+
+    results = {}
+    results['eager'] = summarize('eager', [
+        run_cold(EAGER_IMPORTS + args.code) for _ in range(args.runs)
+    ])
+    results['lazy'] = summarize('lazy', [
+        run_cold(args.code) for _ in range(args.runs)
+    ])
+
+    if app.interpreter_pool.enabled:
+        app.interpreter_pool.start(wait=True)
+        results['pool'] = summarize('pool', [run_pool(args.code) for _ in range(args.runs)])
+        app.interpreter_pool.shutdown()
+
+    saved = results['eager'] - results['lazy']
+    print(f"\nlazy hook'lar çalıştırma başına {saved * 1000:.1f} ms kazandırıyor "
+          f"({saved / results['eager'] * 100:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
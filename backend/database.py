@@ -1,20 +1,246 @@
 import sqlite3
+import hashlib
 import json
 import os
+import queue
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from ttl_cache import TTLCache
+
+# Bağlantı havuzu ve SQLite ayarları
+DATABASE_POOL_SIZE = int(os.environ.get('DATABASE_POOL_SIZE', '8'))
+DATABASE_BUSY_TIMEOUT_MS = int(os.environ.get('DATABASE_BUSY_TIMEOUT_MS', '5000'))
+DATABASE_CACHE_SIZE_KB = int(os.environ.get('DATABASE_CACHE_SIZE_KB', str(16 * 1024)))
+DATABASE_MMAP_SIZE = int(os.environ.get('DATABASE_MMAP_SIZE', str(64 * 1024 * 1024)))
+
+# Kullanıcı ve dosya üst verisi satır önbelleği (yazmalarda geçersiz kılınır)
+DATABASE_ROW_CACHE_MAX_ENTRIES = int(os.environ.get('DATABASE_ROW_CACHE_MAX_ENTRIES', '4096'))
+DATABASE_ROW_CACHE_TTL = float(os.environ.get('DATABASE_ROW_CACHE_TTL', '60'))
+
+# Bir dosyanın kendisi ve parent_id zincirindeki tüm torunları (UNION döngülere karşı korur)
+SUBTREE_CTE = '''
+    WITH RECURSIVE subtree(id) AS (
+        SELECT id FROM files WHERE id = ?
+        UNION
+        SELECT files.id FROM files JOIN subtree ON files.parent_id = subtree.id
+    )
+'''
+
+# Dosyanın tam yolu (path) ağaç indeksi olarak tutulur: torunlar "yol/" önekiyle
+# başlar. '0' karakteri '/'dan hemen sonra geldiği için alt ağaç (user_id, path)
+# indeksinde [yol, yol + '0') aralığındadır; aralıktaki "yol.txt" gibi kardeşler
+# ikinci koşulla elenir.
+SUBTREE_RANGE = "path >= :path AND path < :path || '0' AND (path = :path OR path >= :path || '/')"
+
+# Listeleme ve yetki kontrollerinde okunan dosya üst verisi; içerik blob'ta kalır
+FILE_META_FIELDS = (
+    'id', 'user_id', 'project_id', 'name', 'type', 'path', 'parent_id', 'language',
+    'blob_hash', 'size', 'created_at', 'updated_at'
+)
+FILE_META_COLUMNS = ', '.join(FILE_META_FIELDS)
+
+# Sayfalı listede istenebilen hesaplanmış alanlar (sadece istenirse hesaplanır)
+FILE_COMPUTED_FIELDS = {
+    'child_count': '(SELECT COUNT(*) FROM files AS children WHERE children.parent_id = files.id)'
+}
+
+# Arama: snippet içindeki eşleşmeleri işaretleyen kontrol karakterleri (kodda geçmez)
+SNIPPET_START = '\x02'
+SNIPPET_END = '\x03'
+SEARCH_MAX_TERMS = 16
+
+# Şema sürümü (PRAGMA user_version)
+SCHEMA_VERSION = 5
+
+
+def content_hash(content):
+    """Dosya içeriğinin blob anahtarı (SHA-256)"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def fts_query(text):
+    """Kullanıcının arama metnini güvenli bir FTS5 sorgusuna çevir
+
+    Her kelime tırnaklı ifade olur (FTS5 sözdizimi hatası olmaz), kelimeler
+    VE ile bağlanır; yazılmakta olan son kelime önek olarak aranır.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in text.split()[:SEARCH_MAX_TERMS]]
+    if terms:
+        terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def snippet_segments(snippet):
+    """Snippet'i [{'text', 'match'}] parçalarına böl (HTML'e gömmeden vurgulamak için)"""
+    segments = []
+    for index, part in enumerate(snippet.split(SNIPPET_START)):
+        if index == 0:
+            matched, rest = '', part
+        else:
+            matched, _, rest = part.partition(SNIPPET_END)
+        if matched:
+            segments.append({'text': matched, 'match': True})
+        if rest:
+            segments.append({'text': rest, 'match': False})
+    return segments
+
+
+def content_size(content):
+    """İçeriğin UTF-8 byte boyutu"""
+    return len(content.encode('utf-8'))
+
+
+class ConnectionPool:
+    """Açık SQLite bağlantılarını yeniden kullanan thread-safe havuz
+
+    Her çağrıda connect/şema yükleme/kapatma maliyeti ödenmez. Bağlantılar WAL
+    modunda açılır: okuyucular yazanı beklemez, eşzamanlı yazanlar
+    busy_timeout kadar sırasını bekler ("database is locked" yerine).
+    Aynı iş parçacığında iç içe çağrılar aynı bağlantıyı (ve işlemi) kullanır.
+    """
+
+    def __init__(self, db_path, size=DATABASE_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self.stats = {'opened': 0, 'reused': 0, 'closed': 0}
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DATABASE_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False  # Havuzdaki bağlantı farklı iş parçacıklarına verilebilir
+        )
+        conn.row_factory = sqlite3.Row  # Dict-like access
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')  # WAL'da güvenli, her commit'te fsync yok
+        conn.execute(f'PRAGMA busy_timeout={DATABASE_BUSY_TIMEOUT_MS}')
+        conn.execute(f'PRAGMA cache_size=-{DATABASE_CACHE_SIZE_KB}')
+        conn.execute(f'PRAGMA mmap_size={DATABASE_MMAP_SIZE}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        self._count('opened')
+        return conn
+
+    def _close(self, conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        self._count('closed')
+
+    def _acquire(self):
+        if os.getpid() != self._pid:
+            # Fork sonrası üst sürecin bağlantıları kullanılamaz
+            self._pid = os.getpid()
+            self._idle = queue.LifoQueue()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+        self._count('reused')
+        return conn
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        if self._idle.qsize() >= self.size:
+            self._close(conn)
+        else:
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Havuzdan bağlantı al; blok başarıyla biterse commit, hata olursa rollback"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def close_all(self):
+        """Boştaki bağlantıları kapat"""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    def get_stats(self):
+        with self._lock:
+            return {**self.stats, 'idle': self._idle.qsize(), 'size': self.size}
+
+
 class DatabaseManager:
-    def __init__(self, db_path='../data/database.db'):
+    def __init__(self, db_path='../data/database.db', pool_size=DATABASE_POOL_SIZE,
+                 cache_entries=DATABASE_ROW_CACHE_MAX_ENTRIES, cache_ttl=DATABASE_ROW_CACHE_TTL,
+                 files_dir=None):
         self.db_path = db_path
+        # Eski sürümlerin dosya içeriklerini yazdığı dizin (veritabanının yanındaki files/)
+        self.files_dir = Path(files_dir) if files_dir else Path(db_path).parent / 'files'
+        self.search_enabled = False
+        self.pool = ConnectionPool(db_path, size=pool_size)
+        # get_user_by_id ve get_file_by_id neredeyse her istekte çağrılır
+        self.user_cache = TTLCache(max_entries=cache_entries, ttl=cache_ttl)
+        self.file_cache = TTLCache(max_entries=cache_entries, ttl=cache_ttl)
+        self._generation = 0
+        self._generation_lock = threading.Lock()
         self.init_database()
     
     def get_connection(self):
-        """SQLite bağlantısı al"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Dict-like access
-        return conn
+        """Havuzdan SQLite bağlantısı al (with bloğu olarak kullanılır)"""
+        return self.pool.connection()
+    
+    def cached(self, cache, key, load):
+        """Önbellekten oku; yoksa load() ile veritabanından al ve sakla
+
+        Okuma sürerken bir yazma olduysa (nesil değiştiyse) eski olabilecek
+        satır önbelleğe konmaz. Karşılaştırma ve yazma invalidate() ile aynı
+        kilit altında yapılır. Çağıran değiştirebileceği için kopya döner.
+        """
+        value = cache.get(key)
+        if value is None:
+            generation = self._generation
+            value = load()
+            if value is not None:
+                with self._generation_lock:
+                    if generation == self._generation:
+                        cache.set(key, value)
+        return dict(value) if value is not None else None
+    
+    def invalidate(self, cache, keys):
+        """Yazma commit edildikten sonra ilgili önbellek kayıtlarını düşür"""
+        with self._generation_lock:
+            self._generation += 1
+        for key in keys:
+            cache.invalidate(key)
+    
+    def get_stats(self):
+        """Bağlantı havuzu, satır önbellekleri ve blob deposu istatistikleri"""
+        return {
+            'pool': self.pool.get_stats(),
+            'user_cache': self.user_cache.get_stats(),
+            'file_cache': self.file_cache.get_stats(),
+            'blobs': self.get_blob_stats()
+        }
     
     def init_database(self):
         """Veritabanını başlat ve tabloları oluştur"""
@@ -54,6 +280,10 @@ class DatabaseManager:
                     path TEXT NOT NULL,
                     content TEXT DEFAULT '',
                     parent_id TEXT,
+                    language TEXT DEFAULT 'python',
+                    blob_hash TEXT,
+                    size INTEGER,
+                    search_rowid INTEGER,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (user_id) REFERENCES users(id),
@@ -62,13 +292,294 @@ class DatabaseManager:
                 )
             ''')
             
+            # Eski veritabanlarında create_file'ın yazdığı language sütunu yok
+            self.add_missing_columns(conn, 'files', {
+                'language': "TEXT DEFAULT 'python'",
+                'blob_hash': 'TEXT',
+                'size': 'INTEGER',
+                'search_rowid': 'INTEGER'
+            })
+            
+            # İçerik deposu: aynı içerik (tüm kullanıcılar arasında) bir kez saklanır,
+            # dosya satırları blob_hash ile gösterir
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS blobs (
+                    hash TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    refcount INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             # İndeksler (Performans için kritik!)
             conn.execute('CREATE INDEX IF NOT EXISTS idx_files_user_id ON files(user_id)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_files_project_id ON files(project_id)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_files_parent_id ON files(parent_id)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_projects_user_id ON projects(user_id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_files_blob_hash ON files(blob_hash)')
+            # Keyset sayfalama: (created_at, id) sırası, tür filtresiyle ve filtresiz
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_files_user_created ON files(user_id, created_at, id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_files_user_type_created ON files(user_id, type, created_at, id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_files_search_rowid ON files(search_rowid)')
+            
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            imported = {}
+            renamed = 0
+            if version < 1:
+                # Eski rename'ler torunların path'ini güncellemiyordu; zincirden yeniden hesapla
+                self.rebuild_paths(conn)
+            if version < 2:
+                # files.content'teki içerikler blob deposuna taşınır
+                self.move_contents_to_blobs(conn)
+            if version < 3:
+                conn.execute('''
+                    UPDATE files SET size = (SELECT size FROM blobs WHERE hash = files.blob_hash)
+                    WHERE blob_hash IS NOT NULL
+                ''')
+            if version < 4:
+                # İçeriği sadece diskte kalmış eski dosyalar blob deposuna alınır
+                imported = self.import_disk_files(conn)
+            if version < 5:
+                # Yol tekilliği sadece uygulamada denetleniyordu; çakışanlar ayrıştırılır
+                renamed = self.dedupe_paths(conn)
+                conn.execute('DROP INDEX IF EXISTS idx_files_user_path')
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            # Aynı konumda aynı ad: eşzamanlı oluşturma/taşıma da IntegrityError alır
+            conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_files_user_path ON files(user_id, path)')
             
+            self.search_enabled = self.init_search_index(conn)
+            if self.search_enabled and (imported or renamed):
+                self.rebuild_search_index(conn)
+            
+            conn.commit()
+        # Disk kopyaları ancak içerik veritabanına yazıldıktan sonra silinir
+        for file_path in imported.values():
+            file_path.unlink(missing_ok=True)
+    
+    def add_missing_columns(self, conn, table, columns):
+        """Tabloda olmayan sütunları ekle (basit şema migration'ı)"""
+        existing = {row['name'] for row in conn.execute(f'PRAGMA table_info({table})')}
+        for name, definition in columns.items():
+            if name not in existing:
+                conn.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+    
+    def rebuild_paths(self, conn):
+        """Tüm path değerlerini parent_id zincirinden (ad/ad/...) yeniden hesapla"""
+        conn.execute('''
+            WITH RECURSIVE tree(id, path, depth) AS (
+                SELECT id, name, 0 FROM files
+                WHERE parent_id IS NULL OR parent_id NOT IN (SELECT id FROM files)
+                UNION ALL
+                SELECT files.id, tree.path || '/' || files.name, tree.depth + 1
+                FROM files JOIN tree ON files.parent_id = tree.id
+                WHERE tree.depth < 256
+            )
+            UPDATE files SET path = (SELECT path FROM tree WHERE tree.id = files.id)
+            WHERE id IN (SELECT id FROM tree)
+        ''')
+    
+    def dedupe_paths(self, conn):
+        """Aynı kullanıcıda aynı path'i paylaşan fazla kayıtları "ad (2).py" gibi yeniden adlandır
+
+        En eski kayıt adını korur. Önce en üst düzeydeki çakışmalar çözülür;
+        path'ler parent_id zincirinden yeniden hesaplandığı için ayrışan
+        klasörlerin alt dosyaları da ayrışır. Yeniden adlandırılan kayıt sayısını döner.
+        """
+        renamed = 0
+        while True:
+            self.rebuild_paths(conn)
+            groups = conn.execute('''
+                SELECT user_id, path FROM files
+                GROUP BY user_id, path HAVING COUNT(*) > 1
+            ''').fetchall()
+            if not groups:
+                return renamed
+            depth = min(group['path'].count('/') for group in groups)
+            for group in groups:
+                if group['path'].count('/') != depth:
+                    continue
+                parent_path = group['path'].rpartition('/')[0]
+                rows = conn.execute('''
+                    SELECT id, name, type FROM files WHERE user_id = ? AND path = ?
+                    ORDER BY created_at, rowid
+                ''', (group['user_id'], group['path'])).fetchall()
+                for row in rows[1:]:
+                    stem, ext = os.path.splitext(row['name'])
+                    number = 2
+                    while True:
+                        new_name = f'{stem} ({number}){ext}'
+                        new_path = f'{parent_path}/{new_name}' if parent_path else new_name
+                        taken = conn.execute(
+                            'SELECT 1 FROM files WHERE user_id = ? AND path = ?',
+                            (group['user_id'], new_path)
+                        ).fetchone()
+                        if not taken:
+                            break
+                        number += 1
+                    conn.execute(
+                        'UPDATE files SET name = ?, path = ? WHERE id = ?', (new_name, new_path, row['id'])
+                    )
+                    if row['type'] == 'project':
+                        conn.execute('UPDATE projects SET name = ? WHERE id = ?', (new_name, row['id']))
+                    renamed += 1
+    
+    def move_contents_to_blobs(self, conn):
+        """Eski files.content değerlerini blob deposuna taşı"""
+        rows = conn.execute('''
+            SELECT id, content FROM files
+            WHERE blob_hash IS NULL AND content IS NOT NULL AND content != ''
+        ''').fetchall()
+        for row in rows:
+            conn.execute(
+                "UPDATE files SET blob_hash = ?, content = '' WHERE id = ?",
+                (self.store_blob(conn, row['content']), row['id'])
+            )
+    
+    def import_disk_files(self, conn, files_dir=None):
+        """Blob'u olmayan dosyaların içeriğini diskteki kopyalarından depoya al
+
+        updated_at değişmez. {dosya id: disk yolu} döner; çağıran disk
+        kopyalarını commit'ten sonra siler.
+        """
+        files_dir = Path(files_dir) if files_dir else self.files_dir
+        rows = conn.execute('''
+            SELECT id, user_id, name, path, search_rowid FROM files
+            WHERE type = 'file' AND blob_hash IS NULL
+        ''').fetchall()
+        imported = {}
+        for row in rows:
+            file_path = files_dir / row['user_id'] / row['path']
+            try:
+                content = file_path.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError):
+                continue
+            conn.execute(
+                'UPDATE files SET blob_hash = ?, size = ? WHERE id = ?',
+                (self.store_blob(conn, content), content_size(content), row['id'])
+            )
+            if self.search_enabled:
+                self.reindex_content(conn, row['id'], row, content)
+            imported[row['id']] = file_path
+        return imported
+    
+    # ARAMA İNDEKSİ
+    def init_search_index(self, conn):
+        """FTS5 arama indeksini oluştur (ilk kez oluşuyorsa mevcut dosyalarla doldur); FTS5 yoksa False"""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'files_fts'").fetchone()
+        if exists:
+            return True
+        try:
+            conn.execute('''
+                CREATE VIRTUAL TABLE files_fts USING fts5(
+                    name, path, content,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            print("⚠️ SQLite FTS5 desteği yok, dosya arama kapalı")
+            return False
+        self.rebuild_search_index(conn)
+        return True
+    
+    def rebuild_search_index(self, conn):
+        """Arama indeksini tüm dosyalardan baştan oluştur"""
+        conn.execute('DELETE FROM files_fts')
+        rows = conn.execute('''
+            SELECT files.id, files.name, files.path, blobs.content
+            FROM files LEFT JOIN blobs ON blobs.hash = files.blob_hash
+        ''').fetchall()
+        for row in rows:
+            self.index_file(conn, row['id'], row['name'], row['path'], row['content'] or '')
+    
+    def index_file(self, conn, file_id, name, path, content):
+        """Dosyayı arama indeksine ekle; indeks satırı files.search_rowid ile bağlanır"""
+        rowid = conn.execute(
+            'INSERT INTO files_fts (name, path, content) VALUES (?, ?, ?)',
+            (name, path, content)
+        ).lastrowid
+        conn.execute('UPDATE files SET search_rowid = ? WHERE id = ?', (rowid, file_id))
+    
+    def unindex_files(self, conn, search_rowids):
+        """Silinen dosyaların indeks satırlarını kaldır"""
+        if self.search_enabled:
+            conn.executemany(
+                'DELETE FROM files_fts WHERE rowid = ?',
+                [(rowid,) for rowid in search_rowids if rowid is not None]
+            )
+    
+    def search_files(self, user_id, query, project_id=None, limit=20):
+        """Kullanıcının dosyalarında ad, yol ve içerikte tam metin arama (en alakalı önce)"""
+        match = fts_query(query)
+        if not match:
+            return []
+        where = 'files_fts MATCH ? AND files.user_id = ?'
+        params = [SNIPPET_START, SNIPPET_END, match, user_id]
+        if project_id:
+            where += ' AND files.project_id = ?'
+            params.append(project_id)
+        params.append(limit)
+        with self.get_connection() as conn:
+            # CROSS JOIN: önce FTS eşleşmeleri, sonra search_rowid indeksiyle dosyalar
+            # bm25: ad eşleşmesi yoldan, yol eşleşmesi içerikten daha değerli
+            rows = conn.execute(f'''
+                SELECT files.id, files.name, files.path, files.type, files.project_id, files.updated_at,
+                       snippet(files_fts, -1, ?, ?, '…', 16) AS snippet,
+                       bm25(files_fts, 10.0, 4.0, 1.0) AS score
+                FROM files_fts
+                CROSS JOIN files ON files.search_rowid = files_fts.rowid
+                WHERE {where}
+                ORDER BY score
+                LIMIT ?
+            ''', params).fetchall()
+        return [
+            {**dict(row), 'snippet': snippet_segments(row['snippet']), 'score': -row['score']}
+            for row in rows
+        ]
+    
+    # BLOB İŞLEMLERİ
+    def store_blob(self, conn, content):
+        """İçeriği blob olarak sakla (zaten varsa sadece referansını artır); özetini döndür"""
+        digest = content_hash(content)
+        conn.execute('''
+            INSERT INTO blobs (hash, content, size, refcount)
+            VALUES (?, ?, ?, 1)
+            ON CONFLICT(hash) DO UPDATE SET refcount = refcount + 1
+        ''', (digest, content, content_size(content)))
+        return digest
+    
+    def release_blobs(self, conn, hashes):
+        """Blobların referanslarını dosya satırlarından yeniden say, sahipsiz kalanları sil"""
+        params = [(digest,) for digest in set(hashes) if digest]
+        conn.executemany('''
+            UPDATE blobs SET refcount = (SELECT COUNT(*) FROM files WHERE blob_hash = blobs.hash)
+            WHERE hash = ?
+        ''', params)
+        conn.executemany('DELETE FROM blobs WHERE hash = ? AND refcount = 0', params)
+    
+    def collect_garbage(self):
+        """Tüm referans sayılarını düzelt ve sahipsiz blobları sil; silinen blob sayısını döndür"""
+        with self.get_connection() as conn:
+            conn.execute('''
+                UPDATE blobs SET refcount = (SELECT COUNT(*) FROM files WHERE blob_hash = blobs.hash)
+            ''')
+            deleted = conn.execute('DELETE FROM blobs WHERE refcount = 0').rowcount
             conn.commit()
+            return deleted
+    
+    def get_blob_stats(self):
+        """Blob deposu boyutu ve tekilleştirmeyle kazanılan alan"""
+        with self.get_connection() as conn:
+            row = conn.execute('''
+                SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(size * refcount), 0)
+                FROM blobs
+            ''').fetchone()
+            return {
+                'blobs': row[0],
+                'stored_bytes': row[1],
+                'referenced_bytes': row[2],
+                'deduplicated_bytes': row[2] - row[1]
+            }
     
     # USER İŞLEMLERİ
     def create_user(self, user_data):
@@ -85,6 +596,7 @@ class DatabaseManager:
                 user_data['created_at']
             ))
             conn.commit()
+        self.invalidate(self.user_cache, [user_data['id']])
     
     def get_user_by_username(self, username):
         """Kullanıcıyı username ile bul"""
@@ -97,14 +609,16 @@ class DatabaseManager:
             return dict(row) if row else None
     
     def get_user_by_id(self, user_id):
-        """Kullanıcıyı ID ile bul"""
-        with self.get_connection() as conn:
-            cursor = conn.execute(
-                'SELECT * FROM users WHERE id = ?', 
-                (user_id,)
-            )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        """Kullanıcıyı ID ile bul (önbellekli)"""
+        def load():
+            with self.get_connection() as conn:
+                cursor = conn.execute(
+                    'SELECT * FROM users WHERE id = ?', 
+                    (user_id,)
+                )
+                row = cursor.fetchone()
+                return dict(row) if row else None
+        return self.cached(self.user_cache, user_id, load)
     
     def check_username_exists(self, username):
         """Username var mı kontrol et"""
@@ -125,13 +639,20 @@ class DatabaseManager:
             return cursor.fetchone()[0] > 0
     
     def delete_user(self, user_id):
-        """Kullanıcıyı ve tüm verilerini sil"""
+        """Kullanıcıyı ve tüm verilerini tek işlemde sil; silinen dosya sayısını döndür"""
         with self.get_connection() as conn:
-            # Önce kullanıcının projelerini sil
+            rows = conn.execute(
+                'SELECT id, blob_hash, search_rowid FROM files WHERE user_id = ?', (user_id,)
+            ).fetchall()
+            deleted = conn.execute('DELETE FROM files WHERE user_id = ?', (user_id,)).rowcount
+            self.release_blobs(conn, [row['blob_hash'] for row in rows])
+            self.unindex_files(conn, [row['search_rowid'] for row in rows])
             conn.execute('DELETE FROM projects WHERE user_id = ?', (user_id,))
-            # Sonra kullanıcıyı sil
             conn.execute('DELETE FROM users WHERE id = ?', (user_id,))
             conn.commit()
+        self.invalidate(self.file_cache, [row['id'] for row in rows])
+        self.invalidate(self.user_cache, [user_id])
+        return deleted
     
     # PROJECT İŞLEMLERİ
     def create_project(self, project_data):
@@ -161,21 +682,40 @@ class DatabaseManager:
             return [dict(row) for row in cursor.fetchall()]
     
     def delete_project(self, project_id):
-        """Projeyi sil (CASCADE)"""
+        """Projeyi, proje klasörünün tüm alt ağacıyla birlikte tek işlemde sil"""
         with self.get_connection() as conn:
-            # Önce projedeki dosyaları sil
-            conn.execute('DELETE FROM files WHERE project_id = ?', (project_id,))
-            # Sonra projeyi sil
+            # project_id'si olmayan iç içe klasör çocukları da alt ağaçla bulunur
+            rows = conn.execute(f'''
+                {SUBTREE_CTE}
+                SELECT id, blob_hash, search_rowid FROM files
+                WHERE id IN (SELECT id FROM subtree) OR project_id = ?
+            ''', (project_id, project_id)).fetchall()
+            # WITH ile başlayan sorguda rowcount -1 döner; total_changes farkı kullanılır
+            before = conn.total_changes
+            conn.execute(f'''
+                {SUBTREE_CTE}
+                DELETE FROM files
+                WHERE id IN (SELECT id FROM subtree) OR project_id = ?
+            ''', (project_id, project_id))
+            deleted = conn.total_changes - before
+            self.release_blobs(conn, [row['blob_hash'] for row in rows])
+            self.unindex_files(conn, [row['search_rowid'] for row in rows])
             conn.execute('DELETE FROM projects WHERE id = ?', (project_id,))
             conn.commit()
+        self.invalidate(self.file_cache, [row['id'] for row in rows])
+        return deleted
     
     # FILE İŞLEMLERİ
     def create_file(self, file_data):
-        """Yeni dosya oluştur"""
+        """Yeni dosya oluştur (içerik blob deposuna yazılır)"""
         with self.get_connection() as conn:
+            # İçeriği verilmeyen (eski diskteki) dosyalar import_disk_files ile alınır
+            digest = None
+            if file_data['type'] == 'file' and file_data.get('content') is not None:
+                digest = self.store_blob(conn, file_data['content'])
             conn.execute('''
-                INSERT INTO files (id, user_id, project_id, name, type, path, content, parent_id, language, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO files (id, user_id, project_id, name, type, path, blob_hash, size, parent_id, language, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 file_data['id'],
                 file_data['user_id'],
@@ -183,77 +723,241 @@ class DatabaseManager:
                 file_data['name'],
                 file_data['type'],
                 file_data['path'],
-                file_data.get('content', ''),
+                digest,
+                content_size(file_data['content']) if digest else None,
                 file_data.get('parent_id'),
                 file_data.get('language', 'python'),
                 file_data['created_at'],
                 file_data['updated_at']
             ))
+            if self.search_enabled:
+                self.index_file(conn, file_data['id'], file_data['name'], file_data['path'],
+                                file_data.get('content') or '')
             conn.commit()
+        self.invalidate(self.file_cache, [file_data['id']])
     
     def get_user_files(self, user_id):
-        """Kullanıcının tüm dosyalarını getir"""
+        """Kullanıcının tüm dosyalarını getir (sadece üst veri, içerik okunmaz)"""
         with self.get_connection() as conn:
-            cursor = conn.execute('''
-                SELECT * FROM files 
+            cursor = conn.execute(f'''
+                SELECT {FILE_META_COLUMNS} FROM files 
                 WHERE user_id = ? 
                 ORDER BY created_at DESC
             ''', (user_id,))
             return [dict(row) for row in cursor.fetchall()]
     
+    def list_user_files(self, user_id, limit=None, after=None, fields=None, file_type=None):
+        """Kullanıcının dosyaları (yeniden eskiye) ve sonraki sayfanın anahtarı
+
+        (created_at, id) üzerinde keyset sayfalama: after önceki sayfanın son
+        satırının [created_at, id] ikilisidir. OFFSET kullanılmadığı için her
+        sayfa indeksten hesap büyüklüğünden bağımsız sürede okunur.
+        """
+        fields = list(fields or FILE_META_FIELDS)
+        columns = [FILE_COMPUTED_FIELDS[name] + f' AS {name}' if name in FILE_COMPUTED_FIELDS else name
+                   for name in fields]
+        where = ['user_id = ?']
+        params = [user_id]
+        if file_type:
+            where.append('type = ?')
+            params.append(file_type)
+        if after:
+            where.append('(created_at, id) < (?, ?)')
+            params.extend(after)
+        query = f'''
+            SELECT {', '.join(columns)}, id AS _id, created_at AS _created_at
+            FROM files
+            WHERE {' AND '.join(where)}
+            ORDER BY created_at DESC, id DESC
+        '''
+        if limit:
+            # Bir fazlası okunur: gelirse sonraki sayfa var demektir
+            query += ' LIMIT ?'
+            params.append(limit + 1)
+
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        next_key = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_key = [rows[-1]['_created_at'], rows[-1]['_id']]
+        return [{name: row[name] for name in fields} for row in rows], next_key
+    
     def get_project_files(self, project_id):
-        """Projedeki dosyaları getir"""
+        """Projedeki dosyaları getir (sadece üst veri, içerik okunmaz)"""
         with self.get_connection() as conn:
-            cursor = conn.execute('''
-                SELECT * FROM files 
+            cursor = conn.execute(f'''
+                SELECT {FILE_META_COLUMNS} FROM files 
                 WHERE project_id = ? 
                 ORDER BY type DESC, name ASC
             ''', (project_id,))
             return [dict(row) for row in cursor.fetchall()]
     
     def get_file_by_id(self, file_id):
-        """Dosyayı ID ile getir"""
+        """Dosyanın üst verisini ID ile getir (önbellekli; içerik için get_file_content)"""
+        def load():
+            with self.get_connection() as conn:
+                cursor = conn.execute(
+                    f'SELECT {FILE_META_COLUMNS} FROM files WHERE id = ?',
+                    (file_id,)
+                )
+                row = cursor.fetchone()
+                return dict(row) if row else None
+        return self.cached(self.file_cache, file_id, load)
+    
+    def get_file_content(self, file_id):
+        """Dosyanın içeriği (blob deposundan); blob yoksa None"""
+        with self.get_connection() as conn:
+            row = conn.execute('''
+                SELECT blobs.content FROM files
+                JOIN blobs ON blobs.hash = files.blob_hash
+                WHERE files.id = ?
+            ''', (file_id,)).fetchone()
+            return row[0] if row else None
+    
+    def update_file_content(self, file_id, content):
+        """Dosya içeriğini güncelle; içerik değişmediyse sadece updated_at yazılır"""
+        with self.get_connection() as conn:
+            row = conn.execute(
+                'SELECT name, path, blob_hash, search_rowid FROM files WHERE id = ?', (file_id,)
+            ).fetchone()
+            if not row:
+                return
+            now = datetime.now().isoformat()
+            if row['blob_hash'] == content_hash(content):
+                conn.execute('UPDATE files SET updated_at = ? WHERE id = ?', (now, file_id))
+            else:
+                conn.execute('''
+                    UPDATE files 
+                    SET blob_hash = ?, size = ?, content = '', updated_at = ? 
+                    WHERE id = ?
+                ''', (self.store_blob(conn, content), content_size(content), now, file_id))
+                self.release_blobs(conn, [row['blob_hash']])
+                if self.search_enabled:
+                    self.reindex_content(conn, file_id, row, content)
+            conn.commit()
+        self.invalidate(self.file_cache, [file_id])
+    
+    def reindex_content(self, conn, file_id, row, content):
+        """Değişen içeriği arama indeksine yaz (indekslenmemiş eski dosya ise ekle)"""
+        if row['search_rowid'] is None:
+            self.index_file(conn, file_id, row['name'], row['path'], content)
+        else:
+            conn.execute(
+                'UPDATE files_fts SET content = ? WHERE rowid = ?', (content, row['search_rowid'])
+            )
+    
+    def get_file_by_path(self, user_id, path):
+        """Kullanıcının dosyasını tam yoluyla bul"""
         with self.get_connection() as conn:
             cursor = conn.execute(
-                'SELECT * FROM files WHERE id = ?', 
-                (file_id,)
+                f'SELECT {FILE_META_COLUMNS} FROM files WHERE user_id = ? AND path = ?',
+                (user_id, path)
             )
             row = cursor.fetchone()
             return dict(row) if row else None
     
-    def update_file_content(self, file_id, content):
-        """Dosya içeriğini güncelle"""
+    def get_subtree(self, file_id):
+        """Dosyanın kendisi ve tüm torunları (yola göre sıralı)"""
         with self.get_connection() as conn:
+            root = conn.execute('SELECT user_id, path FROM files WHERE id = ?', (file_id,)).fetchone()
+            if not root:
+                return []
+            cursor = conn.execute(f'''
+                SELECT {FILE_META_COLUMNS} FROM files
+                WHERE user_id = :user_id AND {SUBTREE_RANGE}
+                ORDER BY path
+            ''', {'user_id': root['user_id'], 'path': root['path']})
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def move_file(self, file_id, new_parent_id, new_name):
+        """Dosyayı/klasörü taşı ve/veya yeniden adlandır; yeni path'i döndür
+
+        Torunların path'leri (ve başka projeye taşınınca project_id'leri)
+        aynı işlemde tek UPDATE ile güncellenir.
+        """
+        with self.get_connection() as conn:
+            node = conn.execute(
+                'SELECT user_id, type, path, project_id FROM files WHERE id = ?', (file_id,)
+            ).fetchone()
+            if not node:
+                return None
+            parent = None
+            if new_parent_id:
+                parent = conn.execute(
+                    'SELECT id, type, path, project_id FROM files WHERE id = ?', (new_parent_id,)
+                ).fetchone()
+            new_path = f"{parent['path']}/{new_name}" if parent else new_name
+
+            if node['type'] == 'project':
+                project_id = node['project_id']
+            elif parent:
+                project_id = parent['id'] if parent['type'] == 'project' else parent['project_id']
+            else:
+                project_id = None
+
+            now = datetime.now().isoformat()
+            old_path = node['path']
+            moved_ids = [file_id] + [row[0] for row in conn.execute('''
+                SELECT id FROM files
+                WHERE user_id = ? AND path >= ? || '/' AND path < ? || '0'
+            ''', (node['user_id'], old_path, old_path))]
+            conn.execute('''
+                UPDATE files
+                SET path = ? || substr(path, ?), project_id = ?, updated_at = ?
+                WHERE user_id = ? AND path >= ? || '/' AND path < ? || '0'
+            ''', (new_path, len(old_path) + 1, project_id, now,
+                  node['user_id'], old_path, old_path))
             conn.execute('''
-                UPDATE files 
-                SET content = ?, updated_at = ? 
+                UPDATE files
+                SET name = ?, parent_id = ?, path = ?, project_id = ?, updated_at = ?
                 WHERE id = ?
-            ''', (content, datetime.now().isoformat(), file_id))
+            ''', (new_name, new_parent_id, new_path, project_id, now, file_id))
+            if node['type'] == 'project':
+                conn.execute(
+                    'UPDATE projects SET name = ?, updated_at = ? WHERE id = ?',
+                    (new_name, now, file_id)
+                )
+            if self.search_enabled:
+                moved = conn.execute(f'''
+                    SELECT name, path, search_rowid FROM files
+                    WHERE user_id = :user_id AND {SUBTREE_RANGE} AND search_rowid IS NOT NULL
+                ''', {'user_id': node['user_id'], 'path': new_path}).fetchall()
+                conn.executemany(
+                    'UPDATE files_fts SET name = ?, path = ? WHERE rowid = ?',
+                    [(row['name'], row['path'], row['search_rowid']) for row in moved]
+                )
             conn.commit()
+        self.invalidate(self.file_cache, moved_ids)
+        return new_path
     
     def rename_file(self, file_id, new_name):
-        """Dosya adını değiştir"""
+        """Dosya adını değiştir (torunların path'leri dahil); yeni path'i döndür"""
         with self.get_connection() as conn:
-            conn.execute('''
-                UPDATE files 
-                SET name = ?, updated_at = ? 
-                WHERE id = ?
-            ''', (new_name, datetime.now().isoformat(), file_id))
-            conn.commit()
+            row = conn.execute('SELECT parent_id FROM files WHERE id = ?', (file_id,)).fetchone()
+            if not row:
+                return None
+            return self.move_file(file_id, row['parent_id'], new_name)
     
     def delete_file(self, file_id):
-        """Dosyayı sil (recursive)"""
+        """Dosyayı tüm alt ağacıyla tek sorguda sil; silinen satır sayısını döndür"""
         with self.get_connection() as conn:
-            # Önce alt dosyaları sil (recursive)
-            cursor = conn.execute('SELECT id FROM files WHERE parent_id = ?', (file_id,))
-            child_ids = [row[0] for row in cursor.fetchall()]
-            
-            for child_id in child_ids:
-                self.delete_file(child_id)  # Recursive delete
-            
-            # Sonra dosyayı kendisini sil
-            conn.execute('DELETE FROM files WHERE id = ?', (file_id,))
+            rows = conn.execute(f'''
+                {SUBTREE_CTE}
+                SELECT id, blob_hash, search_rowid FROM files WHERE id IN (SELECT id FROM subtree)
+            ''', (file_id,)).fetchall()
+            before = conn.total_changes
+            conn.execute(f'''
+                {SUBTREE_CTE}
+                DELETE FROM files WHERE id IN (SELECT id FROM subtree)
+            ''', (file_id,))
+            deleted = conn.total_changes - before
+            self.release_blobs(conn, [row['blob_hash'] for row in rows])
+            self.unindex_files(conn, [row['search_rowid'] for row in rows])
             conn.commit()
+        self.invalidate(self.file_cache, [row['id'] for row in rows])
+        return deleted
     
     # MIGRATION İŞLEMLERİ
     def migrate_from_json(self, json_data_dir='data'):
@@ -300,7 +1004,7 @@ class DatabaseManager:
                                     'name': file_info['name'],
                                     'type': file_info['type'],
                                     'path': file_info['path'],
-                                    'content': '',  # İçerik dosyadan okunacak
+                                    'content': None,  # İçerik aşağıda diskten alınır
                                     'parent_id': file_info.get('parent_id'),
                                     'created_at': file_info['created_at'],
                                     'updated_at': file_info.get('updated_at', file_info['created_at'])
@@ -320,6 +1024,13 @@ class DatabaseManager:
                                 print(f"✅ File migrated: {file_info['name']}")
                             except Exception as e:
                                 print(f"❌ File migration error: {e}")
+            
+            with self.get_connection() as conn:
+                imported = self.import_disk_files(conn, files_dir)
+                conn.commit()
+            for file_path in imported.values():
+                file_path.unlink(missing_ok=True)
+            self.invalidate(self.file_cache, list(imported))
         
         print("🎉 Migration tamamlandı!")
 
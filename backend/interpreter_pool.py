@@ -0,0 +1,399 @@
+"""Önceden ısıtılmış Python yorumlayıcı havuzu (zygote/forkserver)
+
+Her zygote süreci kurulum kodunu ve ağır kütüphaneleri bir kez yükler; her
+çalıştırma bu sıcak süreçten fork edilen temiz bir çocukla yapılır. Böylece
+matplotlib/cv2/pygame gibi kütüphanelerin soğuk import maliyeti her
+çalıştırmada tekrar ödenmez.
+
+Fork ve SCM_RIGHTS gerektirdiği için sadece POSIX sistemlerde çalışır; diğer
+platformlarda spawn() None döner ve çağıran soğuk başlatmaya geri düşer.
+"""
+import atexit
+import os
+import queue
+import select
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from output_capture import feed_stdin
+from process_group import signal_group
+from resource_usage import create_report_pipe
+from scheduler import MAX_CONCURRENT_RUNS
+from zygote import recv_message, send_message
+
+ZYGOTE_SCRIPT = Path(__file__).parent / 'zygote.py'
+
+# Havuz ayarları (ortam değişkenleriyle değiştirilebilir)
+# Zygote aynı anda tek çalıştırmaya hizmet eder; zamanlayıcının izin verdiği her
+# eşzamanlı çalıştırma için bir zygote olmalı
+POOL_SIZE = int(os.environ.get('EXECUTION_POOL_SIZE', str(MAX_CONCURRENT_RUNS)))
+MAX_RUNS_PER_WORKER = int(os.environ.get('EXECUTION_POOL_MAX_RUNS', '200'))
+HEALTH_CHECK_INTERVAL = float(os.environ.get('EXECUTION_POOL_HEALTH_INTERVAL', '30'))
+# Boş zygote yoksa beklemek soğuk başlatmadan yavaştır; varsayılan hemen soğuk başlat
+ACQUIRE_TIMEOUT = float(os.environ.get('EXECUTION_POOL_ACQUIRE_TIMEOUT', '0'))
+STARTUP_TIMEOUT = 60
+
+
+def is_supported():
+    """Bu platformda zygote havuzu kullanılabilir mi?"""
+    return (
+        hasattr(os, 'fork')
+        and hasattr(socket, 'AF_UNIX')
+        and hasattr(socket, 'send_fds')
+    )
+
+
+class WorkerError(Exception):
+    """Zygote süreci ile iletişim hatası"""
+
+
+class ZygoteWorker:
+    """Tek bir sıcak zygote süreci"""
+
+    def __init__(self, setup_code, preload=(), env=None):
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, str(ZYGOTE_SCRIPT), str(child_sock.fileno())],
+                pass_fds=(child_sock.fileno(),),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                env=env
+            )
+        except Exception:
+            parent_sock.close()
+            raise
+        finally:
+            child_sock.close()
+
+        self.sock = parent_sock
+        self.runs = 0
+        self.last_health_check = time.monotonic()
+
+        try:
+            send_message(self.sock, {'setup_code': setup_code, 'preload': list(preload)})
+            reply = self._recv(timeout=STARTUP_TIMEOUT)
+        except Exception:
+            self.close()
+            raise
+        if not reply.get('ready'):
+            self.close()
+            raise WorkerError(reply.get('error', 'Zygote başlatılamadı'))
+
+    def _recv(self, timeout=None):
+        """Zygote'tan bir mesaj bekle (timeout'ta TimeoutError)"""
+        readable, _, _ = select.select([self.sock], [], [], timeout)
+        if not readable:
+            raise TimeoutError('Zygote yanıt vermedi')
+        message, fds = recv_message(self.sock)
+        for fd in fds:
+            os.close(fd)
+        if message is None:
+            raise WorkerError('Zygote bağlantısı kapandı')
+        return message
+
+    def is_alive(self):
+        return self.process.poll() is None
+
+    def ping(self, timeout=5):
+        """Sağlık kontrolü: zygote canlı ve yanıt veriyor mu?"""
+        try:
+            send_message(self.sock, {'op': 'ping'})
+            reply = self._recv(timeout=timeout)
+        except Exception:
+            return False
+        self.last_health_check = time.monotonic()
+        return bool(reply.get('pong'))
+
+    def run(self, code, stdin=None):
+        """Kullanıcı kodunu fork edilmiş bir çocukta başlat (stdin: byte veya None)"""
+        if stdin is None:
+            stdin_r, stdin_w = os.open(os.devnull, os.O_RDONLY), None
+        else:
+            stdin_r, stdin_w = os.pipe()
+        stdout_r, stdout_w = os.pipe()
+        stderr_r, stderr_w = os.pipe()
+        report_r, report_w = create_report_pipe()
+        artifacts_r, artifacts_w = os.pipe()
+        try:
+            send_message(
+                self.sock,
+                {'op': 'run', 'code': code},
+                fds=(stdin_r, stdout_w, stderr_w, report_w, artifacts_w)
+            )
+        except Exception:
+            os.close(stdout_r)
+            os.close(stderr_r)
+            os.close(report_r)
+            os.close(artifacts_r)
+            if stdin_w is not None:
+                os.close(stdin_w)
+            raise
+        finally:
+            # Yazma uçları artık sadece çocukta açık kalmalı (EOF için)
+            os.close(stdin_r)
+            os.close(stdout_w)
+            os.close(stderr_w)
+            os.close(report_w)
+            os.close(artifacts_w)
+
+        if stdin_w is not None:
+            feed_stdin(stdin_w, stdin)
+
+        stdout = os.fdopen(stdout_r, 'r', encoding='utf-8', errors='replace')
+        stderr = os.fdopen(stderr_r, 'r', encoding='utf-8', errors='replace')
+        artifacts = os.fdopen(artifacts_r, 'rb')
+        try:
+            reply = self._recv(timeout=STARTUP_TIMEOUT)
+            if 'pid' not in reply:
+                raise WorkerError(reply.get('error', 'Çocuk süreç başlatılamadı'))
+        except Exception:
+            stdout.close()
+            stderr.close()
+            artifacts.close()
+            os.close(report_r)
+            raise
+        self.runs += 1
+        return reply['pid'], stdout, stderr, report_r, artifacts
+
+    def close(self):
+        """Zygote'u kapat (soket kapanınca zygote kendiliğinden çıkar)"""
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+class PooledProcess:
+    """Zygote'tan fork edilmiş çocuk için subprocess.Popen benzeri arayüz"""
+
+    def __init__(self, pool, worker, pid, stdout, stderr, report_fd=None, artifacts=None):
+        self._pool = pool
+        self._worker = worker
+        self.pid = pid
+        self.stdin = None
+        self.stdout = stdout
+        self.stderr = stderr
+        self.artifacts = artifacts  # Grafik/görüntü kanalı (JSON satırları)
+        self.returncode = None
+        self.rusage = None  # Zygote'un wait4 ile ölçtüğü CPU/bellek
+        self.orphans_killed = None  # Zygote'un çıkıştan sonra öldürdüğü alt süreçler
+        self.report_fd = report_fd
+        self._readers = None
+        self._chunks = {'stdout': [], 'stderr': [], 'artifacts': []}
+
+    def wait(self, timeout=None):
+        if self.returncode is not None:
+            return self.returncode
+        try:
+            reply = self._worker._recv(timeout=timeout)
+        except TimeoutError:
+            raise subprocess.TimeoutExpired([self.pid], timeout)
+        except Exception:
+            # Zygote öldü: çocuğun durumu bilinmiyor
+            self.returncode = -signal.SIGKILL
+            self._pool.discard(self._worker)
+            return self.returncode
+
+        self.returncode = reply.get('returncode', -1)
+        self.rusage = reply.get('rusage')
+        self.orphans_killed = reply.get('orphans_killed')
+        self._pool.release(self._worker)
+        return self.returncode
+
+    def poll(self):
+        try:
+            return self.wait(timeout=0)
+        except subprocess.TimeoutExpired:
+            return None
+
+    def send_signal(self, sig):
+        """Sinyali çocuğun süreç grubuna (başlattığı alt süreçler dahil) gönder"""
+        if self.returncode is None:
+            signal_group(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+    def _start_readers(self):
+        def read_all(name, stream):
+            try:
+                self._chunks[name].append(stream.read())
+            finally:
+                stream.close()
+
+        self._readers = [
+            threading.Thread(target=read_all, args=('stdout', self.stdout), daemon=True),
+            threading.Thread(target=read_all, args=('stderr', self.stderr), daemon=True),
+        ]
+        if self.artifacts is not None:
+            # Kanal dolup çocuğu bloklamasın; artifact'ler burada kullanılmaz
+            self._readers.append(
+                threading.Thread(target=read_all, args=('artifacts', self.artifacts), daemon=True)
+            )
+        for reader in self._readers:
+            reader.start()
+
+    def communicate(self, input=None, timeout=None):
+        """Çıktıları oku ve sürecin bitmesini bekle (Popen.communicate gibi)"""
+        if self._readers is None:
+            self._start_readers()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.wait(timeout=timeout)
+        for reader in self._readers:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            reader.join(remaining)
+            if reader.is_alive():
+                raise subprocess.TimeoutExpired([self.pid], timeout)
+
+        return ''.join(self._chunks['stdout']), ''.join(self._chunks['stderr'])
+
+
+class InterpreterPool:
+    """Sabit boyutlu zygote havuzu: sağlık kontrolü ve N çalıştırmada bir yenileme"""
+
+    def __init__(self, setup_code, preload=(), size=POOL_SIZE, max_runs=MAX_RUNS_PER_WORKER,
+                 health_check_interval=HEALTH_CHECK_INTERVAL, env=None):
+        self.setup_code = setup_code
+        self.preload = list(preload)
+        self.size = size
+        self.max_runs = max_runs
+        self.health_check_interval = health_check_interval
+        self.env = env
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = set()
+        self._started = False
+        self._closed = False
+        self.stats = {'runs': 0, 'recycled': 0, 'failed_health_checks': 0, 'spawn_errors': 0}
+
+    @property
+    def enabled(self):
+        return self.size > 0 and is_supported() and not self._closed
+
+    def start(self, wait=False):
+        """Zygote'ları başlat (varsayılan olarak arka planda)"""
+        with self._lock:
+            if self._started or not self.enabled:
+                return
+            self._started = True
+
+        threads = [
+            threading.Thread(target=self._spawn_worker, daemon=True)
+            for _ in range(self.size)
+        ]
+        for thread in threads:
+            thread.start()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _spawn_worker(self):
+        try:
+            worker = ZygoteWorker(self.setup_code, preload=self.preload, env=self.env)
+        except Exception as e:
+            self.stats['spawn_errors'] += 1
+            print(f"⚠️ Zygote başlatılamadı: {e}")
+            return
+        with self._lock:
+            if self._closed:
+                worker.close()
+                return
+            self._workers.add(worker)
+        self._idle.put(worker)
+
+    def _replace(self, worker):
+        """Bozuk/eskimiş zygote'u kapat ve yerine yenisini arka planda başlat"""
+        with self._lock:
+            self._workers.discard(worker)
+        worker.close()
+        if not self._closed:
+            threading.Thread(target=self._spawn_worker, daemon=True).start()
+
+    def _is_healthy(self, worker):
+        if not worker.is_alive():
+            return False
+        if time.monotonic() - worker.last_health_check < self.health_check_interval:
+            return True
+        return worker.ping()
+
+    def acquire(self, timeout=ACQUIRE_TIMEOUT):
+        """Sağlıklı bir boşta zygote al; timeout içinde boşalan yoksa None (timeout=0: beklemeden)"""
+        self.start()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                worker = self._idle.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                return None
+            if self._is_healthy(worker):
+                return worker
+            self.stats['failed_health_checks'] += 1
+            self._replace(worker)
+
+    def release(self, worker):
+        """Çalıştırması biten zygote'u havuza geri koy veya yenile"""
+        if worker.runs >= self.max_runs or not worker.is_alive():
+            self.stats['recycled'] += 1
+            self._replace(worker)
+        else:
+            self._idle.put(worker)
+
+    def discard(self, worker):
+        self._replace(worker)
+
+    def spawn(self, code, stdin=None, acquire_timeout=ACQUIRE_TIMEOUT):
+        """Kodu sıcak bir zygote'tan fork ederek başlat; havuz kullanılamıyorsa None"""
+        if not self.enabled:
+            return None
+        worker = self.acquire(timeout=acquire_timeout)
+        if worker is None:
+            return None
+        try:
+            pid, stdout, stderr, report_fd, artifacts = worker.run(code, stdin)
+        except Exception as e:
+            print(f"⚠️ Zygote çalıştırma hatası: {e}")
+            self._replace(worker)
+            return None
+        self.stats['runs'] += 1
+        return PooledProcess(self, worker, pid, stdout, stderr, report_fd, artifacts)
+
+    def get_stats(self):
+        return {
+            'enabled': self.enabled,
+            'size': self.size,
+            'workers': len(self._workers),
+            'idle': self._idle.qsize(),
+            **self.stats
+        }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.close()
+
+
+def create_pool(setup_code, preload=(), env=None):
+    """Uygulama için havuz oluştur; çıkışta zygote'ları kapat"""
+    pool = InterpreterPool(setup_code, preload=preload, env=env)
+    atexit.register(pool.shutdown)
+    return pool
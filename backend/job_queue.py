@@ -0,0 +1,237 @@
+"""Asenkron kod çalıştırma işleri: iş kimliği, durum sorgulama ve iptal
+
+/api/execute isteği bir iş olarak kuyruğa alınıp hemen iş kimliğiyle
+dönebilir; işler sınırlı sayıda iş parçacığında çalışır. Böylece uzun süren
+betikler Flask'ın istek iş parçacıklarını (giriş, dosya kaydetme...) bloklamaz.
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Zamanlayıcı varsa asıl eşzamanlılık sınırı odur; işler ancak yer alınca iş parçacığına geçer
+MAX_CONCURRENT_JOBS = int(os.environ.get('EXECUTION_MAX_CONCURRENT_JOBS', '16'))
+MAX_RETAINED_JOBS = int(os.environ.get('EXECUTION_MAX_RETAINED_JOBS', '500'))
+JOB_RESULT_TTL = float(os.environ.get('EXECUTION_JOB_RESULT_TTL', '600'))
+
+QUEUED = 'queued'
+RUNNING = 'running'
+FINISHED = 'finished'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+
+class ExecutionJob:
+    """Kuyruktaki tek bir çalıştırma işi"""
+
+    def __init__(self, user_id, language, queue_depth):
+        self.id = str(uuid.uuid4())
+        self.user_id = user_id
+        self.language = language
+        self.status = QUEUED
+        self.result = None
+        self.queue_depth = queue_depth  # Kuyruğa girerken önündeki iş sayısı
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self.waiter = None  # Zamanlayıcı sırasındaki kaydı
+        self._process = None
+        self._cancel_requested = False
+        self._lock = threading.Lock()
+
+    @property
+    def done(self):
+        return self.status in (FINISHED, CANCELLED, FAILED)
+
+    def finish(self, status):
+        """Bitiş zamanını durumdan önce yaz: done görünen işin finished_at'ı hep dolu olsun"""
+        with self._lock:
+            self.finished_at = time.time()
+            self.status = status
+
+    def attach_process(self, process):
+        """Çalışan süreci kaydet; iptal istenmişse hemen durdur"""
+        with self._lock:
+            self._process = process
+            cancel = self._cancel_requested
+        if cancel:
+            process.kill()
+
+    def cancel(self):
+        """İşi iptal et: kuyruktaysa çıkar, çalışıyorsa süreci öldür"""
+        with self._lock:
+            if self.done:
+                return False
+            self._cancel_requested = True
+            process = self._process
+
+        if self.future is not None and self.future.cancel():
+            self.finish(CANCELLED)
+            return True
+        if process is not None and process.poll() is None:
+            process.kill()
+        return True
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_requested
+
+    def wait_time(self):
+        end = self.started_at or self.finished_at or time.time()
+        return end - self.created_at
+
+    def run_time(self):
+        if not self.started_at:
+            return 0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def to_dict(self, queue_position=None):
+        return {
+            'id': self.id,
+            'status': self.status,
+            'language': self.language,
+            'queue_depth': self.queue_depth,
+            'queue_position': queue_position,
+            'wait_time': self.wait_time(),
+            'run_time': self.run_time(),
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'result': self.result
+        }
+
+
+class ExecutionJobQueue:
+    """Sınırlı sayıda iş parçacığında çalışan iş kuyruğu"""
+
+    def __init__(self, max_workers=MAX_CONCURRENT_JOBS, max_retained=MAX_RETAINED_JOBS,
+                 result_ttl=JOB_RESULT_TTL, scheduler=None):
+        self.max_workers = max_workers
+        self.scheduler = scheduler
+        self.max_retained = max_retained
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='execution-job')
+        self._jobs = {}
+        self._queued = []  # Başlamayı bekleyen iş kimlikleri (sıralı)
+        self._lock = threading.Lock()
+
+    def submit(self, user_id, language, run):
+        """run(job) çağrısını kuyruğa al ve işi hemen döndür"""
+        with self._lock:
+            self._prune()
+            job = ExecutionJob(user_id, language, queue_depth=len(self._queued))
+            self._jobs[job.id] = job
+            self._queued.append(job.id)
+        if self.scheduler is None:
+            job.future = self._executor.submit(self._execute, job, run)
+        else:
+            # Kullanıcılar arası adil sıra: iş yer verilene kadar iş parçacığı tutmadan
+            # "queued" kalır, böylece bir kullanıcının birikmiş işleri diğerlerini tıkamaz
+            job.waiter = self.scheduler.enqueue(job.user_id, lambda: self._start(job, run))
+        return job
+
+    def _start(self, job, run):
+        """Zamanlayıcı yer verdi: işi bir iş parçacığında çalıştır
+
+        future saklanmaz; yer almış iş iptal edilirse _execute onu hemen bitirir
+        ve yer bırakılır.
+        """
+        try:
+            self._executor.submit(self._run, job, run)
+        except RuntimeError:
+            # Kuyruk kapatıldı
+            self.scheduler.release(job.user_id, 0)
+            self._dequeue(job)
+            job.finish(CANCELLED)
+
+    def _run(self, job, run):
+        try:
+            self._execute(job, run)
+        finally:
+            self.scheduler.release(job.user_id, job.run_time())
+
+    def _dequeue(self, job):
+        with self._lock:
+            if job.id in self._queued:
+                self._queued.remove(job.id)
+
+    def _execute(self, job, run):
+        self._dequeue(job)
+        if job.cancel_requested:
+            job.finish(CANCELLED)
+            return
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        status = FAILED
+        try:
+            job.result = run(job)
+            if job.cancel_requested:
+                status = CANCELLED
+                job.result['success'] = False
+                job.result['error'] = 'Çalıştırma iptal edildi'
+            else:
+                status = FINISHED
+        except Exception as e:
+            job.result = {
+                'success': False,
+                'output': '',
+                'error': str(e),
+                'execution_time': 0
+            }
+        finally:
+            job.finish(status)
+
+    def _prune(self):
+        """Süresi dolmuş veya fazla biriken bitmiş işleri unut"""
+        now = time.time()
+        finished = [job for job in self._jobs.values() if job.done]
+        for job in finished:
+            if now - job.finished_at > self.result_ttl:
+                del self._jobs[job.id]
+        overflow = len(self._jobs) - self.max_retained
+        if overflow > 0:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.done),
+                key=lambda job: job.finished_at
+            )
+            for job in finished[:overflow]:
+                del self._jobs[job.id]
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def cancel(self, job):
+        """İşi iptal et ve bekleyenler listesinden çıkar"""
+        cancelled = job.cancel()
+        if cancelled and job.waiter is not None and self.scheduler.withdraw(job.waiter):
+            # Henüz yer verilmemişti: hiç başlamadan biter
+            job.finish(CANCELLED)
+        if job.status == CANCELLED:
+            self._dequeue(job)
+        return cancelled
+
+    def queue_position(self, job):
+        with self._lock:
+            if job.id in self._queued:
+                return self._queued.index(job.id)
+        return None
+
+    def describe(self, job):
+        return job.to_dict(queue_position=self.queue_position(job))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'queued': len(self._queued),
+                'running': sum(1 for job in self._jobs.values() if job.status == RUNNING),
+                'retained': len(self._jobs)
+            }
+
+    def shutdown(self):
+        for job in list(self._jobs.values()):
+            self.cancel(job)
+        self._executor.shutdown(wait=False)
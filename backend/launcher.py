@@ -0,0 +1,46 @@
+"""Soğuk başlatılan yorumlayıcının giriş noktası: kullanıcı kodu stdin'den gelir
+
+Kod diske yazılmaz; Flask tarafı stdin'e önce byte uzunluğunu içeren bir satır,
+ardından UTF-8 kodu yazar. Kodun ardından gelen veri kullanıcı programının
+stdin'i olarak kalır. Yamalar her seferinde ayrıştırılan bir preamble yerine
+derlenmiş (.pyc) runtime_hooks modülünden yüklenir.
+
+Kullanım: python -c BOOTSTRAP <backend_dizini> [rapor_fd artifact_fd]
+"""
+import builtins
+import sys
+
+import runtime_hooks
+from zygote import run_user_code
+
+# -c ile çalıştırılan küçük başlatıcı; backend dizinini sadece import için ekler
+BOOTSTRAP = 'import sys; sys.path.insert(0, sys.argv[1]); import launcher; sys.exit(launcher.main())'
+
+
+def encode_code(code):
+    """Kodu stdin'e yazılacak uzunluk önekli byte dizisine çevir"""
+    data = code.encode('utf-8')
+    return b'%d\n' % len(data) + data
+
+
+def read_code(stream):
+    """encode_code ile yazılmış kodu byte akışından oku"""
+    header = stream.readline()
+    if not header.strip():
+        return ''
+    data = stream.read(int(header))
+    return data.decode('utf-8', errors='replace')
+
+
+def main():
+    # Kullanıcı kodu backend modüllerini (app, database...) import edemesin;
+    # -c'nin eklediği çalışma dizini ('') de backend dizini olabilir
+    backend_dir = sys.path.pop(0)
+    sys.path[:] = [path for path in sys.path if path not in ('', backend_dir)]
+    report_fd = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    artifact_fd = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    code = read_code(sys.stdin.buffer)
+    runtime_hooks.install()
+    namespace = {'__name__': '__main__', '__builtins__': builtins}
+    return run_user_code(code, namespace, report_fd, artifact_fd)
@@ -0,0 +1,260 @@
+"""Çalışan kodun stdout/stderr çıktısını parça parça okuma ve filtreleme
+
+Çıktı pipe'lardan sınırlı bir kuyrukla okunur ve her akış için sadece ilk
+OUTPUT_HEAD_BYTES ile son OUTPUT_TAIL_BYTES byte saklanır. Böylece
+`while True: print(x)` gibi bir döngü de çalıştırma başına sabit bellek kullanır.
+"""
+import codecs
+import collections
+import os
+import queue
+import subprocess
+import threading
+import time
+
+READ_CHUNK_SIZE = 4096
+# Okuyucu iş parçacıkları en fazla bu kadar parçayı bekletir (sonra pipe dolar)
+MAX_PENDING_CHUNKS = 64
+# Yeni satır gelmese de bu uzunluktan sonra satır zorla gönderilir
+MAX_LINE_LENGTH = 64 * 1024
+# Çıktı gelmezken ana sürecin bitip bitmediği bu aralıkla kontrol edilir
+EXIT_CHECK_INTERVAL = 0.1
+
+
+def _byte_limit(name, default):
+    """Ortam değişkenindeki byte sınırı (0: hiç saklama); negatif değer hata"""
+    value = int(os.environ.get(name, str(default)))
+    if value < 0:
+        raise ValueError(f'{name} negatif olamaz: {value}')
+    return value
+
+
+# Akış başına çıktı sınırları (baştan ve sondan saklanan byte)
+OUTPUT_HEAD_BYTES = _byte_limit('EXECUTION_OUTPUT_HEAD_BYTES', 256 * 1024)
+OUTPUT_TAIL_BYTES = _byte_limit('EXECUTION_OUTPUT_TAIL_BYTES', 64 * 1024)
+
+# TensorFlow bilgi mesajları
+STDERR_SKIP_PATTERNS = [
+    'oneDNN custom operations are on',
+    'This TensorFlow binary is optimized',
+    'To enable the following instructions',
+    'tensorflow/core/platform/cpu_feature_guard',
+    'tensorflow/core/util/port.cc',
+    'I tensorflow/',
+    'W tensorflow/'
+]
+# Diğer uyarılar (küçük harfle karşılaştırılır)
+STDERR_SKIP_LOWER_PATTERNS = ['warning', 'deprecated', 'futurewarning']
+
+# Pygame mesajları
+STDOUT_SKIP_PATTERNS = [
+    'pygame',
+    'SDL',
+    'Hello from the pygame community',
+    'https://www.pygame.org'
+]
+
+
+def keep_error_line(line):
+    """stderr satırı kullanıcıya gösterilmeli mi?"""
+    if any(skip in line for skip in STDERR_SKIP_PATTERNS):
+        return False
+    return not any(skip in line.lower() for skip in STDERR_SKIP_LOWER_PATTERNS)
+
+
+def keep_output_line(line):
+    """stdout satırı kullanıcıya gösterilmeli mi?"""
+    return not any(skip in line for skip in STDOUT_SKIP_PATTERNS)
+
+
+class LineFilter:
+    """Parça parça gelen metni satırlara bölüp filtreler (yarım satırı bekletir)"""
+
+    def __init__(self, keep_line):
+        self.keep_line = keep_line
+        self._partial = ''
+
+    def feed(self, text):
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+        filtered = ''.join(line + '\n' for line in lines if self.keep_line(line))
+        if len(self._partial) > MAX_LINE_LENGTH:
+            filtered += self.flush()
+        return filtered
+
+    def flush(self):
+        line, self._partial = self._partial, ''
+        return line if line and self.keep_line(line) else ''
+
+
+class HeadTailBuffer:
+    """Bir akışın ilk head_limit ve son tail_limit byte'ını tutan sınırlı tampon
+
+    feed() baş kısma sığan metni hemen döndürür (canlı gönderim için); sığmayan
+    kısım sadece son tail_limit byte'ı tutan halka tamponda bekler.
+    """
+
+    def __init__(self, head_limit=OUTPUT_HEAD_BYTES, tail_limit=OUTPUT_TAIL_BYTES):
+        self.head_limit = head_limit
+        self.tail_limit = tail_limit
+        self.total_bytes = 0
+        self.head_bytes = 0
+        self._tail = collections.deque()
+        self._tail_bytes = 0
+
+    def feed(self, text):
+        data = text.encode('utf-8', errors='replace')
+        self.total_bytes += len(data)
+
+        room = self.head_limit - self.head_bytes
+        head = data[:room] if room > 0 else b''
+        self.head_bytes += len(head)
+
+        rest = data[len(head):]
+        # tail_limit 0 ise baş kısma sığmayan çıktı hiç saklanmaz
+        if rest and self.tail_limit > 0:
+            self._tail.append(rest)
+            self._tail_bytes += len(rest)
+            while self._tail_bytes - len(self._tail[0]) >= self.tail_limit:
+                self._tail_bytes -= len(self._tail.popleft())
+
+        # Bölünmüş çok byte'lı karakterler atılır
+        return head.decode('utf-8', errors='ignore')
+
+    def tail(self):
+        data = b''.join(self._tail)
+        return data[-self.tail_limit:].decode('utf-8', errors='ignore') if self.tail_limit else ''
+
+    @property
+    def kept_bytes(self):
+        return self.head_bytes + min(self._tail_bytes, self.tail_limit)
+
+    @property
+    def omitted_bytes(self):
+        return self.total_bytes - self.kept_bytes
+
+    @property
+    def truncated(self):
+        return self.omitted_bytes > 0
+
+
+def truncation_notice(omitted_bytes):
+    """Kırpılan çıktı yerine gösterilen not"""
+    return f'\n... [{omitted_bytes} byte çıktı kırpıldı] ...\n'
+
+
+def _binary_stream(stream):
+    """Popen/PooledProcess metin akışının altındaki byte akışı"""
+    return getattr(stream, 'buffer', stream)
+
+
+def _put(events, item, closed):
+    """Kuyruk doluysa bekle; okuyucu bırakıldıysa (closed) veriyi at"""
+    while not closed.is_set():
+        try:
+            events.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _pump(name, stream, events, closed):
+    """Akıştan okunan byte parçalarını kuyruğa aktar (EOF'ta None)"""
+    binary = _binary_stream(stream)
+    read = getattr(binary, 'read1', binary.read)
+    try:
+        while True:
+            chunk = read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            _put(events, (name, chunk), closed)
+    except (OSError, ValueError):
+        pass
+    finally:
+        _put(events, (name, None), closed)
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+def feed_stdin(fd, data):
+    """Veriyi sürecin stdin pipe'ına arka planda yaz ve kapat
+
+    Kullanıcı kodu girdinin hepsini okumasa da çağıran bloklanmaz; süreç
+    çıkınca yazma BrokenPipeError ile sessizce biter.
+    """
+    def write():
+        try:
+            with open(fd, 'wb') as pipe:
+                pipe.write(data)
+        except OSError:
+            pass
+
+    threading.Thread(target=write, daemon=True).start()
+
+
+def iter_process_output(process, timeout, artifacts=None, on_exit=None):
+    """Sürecin filtrelenmiş stdout/stderr parçalarını üretildikçe ver
+
+    ('stdout' | 'stderr', metin) çiftleri üretir. artifacts bir ArtifactDecoder
+    ise süreç artifact kanalı açtıysa ('artifact', sözlük) çiftleri de gelir.
+    Ana süreç bittiği halde pipe'lar (onları devralan alt süreçler yüzünden)
+    açık kalırsa on_exit(process) bir kez çağrılır.
+    Süre dolarsa subprocess.TimeoutExpired fırlatır; süreci sonlandırmak
+    çağırana kalır.
+    """
+    deadline = time.monotonic() + timeout
+    events = queue.Queue(maxsize=MAX_PENDING_CHUNKS)
+    closed = threading.Event()
+    decoders = {}
+    filters = {
+        'stdout': LineFilter(keep_output_line),
+        'stderr': LineFilter(keep_error_line),
+    }
+    open_streams = 0
+    for name in ('stdout', 'stderr', 'artifacts'):
+        stream = getattr(process, name, None)
+        if stream is None:
+            continue
+        if name != 'artifacts':
+            decoders[name] = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        elif artifacts is None:
+            stream.close()
+            continue
+        threading.Thread(target=_pump, args=(name, stream, events, closed), daemon=True).start()
+        open_streams += 1
+
+    try:
+        while open_streams:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(getattr(process, 'args', [process.pid]), timeout)
+            try:
+                name, chunk = events.get(timeout=min(remaining, EXIT_CHECK_INTERVAL))
+            except queue.Empty:
+                if on_exit is not None and process.poll() is not None:
+                    on_exit(process)
+                    on_exit = None
+                continue
+
+            if name == 'artifacts':
+                if chunk is None:
+                    open_streams -= 1
+                    continue
+                for artifact in artifacts.feed(chunk):
+                    yield 'artifact', artifact
+                continue
+
+            if chunk is None:
+                open_streams -= 1
+                text = filters[name].feed(decoders[name].decode(b'', final=True)) + filters[name].flush()
+            else:
+                text = filters[name].feed(decoders[name].decode(chunk))
+            if text:
+                yield name, text
+
+        process.wait(timeout=max(0, deadline - time.monotonic()))
+    finally:
+        # Okuyucular artık kuyruğa yazmasın, pipe'ı EOF'a kadar boşaltıp çıksın
+        closed.set()
@@ -0,0 +1,53 @@
+"""HTML/CSS/JavaScript önizleme sayfalarının bellekteki önbelleği
+
+Önizlemeler artık geçici dosyaya yazılıp sunucuda tarayıcı açılmaz; üretilen
+sayfa içerik özetiyle (SHA-256) anahtarlanıp boyut ve süre sınırlı bir LRU
+önbellekte tutulur ve /api/preview/<anahtar> adresinden sunulur. Aynı sayfa
+tekrar çalıştırılınca yeniden saklanmaz, aynı adres döner.
+"""
+import hashlib
+import os
+
+from ttl_cache import TTLCache
+
+PREVIEW_CACHE_MAX_ENTRIES = int(os.environ.get('EXECUTION_PREVIEW_CACHE_MAX_ENTRIES', '512'))
+PREVIEW_CACHE_MAX_BYTES = int(os.environ.get('EXECUTION_PREVIEW_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+PREVIEW_CACHE_TTL = float(os.environ.get('EXECUTION_PREVIEW_CACHE_TTL', '3600'))
+
+# İçerik adresi özetten geldiği için değişmez; tarayıcı önbellek süresi boyunca tekrar sormaz
+PREVIEW_CACHE_CONTROL = f'private, max-age={int(PREVIEW_CACHE_TTL)}, immutable'
+
+# Kullanıcı sayfası uygulamanın kökeninde çalışmasın (oturum çerezi, API erişimi yok)
+PREVIEW_CONTENT_SECURITY_POLICY = 'sandbox allow-scripts allow-forms allow-modals allow-popups'
+
+
+def preview_key(html):
+    """Sayfa içeriğinin özeti (önizleme adresi ve ETag olarak kullanılır)"""
+    return hashlib.sha256(html.encode('utf-8')).hexdigest()[:32]
+
+
+class PreviewCache:
+    """İçerik özetiyle anahtarlanan önizleme sayfaları"""
+
+    def __init__(self, max_entries=PREVIEW_CACHE_MAX_ENTRIES, ttl=PREVIEW_CACHE_TTL,
+                 max_bytes=PREVIEW_CACHE_MAX_BYTES):
+        self._cache = TTLCache(max_entries=max_entries, ttl=ttl, max_bytes=max_bytes)
+        self.reused = 0
+
+    def store(self, html):
+        """Sayfayı sakla ve anahtarını döndür; sayfa sınırdan büyükse None"""
+        key = preview_key(html)
+        if self._cache.get(key) is not None:
+            self.reused += 1
+            return key
+        data = html.encode('utf-8')
+        if not self._cache.set(key, data, size=len(data)):
+            return None
+        return key
+
+    def get(self, key):
+        """Sayfanın byte içeriği (yoksa veya süresi dolduysa None)"""
+        return self._cache.get(key)
+
+    def get_stats(self):
+        return {'reused': self.reused, **self._cache.get_stats()}
@@ -0,0 +1,101 @@
+"""Çalıştırma başına süreç grubu: zaman aşımında tüm ağacı durdurma ve artıkları temizleme
+
+Her çalıştırma kendi oturumunda (setsid) başlar, böylece kullanıcı kodunun
+os/subprocess ile başlattığı alt süreçler aynı süreç grubunda kalır. Süre
+dolunca veya iptal edilince önce gruba SIGTERM, kısa bir süre sonra SIGKILL
+gönderilir. Ana süreç normal bitse bile grupta kalan süreçler öldürülür.
+"""
+import os
+import signal
+import subprocess
+import threading
+
+KILL_GRACE_PERIOD = float(os.environ.get('EXECUTION_KILL_GRACE_PERIOD', '1'))
+
+
+def signal_group(pid, sig):
+    """pid'in süreç grubuna sinyal gönder; grup yoksa (henüz setsid olmadıysa) sadece sürece"""
+    try:
+        os.killpg(pid, sig)
+        return
+    except (ProcessLookupError, PermissionError):
+        pass
+    try:
+        os.kill(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def group_members(pgid):
+    """Linux'ta gruptaki canlı süreçlerin pid'leri (zombiler hariç); diğer sistemlerde None"""
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return None
+    members = []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # Komut adı parantez içinde ve boşluk içerebilir: "pid (ad) durum ppid pgrp ..."
+        fields = stat[stat.rfind(b')') + 2:].split()
+        if len(fields) > 2 and fields[0] != b'Z' and int(fields[2]) == pgid:
+            members.append(int(entry))
+    return members
+
+
+def kill_group(pgid):
+    """Grupta kalan süreçleri öldür; öldürülen süreç sayısı (bilinmiyorsa 0)"""
+    members = group_members(pgid)
+    if members == []:
+        return 0
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        return 0
+    return len(members or ())
+
+
+class ProcessReaper:
+    """Çalıştırma süreç gruplarını durdurur ve kaç sürecin öldürüldüğünü sayar"""
+
+    def __init__(self, grace_period=KILL_GRACE_PERIOD):
+        self.grace_period = grace_period
+        self._lock = threading.Lock()
+        self.stats = {'stopped': 0, 'forced_kills': 0, 'orphans_killed': 0}
+
+    def _count(self, key, amount=1):
+        if amount:
+            with self._lock:
+                self.stats[key] += amount
+
+    def stop(self, process):
+        """Hâlâ çalışan süreci grubuyla birlikte durdur: SIGTERM, süre dolarsa SIGKILL"""
+        if process.poll() is not None:
+            return
+        self._count('stopped')
+        process.terminate()
+        try:
+            process.wait(timeout=self.grace_period)
+        except subprocess.TimeoutExpired:
+            self._count('forced_kills')
+            process.kill()
+            process.wait()
+
+    def reap(self, process):
+        """Ana süreç bittikten sonra grupta kalan artık süreçleri bir kez öldür"""
+        if getattr(process, 'reaped', False):
+            return
+        process.reaped = True
+        orphans = getattr(process, 'orphans_killed', None)
+        if orphans is None and os.name == 'posix':
+            orphans = kill_group(process.pid)
+        self._count('orphans_killed', orphans or 0)
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self.stats)
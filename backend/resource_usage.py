@@ -0,0 +1,248 @@
+"""Çalıştırma başına kaynak kullanımı ve kullanıcı/iş yükü bazında toplamlar
+
+CPU süresi ve en yüksek bellek kullanımı, süreci bekleyen taraf (Flask veya
+zygote) tarafından wait4 ile alınır; böylece öldürülen süreçler için de
+bilinir. Okunan/yazılan byte ve başlatılan alt süreç sayısını kullanıcı süreci
+çıkmadan önce ayrı bir rapor pipe'ına yazar.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from process_group import signal_group
+
+# ru_maxrss Linux'ta KB, macOS'ta byte cinsindendir
+_MAXRSS_SCALE = 1 if sys.platform == 'darwin' else 1024
+
+# Alt süreç başlatan audit olayları
+PROCESS_AUDIT_EVENTS = frozenset({
+    'os.fork', 'os.forkpty', 'os.posix_spawn', 'os.spawn', 'os.system',
+    'os.startfile', 'subprocess.Popen'
+})
+
+RESOURCE_FIELDS = (
+    'user_cpu_time', 'system_cpu_time', 'max_rss_bytes',
+    'read_bytes', 'written_bytes', 'disk_written_bytes', 'child_processes'
+)
+
+# İş yükü sınıflandırması için öncelik sırasıyla kütüphaneler
+WORKLOAD_MODULES = (
+    'tensorflow', 'torch', 'cv2', 'pygame', 'pgzrun', 'pandas', 'matplotlib',
+    'plotly', 'bokeh', 'turtle', 'numpy'
+)
+
+_REPORT_MAX_BYTES = 4096
+
+
+def rusage_to_dict(rusage):
+    """resource.struct_rusage'ı JSON'a uygun sözlüğe çevir"""
+    return {
+        'user_cpu_time': rusage.ru_utime,
+        'system_cpu_time': rusage.ru_stime,
+        'max_rss_bytes': rusage.ru_maxrss * _MAXRSS_SCALE
+    }
+
+
+def create_report_pipe():
+    """Rapor pipe'ı (okuma, yazma) oluştur; fd aktarımı olmayan platformlarda (None, None)"""
+    if os.name != 'posix':
+        return None, None
+    return os.pipe()
+
+
+def count_child_processes():
+    """Bu süreçte başlatılan alt süreçleri sayan audit hook kur, sayacı döndür"""
+    counter = {'child_processes': 0}
+
+    def hook(event, _args):
+        if event in PROCESS_AUDIT_EVENTS:
+            counter['child_processes'] += 1
+
+    sys.addaudithook(hook)
+    return counter
+
+
+def _read_proc_io():
+    """Linux'ta /proc/self/io sayaçları (ölü alt süreçler dahil)"""
+    try:
+        with open('/proc/self/io') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+        return {
+            'read_bytes': int(fields['rchar']),
+            'written_bytes': int(fields['wchar']),
+            'disk_written_bytes': int(fields['write_bytes'])
+        }
+    except (OSError, KeyError, ValueError):
+        return {}
+
+
+def write_report(fd, counter):
+    """Kullanıcı sürecinden rapor pipe'ına son durumu yaz ve kapat"""
+    try:
+        report = {**counter, **_read_proc_io()}
+        os.write(fd, json.dumps(report).encode('utf-8'))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def read_report(fd):
+    """Rapor pipe'ını bloklamadan oku ve kapat (torunlar yazma ucunu açık tutabilir)"""
+    data = b''
+    try:
+        os.set_blocking(fd, False)
+        while len(data) < _REPORT_MAX_BYTES:
+            chunk = os.read(fd, _REPORT_MAX_BYTES)
+            if not chunk:
+                break
+            data += chunk
+    except (BlockingIOError, OSError):
+        pass
+    finally:
+        os.close(fd)
+    try:
+        return json.loads(data.decode('utf-8')) if data else {}
+    except ValueError:
+        return {}
+
+
+class AccountedPopen(subprocess.Popen):
+    """Çocuğu wait4 ile bekleyip kaynak kullanımını da saklayan Popen
+
+    start_new_session=True ile başlatıldığında terminate()/kill() tüm süreç
+    grubuna gider.
+    """
+
+    rusage = None
+    report_fd = None
+
+    def __init__(self, *args, **kwargs):
+        self.new_session = kwargs.get('start_new_session', False)
+        super().__init__(*args, **kwargs)
+
+    def send_signal(self, sig):
+        if os.name != 'posix' or not self.new_session:
+            return super().send_signal(sig)
+        self.poll()
+        if self.returncode is None:
+            signal_group(self.pid, sig)
+
+    def _try_wait(self, wait_flags):
+        if not hasattr(os, 'wait4'):
+            return super()._try_wait(wait_flags)
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            # Popen ile aynı davranış: durum bilinmiyor
+            return self.pid, 0
+        if pid == self.pid:
+            self.rusage = rusage_to_dict(rusage)
+        return pid, status
+
+
+def collect_resources(process):
+    """Bitmiş sürecin kaynak kullanımını topla (bilinmeyen alanlar None)"""
+    resources = getattr(process, 'resources', None)
+    if resources is not None:
+        return resources
+
+    resources = dict.fromkeys(RESOURCE_FIELDS)
+    resources.update(getattr(process, 'rusage', None) or {})
+    report_fd = getattr(process, 'report_fd', None)
+    if report_fd is not None:
+        process.report_fd = None
+        report = read_report(report_fd)
+        resources.update({key: report[key] for key in RESOURCE_FIELDS if key in report})
+    if process.returncode is not None:
+        process.resources = resources
+    return resources
+
+
+def close_report(process):
+    """Okunmamış rapor pipe'ını kapat"""
+    report_fd = getattr(process, 'report_fd', None)
+    if report_fd is not None:
+        process.report_fd = None
+        os.close(report_fd)
+
+
+def detect_workload(code):
+    """Kodun ağırlıklı kullandığı kütüphaneyi tahmin et ('python' varsayılan)"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return 'python'
+
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imported.add(node.module.split('.')[0])
+
+    for module_name in WORKLOAD_MODULES:
+        if module_name in imported:
+            return module_name
+    return 'python'
+
+
+def _empty_totals():
+    return {
+        'runs': 0,
+        'wall_time': 0.0,
+        'user_cpu_time': 0.0,
+        'system_cpu_time': 0.0,
+        'max_rss_bytes': 0,
+        'read_bytes': 0,
+        'written_bytes': 0,
+        'disk_written_bytes': 0,
+        'child_processes': 0
+    }
+
+
+def _add(totals, resources, wall_time):
+    totals['runs'] += 1
+    totals['wall_time'] += wall_time or 0
+    for key in ('user_cpu_time', 'system_cpu_time', 'read_bytes', 'written_bytes',
+                'disk_written_bytes', 'child_processes'):
+        totals[key] += resources.get(key) or 0
+    totals['max_rss_bytes'] = max(totals['max_rss_bytes'], resources.get('max_rss_bytes') or 0)
+
+
+class ResourceAccounting:
+    """Kullanıcı ve iş yükü (pandas, cv2, pygame...) bazında kaynak toplamları"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = _empty_totals()
+        self._users = {}
+        self._workloads = {}
+
+    def record(self, user_id, code, result):
+        """Çalıştırma sonucundaki 'resources' alanını toplamlara ekle"""
+        resources = result.get('resources')
+        if not resources:
+            return
+        workload = detect_workload(code)
+        wall_time = result.get('execution_time')
+        with self._lock:
+            _add(self._totals, resources, wall_time)
+            _add(self._users.setdefault(user_id, _empty_totals()), resources, wall_time)
+            _add(self._workloads.setdefault(workload, _empty_totals()), resources, wall_time)
+
+    def get_user_stats(self, user_id):
+        with self._lock:
+            return dict(self._users.get(user_id) or _empty_totals())
+
+    def get_stats(self):
+        """Genel ve iş yükü bazında toplamlar (kullanıcı kimlikleri içermez)"""
+        with self._lock:
+            return {
+                **self._totals,
+                'users': len(self._users),
+                'workloads': {name: dict(totals) for name, totals in self._workloads.items()}
+            }
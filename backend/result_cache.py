@@ -0,0 +1,116 @@
+"""Tekrarlanan çalıştırmalar için içerik hash'li sonuç önbelleği
+
+Anahtar kod, dil ve çalışma ortamı sürümünün SHA-256 özetidir. Rastgelelik,
+zaman, kullanıcı girdisi, ağ, dosya sistemi veya pencere açan kütüphaneler
+kullanan kodlar statik olarak (AST ile) tespit edilip önbelleğe alınmaz.
+"""
+import ast
+import hashlib
+import os
+import sys
+
+from ttl_cache import TTLCache
+
+RESULT_CACHE_ENABLED = os.environ.get('EXECUTION_RESULT_CACHE', '0') == '1'
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get('EXECUTION_RESULT_CACHE_MAX_ENTRIES', '2048'))
+RESULT_CACHE_MAX_BYTES = int(os.environ.get('EXECUTION_RESULT_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+RESULT_CACHE_TTL = float(os.environ.get('EXECUTION_RESULT_CACHE_TTL', '3600'))
+
+# Sonucu çalıştırmadan çalıştırmaya değişebilen veya yan etkisi olan modüller
+NONDETERMINISTIC_MODULES = {
+    'random', 'secrets', 'uuid', 'time', 'datetime', 'calendar',
+    'os', 'sys', 'pathlib', 'glob', 'shutil', 'tempfile', 'io', 'fileinput',
+    'socket', 'ssl', 'http', 'urllib', 'requests', 'bs4', 'ftplib', 'smtplib',
+    'asyncio', 'threading', 'multiprocessing', 'subprocess', 'concurrent',
+    'sqlite3', 'webbrowser', 'getpass', 'platform', 'ctypes', 'importlib',
+    'turtle', 'tkinter', 'pygame', 'pgzrun', 'pgzero', 'cv2',
+    'matplotlib', 'plotly', 'bokeh', 'discord', 'telebot', 'telegram', 'flask',
+}
+# Girdi okuyan, dinamik kod çalıştıran veya adres/hash'e bağlı yerleşikler
+NONDETERMINISTIC_NAMES = {
+    'input', 'open', 'exec', 'eval', 'compile', '__import__',
+    'id', 'hash', 'set', 'frozenset', 'globals', 'locals', 'vars', 'breakpoint',
+}
+# numpy.random, pandas.Timestamp.now gibi öznitelikler
+NONDETERMINISTIC_ATTRIBUTES = {'random', 'now', 'today', 'utcnow', 'time', 'urandom'}
+
+
+def is_deterministic(code):
+    """Kod aynı girdide her zaman aynı çıktıyı verir gibi görünüyor mu?"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                return False
+            # from numpy import random / from numpy.random import rand
+            names = [node.module or ''] + [alias.name for alias in node.names]
+        else:
+            names = None
+
+        if names is not None:
+            for name in names:
+                parts = name.split('.')
+                if parts[0] in NONDETERMINISTIC_MODULES:
+                    return False
+                if any(part in NONDETERMINISTIC_ATTRIBUTES for part in parts):
+                    return False
+            continue
+
+        # Set sırası hash rastgeleleştirmesine bağlıdır
+        if isinstance(node, (ast.Set, ast.SetComp)):
+            return False
+        if isinstance(node, ast.Name) and node.id in NONDETERMINISTIC_NAMES:
+            return False
+        if isinstance(node, ast.Attribute) and node.attr in NONDETERMINISTIC_ATTRIBUTES:
+            return False
+
+    return True
+
+
+def cache_key(code, language, *extra):
+    """Kod, dil ve çalışma ortamı sürümünden önbellek anahtarı"""
+    digest = hashlib.sha256()
+    for part in (language, sys.version, *extra, code):
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Başarılı, deterministik çalıştırma sonuçlarını saklar"""
+
+    def __init__(self, enabled=RESULT_CACHE_ENABLED, max_entries=RESULT_CACHE_MAX_ENTRIES,
+                 max_bytes=RESULT_CACHE_MAX_BYTES, ttl=RESULT_CACHE_TTL):
+        self.enabled = enabled
+        self._cache = TTLCache(max_entries=max_entries, ttl=ttl, max_bytes=max_bytes)
+        self.skipped = 0
+
+    def lookup(self, code, language, *extra):
+        """Önbellekteki sonucu döndür (yoksa None)"""
+        if not self.enabled:
+            return None
+        if not is_deterministic(code):
+            self.skipped += 1
+            return None
+        result = self._cache.get(cache_key(code, language, *extra))
+        if result is None:
+            return None
+        return {**result, 'cached': True}
+
+    def store(self, code, language, result, *extra):
+        """Sonucu önbelleğe al (sadece başarılı ve deterministik kod)"""
+        if not self.enabled or not result.get('success'):
+            return False
+        if not is_deterministic(code):
+            return False
+        size = len(result.get('output') or '') + len(result.get('error') or '')
+        return self._cache.set(cache_key(code, language, *extra), dict(result), size=size)
+
+    def get_stats(self):
+        return {'enabled': self.enabled, 'skipped': self.skipped, **self._cache.get_stats()}
@@ -0,0 +1,840 @@
+"""Kullanıcı kodu için kütüphane yamaları (import tetiklemeli)
+
+Bu modül kullanıcı kodunu çalıştıran yorumlayıcının içinde yüklenir. Yamalar
+artık her çalıştırmada peşin uygulanmaz; bir meta path finder, ilgili
+kütüphane gerçekten import edildiğinde modül yüklendikten hemen sonra yamayı
+uygular. Böylece sadece print("merhaba") çalıştıran bir betik matplotlib,
+cv2, pygame, plotly veya bokeh yükleme maliyetini ödemez.
+"""
+import atexit
+import heapq
+import importlib.abc
+import io
+import json
+import os
+import struct
+import sys
+import time
+from xml.sax.saxutils import escape as xml_escape
+
+import artifacts
+
+# Grafik çıktısı ayarları (kullanıcı sürecinde okunur)
+FIGURE_FORMAT = os.environ.get('EXECUTION_FIGURE_FORMAT', 'png')  # png veya svg
+FIGURE_DPI = float(os.environ.get('EXECUTION_FIGURE_DPI', '100'))
+FIGURE_MAX_PIXELS = int(os.environ.get('EXECUTION_FIGURE_MAX_PIXELS', str(2000 * 2000)))
+FIGURE_MAX_BYTES = int(os.environ.get('EXECUTION_FIGURE_MAX_BYTES', str(2 * 1024 * 1024)))
+MAX_FIGURES = int(os.environ.get('EXECUTION_MAX_FIGURES', '20'))
+FIGURE_MIME_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+if FIGURE_FORMAT not in FIGURE_MIME_TYPES:
+    FIGURE_FORMAT = 'png'
+
+# OpenCV kare akışı ayarları
+CV2_FRAME_FORMAT = os.environ.get('EXECUTION_CV2_FRAME_FORMAT', 'jpeg')  # jpeg veya png
+if CV2_FRAME_FORMAT not in ('jpeg', 'png'):
+    CV2_FRAME_FORMAT = 'jpeg'
+CV2_JPEG_QUALITY = int(os.environ.get('EXECUTION_CV2_JPEG_QUALITY', '75'))
+CV2_MAX_FPS = float(os.environ.get('EXECUTION_CV2_MAX_FPS', '15'))
+CV2_MAX_DIMENSION = int(os.environ.get('EXECUTION_CV2_MAX_DIMENSION', '960'))
+CV2_MAX_FRAMES = int(os.environ.get('EXECUTION_CV2_MAX_FRAMES', '600'))
+
+# Pygame ekran kaydı sınırları
+PYGAME_CAPTURE_FPS = float(os.environ.get('EXECUTION_PYGAME_CAPTURE_FPS', '10'))
+PYGAME_MAX_DIMENSION = int(os.environ.get('EXECUTION_PYGAME_MAX_DIMENSION', '640'))
+PYGAME_MAX_FRAMES = int(os.environ.get('EXECUTION_PYGAME_MAX_FRAMES', '300'))
+PYGAME_MAX_SECONDS = float(os.environ.get('EXECUTION_PYGAME_MAX_SECONDS', '15'))
+PYGAME_MAX_BYTES = int(os.environ.get('EXECUTION_PYGAME_MAX_BYTES', str(4 * 1024 * 1024)))
+
+# Turtle: mainloop() içinde çalıştırılacak en fazla ontimer çağrısı
+TURTLE_MAX_TIMER_CALLS = int(os.environ.get('EXECUTION_TURTLE_MAX_TIMER_CALLS', '1000'))
+
+_figure_count = [0]
+
+
+# MATPLOTLIB
+def patch_matplotlib(matplotlib):
+    """Sunucuda pencere açmayan Agg backend'i (kullanıcı başka backend seçemez)"""
+    matplotlib.use('Agg')
+
+    def custom_use(backend, *args, **kwargs):
+        pass
+    matplotlib.use = custom_use
+
+
+def _figure_dpi(fig):
+    """FIGURE_DPI, piksel sınırını aşıyorsa figür boyutuna göre düşürülür"""
+    width, height = fig.get_size_inches()
+    dpi = FIGURE_DPI
+    if width * height * dpi * dpi > FIGURE_MAX_PIXELS:
+        dpi = (FIGURE_MAX_PIXELS / (width * height)) ** 0.5
+    return dpi
+
+
+def _render_figure(fig):
+    """Figürü PNG/SVG'ye çevir; byte sınırı aşılırsa çözünürlüğü düşürerek dene"""
+    dpi = _figure_dpi(fig)
+    for _ in range(3):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=FIGURE_FORMAT, dpi=dpi, bbox_inches='tight')
+        data = buffer.getvalue()
+        if len(data) <= FIGURE_MAX_BYTES or FIGURE_FORMAT != 'png':
+            break
+        dpi /= 2
+    return data if len(data) <= FIGURE_MAX_BYTES else None
+
+
+def _emit_figures(plt):
+    """Açık figürleri görüntü olarak gönder ve kapat"""
+    # Grafikten önce yazdırılan metin önce görünsün
+    sys.stdout.flush()
+    for number in plt.get_fignums():
+        fig = plt.figure(number)
+        _figure_count[0] += 1
+        if _figure_count[0] > MAX_FIGURES:
+            if _figure_count[0] == MAX_FIGURES + 1:
+                print(f"[⚠️ En fazla {MAX_FIGURES} grafik gösterilebilir]")
+            continue
+
+        data = _render_figure(fig)
+        if data is None:
+            print(f"[⚠️ Figure {number} çok büyük, gösterilemedi]")
+            continue
+
+        fields = {'mime': FIGURE_MIME_TYPES[FIGURE_FORMAT], 'figure': number}
+        if FIGURE_FORMAT == 'png':
+            fields['width'], fields['height'] = struct.unpack('>II', data[16:24])
+        if not artifacts.emit('image', data=artifacts.encode_bytes(data), **fields):
+            print(f"[📊 Figure {number} çizildi, ancak bu platformda görüntülenemiyor]")
+    plt.close('all')
+
+
+def patch_pyplot(plt):
+    """plt.show() figürleri pencere yerine görüntü olarak çıktıya ekler"""
+    def custom_show(*args, **kwargs):
+        try:
+            _emit_figures(plt)
+        except Exception as e:
+            print(f"[⚠️ Show override error: {e}]")
+
+    plt.show = custom_show
+
+    # show() çağrılmadan açık kalan figürler program bitince gönderilir
+    atexit.register(_emit_figures, plt)
+
+
+# OPENCV
+class _FrameStream:
+    """imshow karelerini pencere başına hız sınırıyla gönderir
+
+    Gönderim zamanı gelmeden gelen yeni kare bekleyen eskisinin yerini alır
+    (eski kare atılır); böylece hızlı döngüler istemciyi boğmaz.
+    """
+
+    def __init__(self, cv2):
+        self.cv2 = cv2
+        self.pending = {}
+        self.last_sent = {}
+        self.sent = 0
+        self.dropped = 0
+        self.warned = False
+
+    def show(self, window, frame):
+        if window in self.pending:
+            self.dropped += 1
+        self.pending[window] = frame.copy()
+        self.flush()
+
+    def flush(self, force=False):
+        now = time.monotonic()
+        for window in list(self.pending):
+            last_sent = self.last_sent.get(window)
+            if not force and last_sent is not None and now - last_sent < 1 / CV2_MAX_FPS:
+                continue
+            self._send(window, self.pending.pop(window))
+            self.last_sent[window] = now
+
+    def _prepare(self, frame):
+        """imshow gibi float/16 bit görüntüleri 8 bite çevir, büyükse küçült"""
+        cv2 = self.cv2
+        if frame.dtype.kind == 'f':
+            frame = cv2.convertScaleAbs(frame, alpha=255)
+        elif frame.dtype.itemsize > 1:
+            frame = cv2.convertScaleAbs(frame, alpha=1 / 256)
+        height, width = frame.shape[:2]
+        if max(height, width) > CV2_MAX_DIMENSION:
+            scale = CV2_MAX_DIMENSION / max(height, width)
+            frame = cv2.resize(
+                frame, (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA
+            )
+        return frame
+
+    def _send(self, window, frame):
+        if self.sent >= CV2_MAX_FRAMES:
+            self.dropped += 1
+            if not self.warned:
+                self.warned = True
+                print(f"[⚠️ En fazla {CV2_MAX_FRAMES} OpenCV karesi gösterilebilir]")
+            return
+
+        frame = self._prepare(frame)
+        if CV2_FRAME_FORMAT == 'png':
+            ok, data = self.cv2.imencode('.png', frame)
+        else:
+            ok, data = self.cv2.imencode('.jpg', frame, [self.cv2.IMWRITE_JPEG_QUALITY, CV2_JPEG_QUALITY])
+        if not ok:
+            return
+
+        self.sent += 1
+        height, width = frame.shape[:2]
+        sys.stdout.flush()
+        emitted = artifacts.emit(
+            'frame',
+            window=str(window),
+            mime=f'image/{CV2_FRAME_FORMAT}',
+            data=artifacts.encode_bytes(data.tobytes()),
+            width=width,
+            height=height,
+            index=self.sent,
+            dropped=self.dropped
+        )
+        if not emitted and not self.warned:
+            self.warned = True
+            print(f"[📷 OpenCV görüntüsü ({window}) bu platformda gösterilemiyor]")
+
+
+def patch_cv2(cv2):
+    """imshow pencere açmak yerine kareleri istemciye akıtır, waitKey gerçek süre bekler"""
+    stream = _FrameStream(cv2)
+
+    def custom_imshow(winname, mat):
+        stream.show(winname, mat)
+
+    def custom_waitKey(delay=0):
+        # Sunucuda klavye yok: tuşa hiç basılmaz. delay <= 0 sonsuza kadar
+        # beklemek demektir; çalışanı boşuna tutmamak için hemen dönülür.
+        stream.flush()
+        if delay > 0:
+            time.sleep(delay / 1000)
+            stream.flush()
+        return -1
+
+    def no_op(*args, **kwargs):
+        return None
+
+    cv2.imshow = custom_imshow
+    cv2.waitKey = custom_waitKey
+    cv2.waitKeyEx = custom_waitKey
+    cv2.pollKey = lambda: -1
+    for name in ('namedWindow', 'destroyWindow', 'destroyAllWindows', 'moveWindow',
+                 'resizeWindow', 'setWindowTitle', 'setWindowProperty'):
+        setattr(cv2, name, no_op)
+
+    # Program bitince bekleyen son kareler de gönderilsin
+    atexit.register(stream.flush, True)
+
+
+# TURTLE
+class _HeadlessCanvas:
+    """Turtle'ın kullandığı Tk Canvas arayüzünün bellekte tutulan karşılığı
+
+    Çizim öğeleri (çizgi, çokgen, yazı) ekrana çizilmez, son halleri saklanır
+    ve program bitince SVG'ye çevrilir. Animasyon beklemeleri atlanır,
+    ontimer geri çağrıları mainloop() içinde sanal zamanla sırayla çalışır.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.bg = 'white'
+        self.items = {}
+        self.order = []
+        self.timers = []
+        self.clock = 0
+        self._next_id = 0
+        self._timer_seq = 0
+
+    def _create(self, kind, coords, options):
+        self._next_id += 1
+        self.items[self._next_id] = {'type': kind, 'coords': _flatten(coords), **options}
+        self.order.append(self._next_id)
+        return self._next_id
+
+    def create_line(self, *coords, **options):
+        return self._create('line', coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create('polygon', coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create('image', coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create('text', coords, options)
+
+    def coords(self, item, *coords):
+        if not coords:
+            return list(self.items[item]['coords'])
+        self.items[item]['coords'] = _flatten(coords)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+
+    itemconfig = itemconfigure
+
+    def type(self, item):
+        return self.items[item]['type']
+
+    def find_all(self):
+        return tuple(self.order)
+
+    def tag_raise(self, item):
+        self.order.remove(item)
+        self.order.append(item)
+
+    def tag_lower(self, item):
+        self.order.remove(item)
+        self.order.insert(0, item)
+
+    def delete(self, item):
+        if item == 'all':
+            self.items.clear()
+            self.order.clear()
+        elif item in self.items:
+            del self.items[item]
+            self.order.remove(item)
+
+    def bbox(self, item):
+        """Yazı genişliği için yaklaşık sınır kutusu (gerçek font ölçümü yok)"""
+        options = self.items[item]
+        x, y = options['coords'][:2]
+        size = _font_size(options.get('font'))
+        width = len(str(options.get('text', ''))) * size * 0.6
+        anchor = options.get('anchor', 'center')
+        left = x - width if anchor.endswith('e') else x - width / 2 if anchor in ('s', 'center') else x
+        return (left, y - size, left + width, y)
+
+    def config(self, **options):
+        if 'bg' in options:
+            self.bg = options['bg']
+
+    configure = config
+
+    def cget(self, option):
+        return {'bg': self.bg, 'width': self.width, 'height': self.height}.get(option)
+
+    __getitem__ = cget
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+    def after(self, ms, func=None, *args):
+        # Animasyon gecikmeleri beklenmez
+        if func is None:
+            return None
+        self._timer_seq += 1
+        heapq.heappush(self.timers, (self.clock + ms, self._timer_seq, func, args))
+        return self._timer_seq
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def run_timers(self, limit):
+        """Bekleyen zamanlayıcıları sanal zaman sırasıyla çalıştır; sınır aşıldıysa False"""
+        calls = 0
+        while self.timers:
+            if calls >= limit:
+                self.timers.clear()
+                return False
+            self.clock, _, func, args = heapq.heappop(self.timers)
+            func(*args)
+            calls += 1
+        return True
+
+    def update(self):
+        pass
+
+    def focus_force(self):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    unbind = tag_bind = tag_unbind = bind
+
+
+def _flatten(coords):
+    """(x, y) çiftlerini ya da düz sayı listesini düz float listesine çevir"""
+    flat = []
+    for value in coords:
+        if isinstance(value, (tuple, list)):
+            flat.extend(_flatten(value))
+        else:
+            flat.append(float(value))
+    return flat
+
+
+def _font_size(font):
+    """Tk font tanımındaki punto (font yoksa Tk varsayılanı)"""
+    if isinstance(font, (tuple, list)) and len(font) > 1:
+        return abs(float(font[1]))
+    return 10.0
+
+
+def _svg_number(value):
+    return ('%.2f' % value).rstrip('0').rstrip('.')
+
+
+def _svg_color(color):
+    """Tk renk adını SVG'ye uygun hale getir ('light blue' -> 'lightblue')"""
+    if not color:
+        return 'none'
+    return xml_escape(str(color).replace(' ', '').lower(), {'"': '&quot;'})
+
+
+def _svg_points(coords):
+    return ' '.join(
+        f'{_svg_number(coords[i])},{_svg_number(coords[i + 1])}'
+        for i in range(0, len(coords) - 1, 2)
+    )
+
+
+def _svg_item(item):
+    coords = item['coords']
+    kind = item['type']
+    if kind == 'line':
+        if not item.get('fill') or len(coords) < 4:
+            return None
+        return (
+            f'<polyline points="{_svg_points(coords)}" fill="none" '
+            f'stroke="{_svg_color(item["fill"])}" stroke-width="{_svg_number(item.get("width", 1))}" '
+            'stroke-linecap="round" stroke-linejoin="round"/>'
+        )
+    if kind == 'polygon':
+        if not item.get('fill') and not item.get('outline') or len(coords) < 6:
+            return None
+        return (
+            f'<polygon points="{_svg_points(coords)}" fill="{_svg_color(item.get("fill"))}" '
+            f'stroke="{_svg_color(item.get("outline"))}" stroke-width="{_svg_number(item.get("width", 1))}"/>'
+        )
+    if kind == 'text' and item.get('text'):
+        font = item.get('font')
+        family = font[0] if isinstance(font, (tuple, list)) and font else 'Arial'
+        style = font[2] if isinstance(font, (tuple, list)) and len(font) > 2 else 'normal'
+        anchor = {'sw': 'start', 's': 'middle', 'se': 'end'}.get(item.get('anchor'), 'middle')
+        weight = ' font-weight="bold"' if 'bold' in str(style) else ''
+        italic = ' font-style="italic"' if 'italic' in str(style) else ''
+        return (
+            f'<text x="{_svg_number(coords[0])}" y="{_svg_number(coords[1])}" '
+            f'fill="{_svg_color(item.get("fill"))}" font-family="{xml_escape(str(family))}" '
+            f'font-size="{_svg_number(_font_size(font))}pt" text-anchor="{anchor}"{weight}{italic}>'
+            f'{xml_escape(str(item["text"]))}</text>'
+        )
+    # Resim öğeleri (gif şekiller, bgpic) gösterilmez
+    return None
+
+
+def _render_svg(canvas):
+    """Kanvasın son halini SVG'ye çevir; görünüm alanı pencere ve çizimi kapsar"""
+    elements = []
+    xs = [-canvas.width / 2, canvas.width / 2]
+    ys = [-canvas.height / 2, canvas.height / 2]
+    for item_id in canvas.order:
+        item = canvas.items[item_id]
+        element = _svg_item(item)
+        if element is None:
+            continue
+        elements.append(element)
+        xs.extend(item['coords'][0::2])
+        ys.extend(item['coords'][1::2])
+
+    margin = 10
+    left, top = min(xs) - margin, min(ys) - margin
+    width, height = max(xs) + margin - left, max(ys) + margin - top
+    box = ' '.join(_svg_number(value) for value in (left, top, width, height))
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{box}" '
+        f'width="{int(width)}" height="{int(height)}">'
+        f'<rect x="{_svg_number(left)}" y="{_svg_number(top)}" width="100%" height="100%" '
+        f'fill="{_svg_color(canvas.bg)}"/>'
+        + ''.join(elements) + '</svg>'
+    ), int(width), int(height)
+
+
+def patch_turtle(turtle):
+    """Tk penceresi yerine bellekte çizen ekran; çizim program bitince SVG olarak döner
+
+    done(), mainloop() ve exitonclick() tıklama beklemez, hemen döner.
+    """
+
+    class HeadlessScreen(turtle.TurtleScreen):
+        _title = turtle._CFG['title']
+
+        def __init__(self):
+            self._emitted = False
+            canvas = _HeadlessCanvas(turtle._CFG['canvwidth'], turtle._CFG['canvheight'])
+            turtle.TurtleScreen.__init__(self, canvas)
+
+        def _blankimage(self):
+            return ''
+
+        def _image(self, filename):
+            return filename
+
+        def _iscolorstring(self, color):
+            return bool(color) and all(char.isalnum() or char in '# ' for char in color)
+
+        def setup(self, width=turtle._CFG['width'], height=turtle._CFG['height'],
+                  startx=None, starty=None):
+            # Ondalık değerler ekran oranıdır; sunucuda ekran yok, tuval boyutu kalır
+            if isinstance(width, int):
+                self.cv.width = width
+            if isinstance(height, int):
+                self.cv.height = height
+
+        def title(self, titlestring):
+            HeadlessScreen._title = titlestring
+
+        def mainloop(self):
+            if not self.cv.run_timers(TURTLE_MAX_TIMER_CALLS):
+                print(f"[🐢 {TURTLE_MAX_TIMER_CALLS} zamanlayıcı çağrısından sonra durduruldu]")
+
+        done = mainloop
+
+        def exitonclick(self):
+            self.mainloop()
+
+        def bye(self):
+            self.emit()
+            turtle.Turtle._pen = None
+            turtle.Turtle._screen = None
+            turtle.TurtleScreen._RUNNING = False
+
+        def textinput(self, title, prompt):
+            # İletişim kutusu yerine stdin'den okunur; girdi yoksa iptal sayılır
+            try:
+                return input(f"{prompt} ")
+            except EOFError:
+                return None
+
+        def numinput(self, title, prompt, default=None, minval=None, maxval=None):
+            answer = self.textinput(title, prompt)
+            if answer is None:
+                return None
+            try:
+                value = float(answer)
+            except ValueError:
+                return default
+            if minval is not None and value < minval or maxval is not None and value > maxval:
+                return default
+            return value
+
+        def emit(self):
+            """Çizimi bir kez SVG görüntüsü olarak gönder"""
+            if self._emitted:
+                return
+            self._emitted = True
+            sys.stdout.flush()
+            svg, width, height = _render_svg(self.cv)
+            data = svg.encode('utf-8')
+            if len(data) > FIGURE_MAX_BYTES:
+                print("[⚠️ Turtle çizimi çok büyük, gösterilemedi]")
+                return
+            emitted = artifacts.emit(
+                'image', data=artifacts.encode_bytes(data), mime='image/svg+xml',
+                width=width, height=height, title=HeadlessScreen._title
+            )
+            if not emitted:
+                print("[🐢 Turtle çizimi bu platformda gösterilemiyor]")
+
+    turtle._Screen = HeadlessScreen
+
+    def emit_at_exit():
+        screen = turtle.Turtle._screen
+        if screen is not None:
+            screen.emit()
+
+    atexit.register(emit_at_exit)
+
+
+# PYGAME
+class _PygameRecorder:
+    """Ekran yüzeyini sabit hızda yakalar, sadece değişen bölgeleri saklar
+
+    İlk kare (ve çözünürlük değişince) tam kare, sonrakiler önceki kareden
+    farklı olan dikdörtgenin PNG'sidir. Kare, süre veya byte sınırına
+    ulaşılınca kayıt gönderilir ve program durdurulur.
+    """
+
+    def __init__(self, pygame):
+        self.pygame = pygame
+        self.frames = []
+        self.bytes = 0
+        self.started_at = None
+        self.last_capture = None
+        self.previous = None
+        self.size = None
+        self.first_size = None
+        self.finished = False
+
+    def _scale(self, surface):
+        width, height = surface.get_size()
+        if max(width, height) <= PYGAME_MAX_DIMENSION:
+            return surface
+        scale = PYGAME_MAX_DIMENSION / max(width, height)
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        try:
+            return self.pygame.transform.smoothscale(surface, size)
+        except ValueError:
+            return self.pygame.transform.scale(surface, size)
+
+    def _changed_rect(self, surface):
+        """Önceki kareden farklı bölge (değişiklik yoksa None); numpy yoksa tam kare"""
+        width, height = surface.get_size()
+        try:
+            pixels = self.pygame.surfarray.array3d(surface)
+        except ImportError:
+            pixels = None
+        previous, self.previous = self.previous, pixels
+        if previous is None or pixels is None:
+            return (0, 0, width, height)
+
+        changed = (pixels != previous).any(axis=2)
+        columns = changed.any(axis=1).nonzero()[0]
+        if not len(columns):
+            return None
+        rows = changed.any(axis=0).nonzero()[0]
+        x, y = int(columns[0]), int(rows[0])
+        return (x, y, int(columns[-1]) - x + 1, int(rows[-1]) - y + 1)
+
+    def capture(self):
+        if self.finished:
+            return
+        surface = self.pygame.display.get_surface()
+        if surface is None:
+            return
+        now = time.monotonic()
+        if self.last_capture is not None and now - self.last_capture < 1 / PYGAME_CAPTURE_FPS:
+            return
+        if self.started_at is None:
+            self.started_at = now
+        self.last_capture = now
+
+        surface = self._scale(surface)
+        frame = {'t': int((now - self.started_at) * 1000)}
+        if surface.get_size() != self.size:
+            # Çözünürlük değişti: tam kare gönder
+            self.size = surface.get_size()
+            self.first_size = self.first_size or self.size
+            self.previous = None
+            frame['width'], frame['height'] = self.size
+
+        rect = self._changed_rect(surface)
+        if rect is not None:
+            buffer = io.BytesIO()
+            self.pygame.image.save(surface.subsurface(rect), buffer, 'png')
+            data = buffer.getvalue()
+            frame.update(x=rect[0], y=rect[1], data=artifacts.encode_bytes(data))
+            self.frames.append(frame)
+            self.bytes += len(data)
+
+        if (len(self.frames) >= PYGAME_MAX_FRAMES or self.bytes >= PYGAME_MAX_BYTES
+                or now - self.started_at >= PYGAME_MAX_SECONDS):
+            self.finish()
+            print("[🎮 Kayıt sınırına ulaşıldı, oyun durduruldu]")
+            raise SystemExit(0)
+
+    def finish(self):
+        """Kaydı bir kez animasyon olarak gönder"""
+        if self.finished:
+            return
+        self.finished = True
+        if not self.frames:
+            return
+        sys.stdout.flush()
+        duration = int((self.last_capture - self.started_at) * 1000) + int(1000 / PYGAME_CAPTURE_FPS)
+        emitted = artifacts.emit(
+            'animation',
+            mime='image/png',
+            width=self.first_size[0],
+            height=self.first_size[1],
+            duration=duration,
+            frames=self.frames
+        )
+        if not emitted:
+            print("[🎮 Oyun ekranı bu platformda gösterilemiyor]")
+
+
+def patch_pygame(pygame):
+    """display.flip/update sonrası ekranı kaydet (SDL dummy sürücüsüyle pencere yok)"""
+    recorder = _PygameRecorder(pygame)
+    _original_flip = pygame.display.flip
+    _original_update = pygame.display.update
+    _original_quit = pygame.quit
+
+    def custom_flip(*args, **kwargs):
+        result = _original_flip(*args, **kwargs)
+        recorder.capture()
+        return result
+
+    def custom_update(*args, **kwargs):
+        result = _original_update(*args, **kwargs)
+        recorder.capture()
+        return result
+
+    def custom_quit(*args, **kwargs):
+        recorder.finish()
+        return _original_quit(*args, **kwargs)
+
+    pygame.display.flip = custom_flip
+    pygame.display.update = custom_update
+    pygame.quit = custom_quit
+
+    # pygame.quit() çağrılmadan biten programların kaydı da gönderilsin
+    atexit.register(recorder.finish)
+
+
+# PYGAME ZERO
+def patch_pgzrun(pgzrun):
+    """pgzrun.go() override'ı"""
+    _original_go = pgzrun.go
+
+    def custom_go(*args, **kwargs):
+        print("[🎮 Pygame Zero oyunu başlatılıyor, ekran kaydediliyor...]")
+
+        # Pencere ayarları
+        try:
+            import pygame
+            pygame.display.set_caption("Pygame Zero Oyun")
+        except Exception as e:
+            print(f"[🎮 Pygame Zero setup error: {e}]")
+        return _original_go(*args, **kwargs)
+
+    pgzrun.go = custom_go
+
+
+# PLOTLY
+def patch_plotly(go):
+    """Plotly grafiğini HTML dosyası yerine JSON olarak gönder"""
+    import plotly
+    import plotly.io as pio
+
+    def custom_show_plotly(fig, *args, **kwargs):
+        try:
+            if not isinstance(fig, go.Figure):
+                fig = go.Figure(fig)
+            sys.stdout.flush()
+            spec = json.loads(fig.to_json())
+            if not artifacts.emit('plotly', spec=spec, version=plotly.__version__):
+                print("[📊 Plotly grafiği oluşturuldu, ancak bu platformda görüntülenemiyor]")
+        except Exception as e:
+            print(f"[❌ Plotly hatası: {e}]")
+
+    go.Figure.show = custom_show_plotly
+    pio.show = custom_show_plotly
+
+
+# BOKEH
+def patch_bokeh(plotting):
+    """Bokeh grafiğini HTML dosyası yerine JSON olarak gönder"""
+    import bokeh
+    import bokeh.io
+    from bokeh.embed import json_item
+
+    def custom_show_bokeh(obj, *args, **kwargs):
+        try:
+            sys.stdout.flush()
+            if not artifacts.emit('bokeh', spec=json_item(obj), version=bokeh.__version__):
+                print("[📊 Bokeh grafiği oluşturuldu, ancak bu platformda görüntülenemiyor]")
+        except Exception as e:
+            print(f"[📊 Bokeh hatası: {e}]")
+
+    plotting.show = custom_show_bokeh
+    bokeh.io.show = custom_show_bokeh
+
+
+# Modül adı -> yama fonksiyonu
+PATCHES = {
+    'matplotlib': patch_matplotlib,
+    'matplotlib.pyplot': patch_pyplot,
+    'cv2': patch_cv2,
+    'turtle': patch_turtle,
+    'pygame': patch_pygame,
+    'pgzrun': patch_pgzrun,
+    'plotly.graph_objects': patch_plotly,
+    'bokeh.plotting': patch_bokeh,
+}
+
+_applied = set()
+_in_progress = set()
+
+
+def apply_patch(name):
+    """Yüklenmiş modüle yamasını bir kez uygula"""
+    if name in _applied or name not in sys.modules:
+        return
+    _applied.add(name)
+    try:
+        PATCHES[name](sys.modules[name])
+    except Exception as e:
+        print(f"[⚠️ {name} setup error: {e}]")
+
+
+class _PatchingLoader(importlib.abc.Loader):
+    """Asıl loader'ı sarar, modül çalıştıktan sonra yamayı uygular"""
+
+    def __init__(self, loader, name):
+        self.loader = loader
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        _in_progress.add(self.name)
+        try:
+            self.loader.exec_module(module)
+        finally:
+            _in_progress.discard(self.name)
+        # Bazı paketler (cv2) kendini sys.modules'da değiştirir
+        apply_patch(self.name)
+
+    def __getattr__(self, attr):
+        return getattr(self.loader, attr)
+
+
+class PatchingFinder(importlib.abc.MetaPathFinder):
+    """Yamalı kütüphaneler import edildiğinde loader'ı sarmalayan finder"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in PATCHES or fullname in _applied or fullname in _in_progress:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+            return spec
+        spec.loader = _PatchingLoader(spec.loader, fullname)
+        return spec
+
+
+def install():
+    """Yama hook'larını kur; zaten yüklenmiş kütüphaneleri hemen yamala"""
+    import warnings
+    warnings.filterwarnings('ignore')
+
+    if not any(isinstance(finder, PatchingFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, PatchingFinder())
+
+    for name in PATCHES:
+        apply_patch(name)
@@ -0,0 +1,178 @@
+"""Kullanıcı başına adil paylaşımlı çalıştırma zamanlayıcısı
+
+Aynı anda çalışan toplam süreç sayısı ve kullanıcı başına eşzamanlı çalıştırma
+sayısı sınırlıdır. Boşalan her yer, bekleyen kullanıcılar arasında son
+dakikalarda en az çalıştırma süresi tüketene verilir; eşitlikte en uzun
+süredir hizmet almayan seçilir (round-robin). Böylece sürekli "Çalıştır"a basan
+bir kullanıcı diğerlerini bekletemez, yoğun kullanıcılar düşük öncelik alır.
+"""
+import collections
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+MAX_CONCURRENT_RUNS = int(os.environ.get('EXECUTION_MAX_CONCURRENT_RUNS', '4'))
+MAX_RUNS_PER_USER = int(os.environ.get('EXECUTION_MAX_RUNS_PER_USER', '2'))
+USAGE_HALF_LIFE = float(os.environ.get('EXECUTION_USAGE_HALF_LIFE', '60'))
+SLOT_WAIT_TIMEOUT = float(os.environ.get('EXECUTION_SLOT_WAIT_TIMEOUT', '60'))
+
+_POLL_INTERVAL = 0.2
+
+
+class SchedulerBusy(Exception):
+    """Bekleme süresi içinde çalıştırma yeri bulunamadı"""
+
+
+class _Waiter:
+    def __init__(self, user_id, on_grant=None):
+        self.user_id = user_id
+        self.on_grant = on_grant
+        self.granted = threading.Event()
+        self.enqueued_at = time.monotonic()
+
+
+class FairShareScheduler:
+    """Kullanıcı kuyrukları arasında ağırlıklı round-robin"""
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT_RUNS, per_user_limit=MAX_RUNS_PER_USER,
+                 half_life=USAGE_HALF_LIFE):
+        self.max_concurrent = max_concurrent
+        self.per_user_limit = per_user_limit
+        self.half_life = half_life
+        self._lock = threading.Lock()
+        self._queues = collections.OrderedDict()  # user_id -> deque[_Waiter]
+        self._running = collections.Counter()
+        self._usage = {}  # user_id -> (azalan kullanım saniyesi, son güncelleme)
+        self._last_served = {}
+        self.stats = {'granted': 0, 'timeouts': 0, 'total_wait_time': 0.0}
+
+    def _decayed_usage(self, user_id, now):
+        usage, updated_at = self._usage.get(user_id, (0.0, now))
+        return usage * 0.5 ** ((now - updated_at) / self.half_life)
+
+    def _pick_user(self, now):
+        """Yer verilecek kullanıcıyı seç (en az kullanım, sonra en eski hizmet)"""
+        candidates = [
+            user_id for user_id, waiters in self._queues.items()
+            if waiters and self._running[user_id] < self.per_user_limit
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda user_id: (
+                self._decayed_usage(user_id, now),
+                self._last_served.get(user_id, 0)
+            )
+        )
+
+    def _dispatch(self):
+        """Boş yerleri bekleyenlere dağıt (kilit tutulurken çağrılır)
+
+        Kilit bırakıldıktan sonra çağrılacak on_grant geri çağırımlarını döner.
+        """
+        now = time.monotonic()
+        callbacks = []
+        while sum(self._running.values()) < self.max_concurrent:
+            user_id = self._pick_user(now)
+            if user_id is None:
+                break
+            waiter = self._queues[user_id].popleft()
+            if not self._queues[user_id]:
+                del self._queues[user_id]
+            self._running[user_id] += 1
+            self._last_served[user_id] = now
+            self.stats['granted'] += 1
+            self.stats['total_wait_time'] += now - waiter.enqueued_at
+            waiter.granted.set()
+            if waiter.on_grant is not None:
+                callbacks.append(waiter.on_grant)
+        return callbacks
+
+    def _remove(self, waiter):
+        """Bekleyeni sırasından çıkar (kilit tutulurken çağrılır)"""
+        waiters = self._queues[waiter.user_id]
+        waiters.remove(waiter)
+        if not waiters:
+            del self._queues[waiter.user_id]
+
+    def _enqueue(self, waiter):
+        with self._lock:
+            self._queues.setdefault(waiter.user_id, collections.deque()).append(waiter)
+            callbacks = self._dispatch()
+        for callback in callbacks:
+            callback()
+
+    def enqueue(self, user_id, on_grant):
+        """Beklemeden sıraya gir; yer verilince on_grant() çağrılır, yer sahibi release etmeli"""
+        waiter = _Waiter(user_id, on_grant)
+        self._enqueue(waiter)
+        return waiter
+
+    def withdraw(self, waiter):
+        """Henüz yer verilmemiş bekleyeni sıradan çıkar; yer verildiyse False"""
+        with self._lock:
+            if waiter.granted.is_set():
+                return False
+            self._remove(waiter)
+            return True
+
+    def acquire(self, user_id, timeout=SLOT_WAIT_TIMEOUT, should_abort=None):
+        """Kullanıcı için çalıştırma yeri al; zaman aşımında SchedulerBusy"""
+        waiter = _Waiter(user_id)
+        self._enqueue(waiter)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not waiter.granted.is_set():
+            wait = _POLL_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+            aborted = should_abort is not None and should_abort()
+            if aborted or wait <= 0:
+                with self._lock:
+                    if waiter.granted.is_set():
+                        break
+                    self._remove(waiter)
+                    if not aborted:
+                        self.stats['timeouts'] += 1
+                raise SchedulerBusy('Sunucu şu anda meşgul, lütfen tekrar deneyin')
+            waiter.granted.wait(wait)
+
+    def release(self, user_id, elapsed):
+        """Yeri bırak ve kullanıcının tükettiği süreyi hesaba kat"""
+        with self._lock:
+            now = time.monotonic()
+            self._usage[user_id] = (self._decayed_usage(user_id, now) + elapsed, now)
+            self._running[user_id] -= 1
+            if self._running[user_id] <= 0:
+                del self._running[user_id]
+            callbacks = self._dispatch()
+        for callback in callbacks:
+            callback()
+
+    @contextmanager
+    def slot(self, user_id, timeout=SLOT_WAIT_TIMEOUT, should_abort=None):
+        """with scheduler.slot(user_id): ... şeklinde kullanım"""
+        self.acquire(user_id, timeout=timeout, should_abort=should_abort)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(user_id, time.monotonic() - start)
+
+    def queue_position(self, user_id):
+        """Kullanıcının bekleyen çalıştırma sayısı"""
+        with self._lock:
+            return len(self._queues.get(user_id, ()))
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'per_user_limit': self.per_user_limit,
+                'running': sum(self._running.values()),
+                'waiting': sum(len(waiters) for waiters in self._queues.values()),
+                'waiting_users': len(self._queues),
+                **self.stats
+            }
@@ -0,0 +1,91 @@
+"""Boyut sınırlı, süreli LRU önbellek"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """Thread-safe LRU önbellek: kayıt sayısı, toplam boyut ve süre sınırlı
+
+    En az kullanılan kayıtlar max_entries veya max_bytes aşılınca atılır;
+    süresi (ttl saniye) dolan kayıtlar okunurken düşer.
+    """
+
+    def __init__(self, max_entries=1024, ttl=300, max_bytes=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()  # key -> (value, size, expires_at)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=1):
+        """Kaydı ekle; tek başına max_bytes'ı aşan kayıtlar saklanmaz"""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, expires_at)
+            self._bytes += size
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+        return True
+
+    def _remove(self, key):
+        _value, size, _expires_at = self._data.pop(key)
+        self._bytes -= size
+
+    def invalidate(self, key):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[2] is None or entry[2] > time.monotonic())
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -0,0 +1,79 @@
+"""Plotly ve Bokeh JavaScript kütüphanelerinin paylaşılan, sürümlü kopyaları
+
+Grafikler artık her seferinde plotly.js'i gömen HTML dosyaları yerine JSON
+olarak döner; tarayıcı kütüphaneyi bir kez /api/vendor/<kütüphane>/<sürüm>/
+adresinden indirir ve sürüm URL'de olduğu için uzun süre önbellekte tutar.
+Dosyalar kurulu Python paketlerinin içinden okunur, paketler import edilmez.
+"""
+import gzip
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
+import threading
+
+# Kütüphane -> (Python paketi, {dosya adı: paket içindeki yol})
+VENDOR_ASSETS = {
+    'plotly': ('plotly', {
+        'plotly.min.js': 'package_data/plotly.min.js',
+    }),
+    'bokeh': ('bokeh', {
+        'bokeh.min.js': 'server/static/js/bokeh.min.js',
+        'bokeh-widgets.min.js': 'server/static/js/bokeh-widgets.min.js',
+        'bokeh-tables.min.js': 'server/static/js/bokeh-tables.min.js',
+        'bokeh-gl.min.js': 'server/static/js/bokeh-gl.min.js',
+    }),
+}
+
+# Sürüm URL'de olduğu için içerik hiç değişmez
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+class VendorAsset:
+    """Belleğe alınmış bir JS dosyası ve gzip'li hali"""
+
+    def __init__(self, data):
+        self.data = data
+        self.gzipped = gzip.compress(data, compresslevel=9)
+        self.etag = hashlib.sha256(data).hexdigest()[:32]
+
+
+_assets = {}
+_lock = threading.Lock()
+
+
+def library_version(library):
+    """Kurulu kütüphane sürümü (kurulu değilse None)"""
+    if library not in VENDOR_ASSETS:
+        return None
+    try:
+        return importlib.metadata.version(VENDOR_ASSETS[library][0])
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _asset_path(library, filename):
+    package, files = VENDOR_ASSETS[library]
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(spec.submodule_search_locations[0], files[filename])
+
+
+def get_asset(library, version, filename):
+    """İstenen sürüm kuruluysa dosyayı döndür (ilk istekte okunur ve sıkıştırılır)"""
+    if library not in VENDOR_ASSETS or filename not in VENDOR_ASSETS[library][1]:
+        return None
+    if version != library_version(library):
+        return None
+
+    key = (library, version, filename)
+    with _lock:
+        asset = _assets.get(key)
+        if asset is None:
+            path = _asset_path(library, filename)
+            if path is None or not os.path.isfile(path):
+                return None
+            with open(path, 'rb') as f:
+                asset = _assets[key] = VendorAsset(f.read())
+    return asset
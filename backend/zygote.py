@@ -0,0 +1,278 @@
+"""Ağır kütüphaneleri önceden yüklemiş, her çalıştırma için fork eden zygote süreci
+
+Flask tarafındaki InterpreterPool bu betiği bir UNIX soket çifti ile başlatır.
+Zygote önce kurulum kodunu bir kez çalıştırır ve ağır kütüphaneleri
+(matplotlib, cv2, turtle...) önceden import eder, sonra her "run" isteği için
+temiz bir çocuk süreç fork eder. Çocuğun stdin/stdout/stderr uçları istekle
+birlikte SCM_RIGHTS üzerinden gönderilir.
+"""
+import atexit
+import builtins
+import importlib
+import json
+import linecache
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import traceback
+import types
+
+import artifacts
+from process_group import kill_group
+from resource_usage import count_child_processes, rusage_to_dict, write_report
+
+HEADER = struct.Struct('!I')
+MAX_FDS = 8
+PR_SET_CHILD_SUBREAPER = 36
+USER_CODE_FILENAME = 'main.py'
+
+
+def _recv_exact(sock, size):
+    """Soketten tam olarak size byte oku (EOF'ta None döner)"""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def send_message(sock, message, fds=()):
+    """Uzunluk önekli JSON mesaj gönder (isteğe bağlı dosya tanımlayıcılarıyla)"""
+    payload = json.dumps(message).encode('utf-8')
+    header = HEADER.pack(len(payload))
+    if fds:
+        socket.send_fds(sock, [header], list(fds))
+    else:
+        sock.sendall(header)
+    sock.sendall(payload)
+
+
+def recv_message(sock):
+    """Uzunluk önekli JSON mesaj al, (mesaj, fds) döner; EOF'ta (None, [])"""
+    data, fds, _flags, _addr = socket.recv_fds(sock, HEADER.size, MAX_FDS)
+    if not data:
+        return None, fds
+    if len(data) < HEADER.size:
+        rest = _recv_exact(sock, HEADER.size - len(data))
+        if rest is None:
+            return None, fds
+        data += rest
+    (length,) = HEADER.unpack(data)
+    payload = _recv_exact(sock, length)
+    if payload is None:
+        return None, fds
+    return json.loads(payload.decode('utf-8')), fds
+
+
+def returncode_from_status(status):
+    """waitpid durumunu subprocess tarzı returncode'a çevir"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _exit_code(exc):
+    """SystemExit değerini yorumlayıcının yaptığı gibi çıkış koduna çevir"""
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_user_code(code, namespace, report_fd=None, artifact_fd=None):
+    """Kullanıcı kodunu çocuk süreçte çalıştır ve çıkış kodunu döndür
+
+    report_fd verilirse çıkmadan önce alt süreç ve I/O sayaçları oraya yazılır;
+    artifact_fd grafik/görüntü çıktılarının gönderildiği kanaldır.
+    """
+    # Traceback'lerde kaynak satırları görünsün
+    linecache.cache[USER_CODE_FILENAME] = (
+        len(code), None, code.splitlines(True), USER_CODE_FILENAME
+    )
+    sys.argv = [USER_CODE_FILENAME]
+    if artifact_fd is not None:
+        artifacts.open_channel(artifact_fd)
+
+    # Fork sonrası rastgele sayı üreteçleri zygote ile aynı durumda kalmasın
+    if 'numpy' in sys.modules:
+        try:
+            sys.modules['numpy'].random.seed()
+        except Exception:
+            pass
+
+    # pgzrun gibi kütüphaneler kullanıcı kodunu sys.modules['__main__'] ile bulur
+    main_module = types.ModuleType('__main__')
+    main_module.__dict__.update(namespace)
+    main_module.__file__ = USER_CODE_FILENAME
+    sys.modules['__main__'] = main_module
+
+    counter = count_child_processes() if report_fd is not None else None
+    try:
+        exec(compile(code, USER_CODE_FILENAME, 'exec'), main_module.__dict__)
+        return 0
+    except SystemExit as exc:
+        return _exit_code(exc)
+    except BaseException as exc:
+        # exec çerçevesini atla, sadece kullanıcı kodu görünsün
+        traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+        return 1
+    finally:
+        if report_fd is not None:
+            write_report(report_fd, counter)
+
+
+def _exit_child(exit_code):
+    """Çocuğu yorumlayıcı kapanışını beklemeden sonlandır
+
+    Normal çıkıştaki gibi ön plan iş parçacıkları beklenir, atexit işleyicileri
+    (bekleyen grafikler) çalışır ve akışlar boşaltılır; önceden yüklenmiş ağır
+    kütüphanelerin modül temizliği (~0.4 sn) ise atlanır.
+    """
+    try:
+        for thread in threading.enumerate():
+            if thread is not threading.main_thread() and not thread.daemon:
+                thread.join()
+        atexit._run_exitfuncs()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def _fork_child(sock, request, fds, namespace):
+    """Çocuk süreci fork et; zygote'ta çocuğun pid'ini döner, çocuk kod bitince çıkar"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Çocuk süreç: kendi oturumunda çalışsın ki alt süreçleriyle birlikte
+    # durdurulabilsin. Standart akışları gelen pipe'lara bağla; rapor ve
+    # artifact pipe'ları (varsa 4. ve 5. fd) açık kalır
+    os.setsid()
+    sock.close()
+    report_fd = fds[3] if len(fds) > 3 else None
+    artifact_fd = fds[4] if len(fds) > 4 else None
+    for target, fd in enumerate(fds[:3]):
+        os.dup2(fd, target)
+    for fd in fds:
+        if fd not in (report_fd, artifact_fd):
+            os.close(fd)
+
+    _exit_child(run_user_code(request['code'], namespace, report_fd, artifact_fd))
+
+
+def _become_subreaper():
+    """Linux'ta kullanıcı kodunun artık torunları init yerine zygote'a bağlansın"""
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        import ctypes
+        ctypes.CDLL(None, use_errno=True).prctl(PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _reap_orphans(expected=0, timeout=0.5):
+    """Zygote'a bağlanmış, çıkmış torunları topla (zombi kalmasın)
+
+    Yeni öldürülen expected kadar süreç için en fazla timeout saniye beklenir.
+    """
+    deadline = time.monotonic() + timeout
+    reaped = 0
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid:
+            reaped += 1
+            continue
+        if reaped >= expected or time.monotonic() >= deadline:
+            return
+        time.sleep(0.005)
+
+
+def serve(sock, namespace):
+    """İstek döngüsü; soket kapanınca 0 döner"""
+    while True:
+        request, fds = recv_message(sock)
+        if request is None:
+            for fd in fds:
+                os.close(fd)
+            return 0
+
+        op = request.get('op')
+        if op == 'ping':
+            send_message(sock, {'pong': True, 'pid': os.getpid()})
+            continue
+
+        if op != 'run' or len(fds) < 3:
+            for fd in fds:
+                os.close(fd)
+            send_message(sock, {'error': f'Geçersiz istek: {op}'})
+            continue
+
+        pid = _fork_child(sock, request, fds, namespace)
+        for fd in fds:
+            os.close(fd)
+        send_message(sock, {'pid': pid})
+
+        _, status, rusage = os.wait4(pid, 0)
+        # Ana süreç bitti: grupta kalan alt süreçleri öldür
+        orphans_killed = kill_group(pid)
+        _reap_orphans(orphans_killed)
+        send_message(sock, {
+            'returncode': returncode_from_status(status),
+            'rusage': rusage_to_dict(rusage),
+            'orphans_killed': orphans_killed
+        })
+
+
+def main():
+    sock = socket.socket(fileno=int(sys.argv[1]))
+
+    init, _ = recv_message(sock)
+    if init is None:
+        return 0
+
+    # Kurulum kodunu bir kez çalıştır; çocuklar bu isim alanının kopyasını alır
+    namespace = {'__name__': '__main__', '__builtins__': builtins}
+    try:
+        exec(compile(init.get('setup_code', ''), '<setup>', 'exec'), namespace)
+    except Exception as e:
+        send_message(sock, {'ready': False, 'error': str(e)})
+        return 1
+
+    # Ağır kütüphaneleri ısıt; yamaları import hook'ları burada uygular
+    for module_name in init.get('preload', []):
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            pass
+
+    # Kullanıcı kodu backend modüllerini (app, database...) import edemesin
+    backend_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [path for path in sys.path if path != backend_dir]
+
+    _become_subreaper()
+    send_message(sock, {'ready': True, 'pid': os.getpid()})
+    return serve(sock, namespace)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import { useEffect, useRef, useState } from 'react'
+import { AnimationFrame, ExecutionArtifact } from '@/types'
+
+// Backend'in sürümlü olarak sunduğu kütüphane dosyaları (sırayla yüklenir)
+const VENDOR_SCRIPTS: Record<string, string[]> = {
+  plotly: ['plotly.min.js'],
+  bokeh: ['bokeh.min.js', 'bokeh-widgets.min.js', 'bokeh-tables.min.js', 'bokeh-gl.min.js'],
+}
+
+const loadedScripts = new Map<string, Promise<void>>()
+
+const loadScript = (src: string) => {
+  let promise = loadedScripts.get(src)
+  if (!promise) {
+    promise = new Promise<void>((resolve, reject) => {
+      const script = document.createElement('script')
+      script.src = src
+      script.async = false
+      script.onload = () => resolve()
+      script.onerror = () => {
+        loadedScripts.delete(src)
+        reject(new Error(`${src} yüklenemedi`))
+      }
+      document.head.appendChild(script)
+    })
+    loadedScripts.set(src, promise)
+  }
+  return promise
+}
+
+const loadLibrary = async (library: string, version: string) => {
+  for (const filename of VENDOR_SCRIPTS[library]) {
+    await loadScript(`/api/vendor/${library}/${version}/${filename}`)
+  }
+}
+
+let chartCounter = 0
+
+const InteractiveChart = ({ artifact }: { artifact: ExecutionArtifact }) => {
+  const containerRef = useRef<HTMLDivElement>(null)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    const container = containerRef.current
+    if (!container || !artifact.version) return
+    let cancelled = false
+
+    loadLibrary(artifact.kind, artifact.version)
+      .then(() => {
+        if (cancelled) return
+        const globals = window as any
+        if (artifact.kind === 'plotly') {
+          globals.Plotly.newPlot(container, artifact.spec.data, artifact.spec.layout, { responsive: true })
+        } else {
+          container.id = `bokeh-chart-${++chartCounter}`
+          globals.Bokeh.embed.embed_item(artifact.spec, container.id)
+        }
+      })
+      .catch((err: Error) => setError(err.message))
+
+    return () => {
+      cancelled = true
+      container.innerHTML = ''
+    }
+  }, [artifact])
+
+  if (error) {
+    return <div className="mx-4 mb-4 text-red-400">[📊 Grafik gösterilemedi: {error}]</div>
+  }
+  return <div ref={containerRef} className="mx-4 mb-4 rounded bg-white" />
+}
+
+const decodeFrame = (mime: string, frame: AnimationFrame) =>
+  new Promise<HTMLImageElement>((resolve, reject) => {
+    const image = new Image()
+    image.onload = () => resolve(image)
+    image.onerror = () => reject(new Error('Kare çözülemedi'))
+    image.src = `data:${mime};base64,${frame.data}`
+  })
+
+// Pygame kaydı: ilk kare tam, sonrakiler sadece değişen bölgeler
+const AnimationPlayer = ({ artifact }: { artifact: ExecutionArtifact }) => {
+  const canvasRef = useRef<HTMLCanvasElement>(null)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    const canvas = canvasRef.current
+    const frames = artifact.frames ?? []
+    const context = canvas?.getContext('2d')
+    if (!canvas || !context || !frames.length) return
+    let cancelled = false
+    let timer: number | undefined
+
+    Promise.all(frames.map(frame => decodeFrame(artifact.mime ?? 'image/png', frame)))
+      .then(images => {
+        const duration = artifact.duration ?? frames[frames.length - 1].t + 100
+        const play = (index: number) => {
+          if (cancelled) return
+          if (index === 0) {
+            context.clearRect(0, 0, canvas.width, canvas.height)
+          }
+          const frame = frames[index]
+          if (frame.width && frame.height && (canvas.width !== frame.width || canvas.height !== frame.height)) {
+            canvas.width = frame.width
+            canvas.height = frame.height
+          }
+          context.drawImage(images[index], frame.x, frame.y)
+
+          // Son kareden sonra kısa bir bekleme ile başa dön
+          const next = (index + 1) % frames.length
+          const delay = next === 0 ? duration - frame.t + 1000 : frames[next].t - frame.t
+          timer = window.setTimeout(() => play(next), Math.max(delay, 0))
+        }
+        play(0)
+      })
+      .catch((err: Error) => setError(err.message))
+
+    return () => {
+      cancelled = true
+      window.clearTimeout(timer)
+    }
+  }, [artifact])
+
+  if (error) {
+    return <div className="mx-4 mb-4 text-red-400">[🎮 Kayıt oynatılamadı: {error}]</div>
+  }
+  return (
+    <figure className="mx-4 mb-4">
+      <canvas
+        ref={canvasRef}
+        width={artifact.width}
+        height={artifact.height}
+        className="max-w-full rounded bg-black"
+      />
+      <figcaption className="text-xs text-gray-500">
+        🎮 {artifact.frames?.length ?? 0} kare, {((artifact.duration ?? 0) / 1000).toFixed(1)} sn
+      </figcaption>
+    </figure>
+  )
+}
+
+const ArtifactView = ({ artifact }: { artifact: ExecutionArtifact }) => {
+  if (artifact.kind === 'image' && artifact.data) {
+    return (
+      <img
+        src={`data:${artifact.mime};base64,${artifact.data}`}
+        alt={`Figure ${artifact.figure ?? ''}`}
+        className="mx-4 mb-4 max-w-full rounded bg-white"
+      />
+    )
+  }
+  if (artifact.kind === 'frame' && artifact.data) {
+    return (
+      <figure className="mx-4 mb-4">
+        <img
+          src={`data:${artifact.mime};base64,${artifact.data}`}
+          alt={artifact.window}
+          className="max-w-full rounded"
+        />
+        <figcaption className="text-xs text-gray-500">
+          📷 {artifact.window} — kare {artifact.index}
+        </figcaption>
+      </figure>
+    )
+  }
+  if (artifact.kind === 'preview' && artifact.url) {
+    // HTML/CSS/JS önizlemesi backend'in önbelleğinden, korumalı iframe içinde
+    return (
+      <figure className="mx-4 mb-4">
+        <iframe
+          src={artifact.url}
+          title="Önizleme"
+          sandbox="allow-scripts allow-forms allow-modals allow-popups"
+          className="h-96 w-full rounded border border-gray-600 bg-white"
+        />
+        <figcaption className="text-xs text-gray-500">
+          🌐 <a href={artifact.url} target="_blank" rel="noreferrer" className="underline">Yeni sekmede aç</a>
+        </figcaption>
+      </figure>
+    )
+  }
+  if (artifact.kind === 'animation' && artifact.frames?.length) {
+    return <AnimationPlayer artifact={artifact} />
+  }
+  if (artifact.kind in VENDOR_SCRIPTS && artifact.spec) {
+    return <InteractiveChart artifact={artifact} />
+  }
+  return null
+}
+
+export default ArtifactView
@@ -12,9 +12,10 @@ import {
 } from 'lucide-react'
 import { useEditor } from '@/contexts/EditorContext'
 import Button from '@/components/ui/Button'
+import ArtifactView from './ArtifactView'
 
 const OutputPanel = () => {
-  const { output, isRunning, runCode, activeFile, clearOutput } = useEditor()
+  const { output, artifacts, isRunning, runCode, activeFile, clearOutput } = useEditor()
   const [isExpanded, setIsExpanded] = useState(true)
   const [isMaximized, setIsMaximized] = useState(false)
 
@@ -113,10 +114,15 @@ const OutputPanel = () => {
         className="overflow-hidden"
       >
         <div className={`${isMaximized ? 'h-full' : 'h-72'} overflow-auto bg-gray-900 text-green-400 font-mono text-sm`}>
-          {output ? (
-            <pre className="p-4 whitespace-pre-wrap leading-relaxed">
-              {output}
-            </pre>
+          {output || artifacts.length > 0 ? (
+            <>
+              <pre className="p-4 whitespace-pre-wrap leading-relaxed">
+                {output}
+              </pre>
+              {artifacts.map((artifact, index) => (
+                <ArtifactView key={index} artifact={artifact} />
+              ))}
+            </>
           ) : (
             <div className="flex items-center justify-center h-full text-gray-500">
               <div className="text-center">
@@ -1,6 +1,6 @@
 import { createContext, useContext, useState, useEffect, ReactNode } from 'react'
-import { EditorContextType, FileItem, ExecutionResult } from '@/types'
-import api from '@/utils/api'
+import { EditorContextType, FileItem, ExecutionEvent, ExecutionArtifact } from '@/types'
+import api, { streamExecute } from '@/utils/api'
 import toast from 'react-hot-toast'
 
 const EditorContext = createContext<EditorContextType | null>(null)
@@ -23,6 +23,7 @@ export const EditorProvider = ({ children }: EditorProviderProps) => {
   const [activeFile, setActiveFile] = useState<FileItem | null>(null)
   const [openFiles, setOpenFiles] = useState<FileItem[]>([])
   const [output, setOutput] = useState<string>('')
+  const [artifacts, setArtifacts] = useState<ExecutionArtifact[]>([])
   const [isRunning, setIsRunning] = useState(false)
   const [currentProject, setCurrentProject] = useState<FileItem | null>(null)
 
@@ -346,6 +347,7 @@ export const EditorProvider = ({ children }: EditorProviderProps) => {
 
   const clearOutput = () => {
     setOutput('')
+    setArtifacts([])
   }
 
   const runCode = async (code: string, language: string = 'python') => {
@@ -355,33 +357,66 @@ export const EditorProvider = ({ children }: EditorProviderProps) => {
     const timestamp = new Date().toLocaleTimeString()
     
     try {
-      const response = await api.post('/execute', { code, language })
-      const result: ExecutionResult = response.data.data
-      
-      let outputText = ''
-      
-      // Sadece gerçek çıktı varsa ekle
-      if (result.output && result.output.trim()) {
-        outputText += `[${timestamp}]\n${result.output}\n`
-      }
-      
+      let hasOutput = false
+      let endsWithNewline = true
+      let errorText = ''
+      let result: ExecutionEvent | null = null
+
+      // Çıktıyı üretildikçe göster
+      await streamExecute(code, language, (event) => {
+        if (event.type === 'stdout') {
+          const prefix = hasOutput ? '' : `[${timestamp}]\n`
+          hasOutput = true
+          endsWithNewline = event.text.endsWith('\n')
+          setOutput(prev => prev + prefix + event.text)
+        } else if (event.type === 'stderr') {
+          errorText += event.text
+        } else if (event.type === 'truncated') {
+          const notice = `\n... [${event.omitted_bytes} byte çıktı kırpıldı] ...\n`
+          if (event.stream === 'stderr') {
+            errorText += notice
+          } else {
+            setOutput(prev => prev + notice)
+          }
+        } else if (event.type === 'artifact') {
+          // Grafikler çıktının altında görüntü olarak gösterilir
+          // OpenCV kareleri aynı penceredeki önceki karenin yerine geçer (canlı görüntü)
+          setArtifacts(prev => {
+            const index = event.kind === 'frame'
+              ? prev.findIndex(item => item.kind === 'frame' && item.window === event.window)
+              : -1
+            if (index === -1) return [...prev, event]
+            const next = [...prev]
+            next[index] = event
+            return next
+          })
+        } else {
+          result = event
+        }
+      })
+
+      const done = result as ExecutionEvent | null
+      const error = done?.type === 'done' && done.error ? done.error : errorText
+
+      let outputText = endsWithNewline ? '' : '\n'
+
       // Hata varsa ekle
-      if (result.error && result.error.trim()) {
-        outputText += `[${timestamp}] ❌ Hata:\n${result.error}\n`
+      if (error.trim()) {
+        outputText += `[${timestamp}] ❌ Hata:\n${error.trim()}\n`
       }
-      
+
       // Çıktı veya hata varsa ayıraç ekle
-      if (outputText) {
+      if (hasOutput || error.trim()) {
         outputText += '─'.repeat(40) + '\n'
         setOutput(prev => prev + outputText)
       }
-      
+
       // Hata durumunda toast göster
-      if (!result.success && result.error) {
+      if (done?.type === 'done' && !done.success && error.trim()) {
         toast.error('Kod çalıştırılırken hata oluştu')
       }
     } catch (error: any) {
-      const errorMessage = error.response?.data?.message || 'Kod çalıştırılamadı'
+      const errorMessage = error.message || 'Kod çalıştırılamadı'
       setOutput(prev => prev + `[${timestamp}] ❌ Bağlantı hatası: ${errorMessage}\n` + '─'.repeat(40) + '\n')
       toast.error(errorMessage)
     } finally {
@@ -408,6 +443,7 @@ export const EditorProvider = ({ children }: EditorProviderProps) => {
       setFiles([])
       setAllFiles([])
       setOutput('')
+      setArtifacts([])
       
       // localStorage temizle
       localStorage.removeItem('newProjectCreated')
@@ -436,6 +472,7 @@ export const EditorProvider = ({ children }: EditorProviderProps) => {
     activeFile,
     openFiles,
     output,
+    artifacts,
     isRunning,
     currentProject,
     createFile,
@@ -56,7 +56,8 @@ const Dashboard = () => {
 
   const loadStats = async () => {
     try {
-      const response = await api.get('/files')
+      // Sayım için sadece tür alanı yeterli
+      const response = await api.get('/files', { params: { fields: 'type' } })
       if (response.data.success) {
         const files = response.data.data.files || []
         const projects = files.filter((file: any) => file.type === 'project')
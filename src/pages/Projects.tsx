@@ -33,13 +33,19 @@ interface ProjectFile {
   parent_id?: string
   created_at: string
   updated_at?: string
+  child_count?: number
 }
 
+// Projeler sayfa sayfa yüklenir; dosya içerikleri hiç istenmez
+const PROJECTS_PAGE_SIZE = 48
+const PROJECT_FIELDS = 'id,name,type,path,parent_id,created_at,updated_at,child_count'
+
 const Projects = () => {
   const { user } = useAuth()
   const navigate = useNavigate()
   const [projects, setProjects] = useState<ProjectFile[]>([])
-  const [allFiles, setAllFiles] = useState<ProjectFile[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [currentProject, setCurrentProject] = useState<ProjectFile | null>(null)
   const [currentFiles, setCurrentFiles] = useState<ProjectFile[]>([])
   const [searchTerm, setSearchTerm] = useState('')
@@ -50,20 +56,32 @@ const Projects = () => {
     loadFiles()
   }, [])
 
+  const fetchProjectsPage = async (cursor?: string | null) => {
+    const response = await api.get('/files', {
+      params: {
+        type: 'project',
+        limit: PROJECTS_PAGE_SIZE,
+        fields: PROJECT_FIELDS,
+        ...(cursor ? { cursor } : {})
+      }
+    })
+    if (!response.data.success) return null
+    return {
+      files: (response.data.data.files || []) as ProjectFile[],
+      nextCursor: (response.data.data.next_cursor || null) as string | null
+    }
+  }
+
   const loadFiles = async () => {
     try {
       setLoading(true)
-      const response = await api.get('/files')
-      if (response.data.success) {
-        const files = response.data.data.files || []
-        setAllFiles(files)
-        
-        // Sadece project tipindeki dosyaları projeler olarak göster
-        const projectsOnly = files.filter((file: ProjectFile) => file.type === 'project')
-        setProjects(projectsOnly)
+      const page = await fetchProjectsPage()
+      if (page) {
+        setProjects(page.files)
+        setNextCursor(page.nextCursor)
         
         if (!currentProject) {
-          setCurrentFiles(projectsOnly)
+          setCurrentFiles(page.files)
         }
       }
     } catch (error) {
@@ -74,14 +92,39 @@ const Projects = () => {
     }
   }
 
-  const openProject = (project: ProjectFile) => {
+  const loadMoreProjects = async () => {
+    if (!nextCursor || loadingMore) return
+    try {
+      setLoadingMore(true)
+      const page = await fetchProjectsPage(nextCursor)
+      if (page) {
+        const merged = [...projects, ...page.files]
+        setProjects(merged)
+        setNextCursor(page.nextCursor)
+        if (!currentProject) {
+          setCurrentFiles(merged)
+        }
+      }
+    } catch (error) {
+      toast.error('Projeler yüklenemedi')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  const openProject = async (project: ProjectFile) => {
     setCurrentProject(project)
     
-    // Bu projeye ait dosyaları bul
-    const projectFiles = allFiles.filter(file => 
-      file.parent_id === project.id || file.id === project.id
-    )
-    setCurrentFiles(projectFiles)
+    // Bu projeye ait dosyaları sadece bu proje için iste
+    try {
+      const response = await api.get('/files', { params: { project_id: project.id } })
+      const projectFiles = (response.data.data?.files || []).filter((file: ProjectFile) =>
+        file.parent_id === project.id || file.id === project.id
+      )
+      setCurrentFiles(projectFiles)
+    } catch (error) {
+      toast.error('Proje dosyaları yüklenemedi')
+    }
   }
 
   const goBackToProjects = () => {
@@ -191,7 +234,7 @@ const Projects = () => {
                 <p className="text-gray-600 dark:text-gray-400">
                   {currentProject 
                     ? `${currentFiles.length - 1} dosya`
-                    : `${user?.username}, ${projects.length} projeniz bulunuyor`
+                    : `${user?.username}, ${projects.length}${nextCursor ? '+' : ''} projeniz bulunuyor`
                   }
                 </p>
               </div>
@@ -312,7 +355,7 @@ const Projects = () => {
                   {file.type === 'project' && (
                     <div className="flex items-center">
                       <File className="h-3 w-3 mr-1" />
-                      {allFiles.filter(f => f.parent_id === file.id).length} dosya
+                      {file.child_count ?? 0} dosya
                     </div>
                   )}
                 </div>
@@ -330,6 +373,14 @@ const Projects = () => {
           ))}
         </motion.div>
 
+        {!currentProject && nextCursor && (
+          <div className="flex justify-center mt-8">
+            <Button variant="outline" onClick={loadMoreProjects} loading={loadingMore}>
+              Daha fazla proje yükle
+            </Button>
+          </div>
+        )}
+
         {/* Empty State */}
         {filteredFiles.length === 0 && !loading && (
           <motion.div
@@ -23,6 +23,9 @@ export interface FileItem {
   path: string
   is_open?: boolean
   language?: string
+  size?: number | null
+  created_at?: string
+  updated_at?: string
 }
 
 export interface EditorContextType {
@@ -30,6 +33,7 @@ export interface EditorContextType {
   activeFile: FileItem | null
   openFiles: FileItem[]
   output: string
+  artifacts: ExecutionArtifact[]
   isRunning: boolean
   currentProject: FileItem | null
   createFile: (name: string, parent_id?: string, content?: string, fileType?: string, language?: string) => void
@@ -45,13 +49,72 @@ export interface EditorContextType {
   refreshEditor: () => Promise<void>
 }
 
+export interface ResourceUsage {
+  user_cpu_time: number | null
+  system_cpu_time: number | null
+  max_rss_bytes: number | null
+  read_bytes: number | null
+  written_bytes: number | null
+  disk_written_bytes: number | null
+  child_processes: number | null
+}
+
+export interface AnimationFrame {
+  t: number
+  x: number
+  y: number
+  data: string
+  width?: number
+  height?: number
+}
+
+export interface ExecutionArtifact {
+  kind: string
+  mime?: string
+  data?: string
+  width?: number
+  height?: number
+  figure?: number
+  spec?: any
+  version?: string
+  window?: string
+  index?: number
+  dropped?: number
+  frames?: AnimationFrame[]
+  duration?: number
+  url?: string
+}
+
 export interface ExecutionResult {
   output: string
   error?: string
   execution_time: number
   success: boolean
+  truncated?: boolean
+  output_bytes?: number
+  error_bytes?: number
+  resources?: ResourceUsage | null
+  artifacts?: ExecutionArtifact[]
+  artifacts_dropped?: number
 }
 
+export type ExecutionEvent =
+  | { type: 'stdout' | 'stderr'; text: string }
+  | { type: 'truncated'; stream: 'stdout' | 'stderr'; omitted_bytes: number }
+  | ({ type: 'artifact' } & ExecutionArtifact)
+  | {
+      type: 'done'
+      success: boolean
+      exit_code: number | null
+      error: string | null
+      execution_time: number
+      truncated: boolean
+      output_bytes: number
+      error_bytes: number
+      resources?: ResourceUsage | null
+      artifacts_dropped?: number
+    }
+
 export interface ThemeContextType {
   theme: 'light' | 'dark' | 'system'
   setTheme: (theme: 'light' | 'dark' | 'system') => void
@@ -1,4 +1,5 @@
 import axios from 'axios'
+import { ExecutionEvent } from '@/types'
 
 const api = axios.create({
   baseURL: '/api',
@@ -28,3 +29,48 @@ api.interceptors.response.use(
 )
 
 export default api
+
+// Kod çalıştırma çıktısını Server-Sent Events olarak oku
+export async function streamExecute(
+  code: string,
+  language: string,
+  onEvent: (event: ExecutionEvent) => void
+): Promise<void> {
+  const response = await fetch('/api/execute/stream', {
+    method: 'POST',
+    credentials: 'include',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ code, language }),
+  })
+
+  if (!response.ok || !response.body) {
+    const body = await response.json().catch(() => null)
+    throw new Error(body?.message || 'Kod çalıştırılamadı')
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+
+    // Olaylar boş satırla ayrılır
+    let boundary = buffer.indexOf('\n\n')
+    while (boundary !== -1) {
+      const rawEvent = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      const data = rawEvent
+        .split('\n')
+        .filter((line) => line.startsWith('data: '))
+        .map((line) => line.slice(6))
+        .join('\n')
+      if (data) {
+        onEvent(JSON.parse(data))
+      }
+      boundary = buffer.indexOf('\n\n')
+    }
+  }
+}